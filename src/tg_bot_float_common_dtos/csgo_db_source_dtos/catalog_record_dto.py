@@ -0,0 +1,21 @@
+from tg_bot_float_common_dtos.base_dto import BaseDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.agents_page_dto import AgentsPageDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.catalog_summary_dto import CatalogSummaryDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.gloves_page_dto import GlovesPageDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.skins_page_dto import SkinsPageDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.weapons_page_dto import WeaponsPageDTO
+
+
+class CatalogRecordDTO(BaseDTO):
+    """One line of the catalog stream.
+
+    A page, the skins page of `weapon` or its error, and the summary as the last line.
+    """
+
+    weapons: WeaponsPageDTO | None = None
+    gloves: GlovesPageDTO | None = None
+    agents: AgentsPageDTO | None = None
+    skins: SkinsPageDTO | None = None
+    weapon: str | None = None
+    error: str | None = None
+    summary: CatalogSummaryDTO | None = None
@@ -0,0 +1,9 @@
+from tg_bot_float_common_dtos.base_dto import BaseDTO
+
+
+class CatalogSummaryDTO(BaseDTO):
+    """Last line of the catalog stream, a stream without it was cut off."""
+
+    done: bool = True
+    weapons: int
+    errors: int
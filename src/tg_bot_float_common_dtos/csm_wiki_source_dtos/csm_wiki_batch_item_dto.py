@@ -0,0 +1,7 @@
+from tg_bot_float_common_dtos.csm_wiki_source_dtos.csm_wiki_dto import CsmWikiDTO
+from tg_bot_float_common_dtos.csm_wiki_source_dtos.csm_wiki_skin_dto import CsmWikiSkinDTO
+
+
+class CsmWikiBatchItemDTO(CsmWikiSkinDTO):
+    csm_wiki: CsmWikiDTO | None = None
+    error: str | None = None
@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+
+class CsmWikiSkinDTO(BaseModel):
+    weapon: str
+    skin: str
@@ -0,0 +1,13 @@
+from tg_bot_float_common_dtos.base_dto import BaseDTO
+from tg_bot_float_common_dtos.steam_source_dtos.steam_item_dto import SteamItemDTO
+
+
+class SteamItemRecordDTO(BaseDTO):
+    """One line of the steam items stream.
+
+    A matching listing, or the error of a listing whose float could not be looked up.
+    """
+
+    item: SteamItemDTO | None = None
+    buy_link: str | None = None
+    error: str | None = None
@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+from tg_bot_float_common_dtos.update_db_scheduler_dtos.source_data_names_dto import (
+    SourceDataNamesDTO,
+)
+
+
+class SourceDataDeltaDTO(BaseModel):
+    base_hash: str
+    target_hash: str
+    added: SourceDataNamesDTO
+    removed: SourceDataNamesDTO
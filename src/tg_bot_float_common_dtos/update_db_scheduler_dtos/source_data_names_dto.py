@@ -0,0 +1,14 @@
+from typing import List, Tuple
+
+from pydantic import BaseModel
+
+
+class SourceDataNamesDTO(BaseModel):
+    weapons: List[str] = []
+    skins: List[str] = []
+    qualities: List[str] = []
+    gloves: List[str] = []
+    agents: List[str] = []
+    relations: List[Tuple[str, str, str, bool]] = []  # (weapon, skin, quality, stattrak_existence)
+    glove_relations: List[Tuple[str, str]] = []  # (glove, skin)
+    agent_relations: List[Tuple[str, str]] = []  # (agent, skin)
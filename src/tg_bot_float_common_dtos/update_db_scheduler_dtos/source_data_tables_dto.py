@@ -0,0 +1,19 @@
+from typing import List, Tuple
+
+from pydantic import BaseModel
+
+
+class SourceDataTablesDTO(BaseModel):
+    """Columnar form of SourceDataTreeDTO.
+
+    Relations reference names by their index in the name tables.
+    """
+
+    weapons: List[str] = []
+    skins: List[str] = []
+    qualities: List[str] = []
+    gloves: List[str] = []
+    agents: List[str] = []
+    relations: List[Tuple[int, int, int, bool]] = []  # (weapon, skin, quality, stattrak_existence)
+    glove_relations: List[Tuple[int, int]] = []  # (glove, skin)
+    agent_relations: List[Tuple[int, int]] = []  # (agent, skin)
@@ -1,3 +1,4 @@
 class CsgoDbException(Exception):
     def __init__(self, message: str):
+        super().__init__(message)
         self.message = message
@@ -0,0 +1,27 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from tg_bot_float_csgo_db_source.dependencies.page_services import (
+    AGENTS_PAGE_SERVICE,
+    GLOVES_PAGE_SERVICE,
+    SKINS_PAGE_SERVICE,
+    WEAPON_PAGE_SERVICE,
+)
+from tg_bot_float_csgo_db_source.dependencies.settings import REQUEST_SETTINGS
+from tg_bot_float_csgo_db_source.services.catalog_service import CatalogService
+
+
+async def get_catalog_service(
+    settings: REQUEST_SETTINGS,
+    weapons_page_service: WEAPON_PAGE_SERVICE,
+    skins_page_service: SKINS_PAGE_SERVICE,
+    gloves_page_service: GLOVES_PAGE_SERVICE,
+    agents_page_service: AGENTS_PAGE_SERVICE,
+) -> CatalogService:
+    return CatalogService(
+        settings, weapons_page_service, skins_page_service, gloves_page_service, agents_page_service
+    )
+
+
+CATALOG_SERVICE = Annotated[CatalogService, Depends(get_catalog_service)]
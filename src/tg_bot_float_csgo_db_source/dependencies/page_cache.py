@@ -0,0 +1,15 @@
+from typing import Annotated
+from functools import lru_cache
+
+from fastapi import Depends
+
+from tg_bot_float_csgo_db_source.dependencies.settings import get_request_settings
+from tg_bot_float_csgo_db_source.services.parsed_page_cache import ParsedPageCache
+
+
+@lru_cache
+def get_parsed_page_cache() -> ParsedPageCache:
+    return ParsedPageCache(get_request_settings())
+
+
+PARSED_PAGE_CACHE = Annotated[ParsedPageCache, Depends(get_parsed_page_cache)]
@@ -12,6 +12,8 @@ from tg_bot_float_common_dtos.csgo_db_source_dtos.gloves_page_dto import GlovesP
 
 from tg_bot_float_common_dtos.csgo_db_source_dtos.skins_page_dto import SkinsPageDTO
 from tg_bot_float_common_dtos.csgo_db_source_dtos.weapons_page_dto import WeaponsPageDTO
+from tg_bot_float_csgo_db_source.dependencies.page_cache import PARSED_PAGE_CACHE
+from tg_bot_float_csgo_db_source.dependencies.parse_executor import PARSE_EXECUTOR
 from tg_bot_float_csgo_db_source.dependencies.parsers import (
     ADDITIONAL_INFO_PARSER,
     AGENTS_PARSER,
@@ -27,34 +29,48 @@ from tg_bot_float_csgo_db_source.services.csgo_db_source_service import CsgoDbSo
 
 
 async def get_weapon_page_service(
-    response_service: CSGO_DB_SOURCE_RESPONSE_SERVICE, parser: WEAPONS_PARSER
+    response_service: CSGO_DB_SOURCE_RESPONSE_SERVICE,
+    parser: WEAPONS_PARSER,
+    parse_executor: PARSE_EXECUTOR,
+    page_cache: PARSED_PAGE_CACHE,
 ) -> CsgoDbSourceService[WeaponsPageDTO]:
-    return CsgoDbSourceService(response_service, parser)
+    return CsgoDbSourceService(response_service, parser, parse_executor, page_cache)
 
 
 async def get_skins_page_service(
-    response_service: CSGO_DB_SOURCE_RESPONSE_SERVICE, parser: SKINS_PARSER
+    response_service: CSGO_DB_SOURCE_RESPONSE_SERVICE,
+    parser: SKINS_PARSER,
+    parse_executor: PARSE_EXECUTOR,
+    page_cache: PARSED_PAGE_CACHE,
 ) -> CsgoDbSourceService[SkinsPageDTO]:
-    return CsgoDbSourceService(response_service, parser)
+    return CsgoDbSourceService(response_service, parser, parse_executor, page_cache)
 
 
 async def get_additional_info_page_service(
     response_service: CSGO_DB_SOURCE_RESPONSE_SERVICE,
     additional_info_parser: ADDITIONAL_INFO_PARSER,
+    parse_executor: PARSE_EXECUTOR,
+    page_cache: PARSED_PAGE_CACHE,
 ) -> CsgoDbSourceService[AdditionalInfoPageDTO]:
-    return CsgoDbSourceService(response_service, additional_info_parser)
+    return CsgoDbSourceService(response_service, additional_info_parser, parse_executor, page_cache)
 
 
 async def get_gloves_page_service(
-    response_service: CSGO_DB_SOURCE_RESPONSE_SERVICE, parser: GLOVES_PARSER
+    response_service: CSGO_DB_SOURCE_RESPONSE_SERVICE,
+    parser: GLOVES_PARSER,
+    parse_executor: PARSE_EXECUTOR,
+    page_cache: PARSED_PAGE_CACHE,
 ) -> CsgoDbSourceService[GlovesPageDTO]:
-    return CsgoDbSourceService(response_service, parser)
+    return CsgoDbSourceService(response_service, parser, parse_executor, page_cache)
 
 
 async def get_agents_page_service(
-    response_service: CSGO_DB_SOURCE_RESPONSE_SERVICE, parser: AGENTS_PARSER
+    response_service: CSGO_DB_SOURCE_RESPONSE_SERVICE,
+    parser: AGENTS_PARSER,
+    parse_executor: PARSE_EXECUTOR,
+    page_cache: PARSED_PAGE_CACHE,
 ) -> CsgoDbSourceService[AgentsPageDTO]:
-    return CsgoDbSourceService(response_service, parser)
+    return CsgoDbSourceService(response_service, parser, parse_executor, page_cache)
 
 
 WEAPON_PAGE_SERVICE = Annotated[
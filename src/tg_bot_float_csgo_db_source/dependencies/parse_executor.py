@@ -0,0 +1,15 @@
+from typing import Annotated
+from functools import lru_cache
+
+from fastapi import Depends
+
+from tg_bot_float_csgo_db_source.dependencies.settings import get_scrapper_settings
+from tg_bot_float_csgo_db_source.services.parse_executor import ParseExecutor
+
+
+@lru_cache
+def get_parse_executor() -> ParseExecutor:
+    return ParseExecutor(get_scrapper_settings())
+
+
+PARSE_EXECUTOR = Annotated[ParseExecutor, Depends(get_parse_executor)]
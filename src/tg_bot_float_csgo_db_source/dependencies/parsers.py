@@ -1,8 +1,9 @@
 from typing import Annotated
+from functools import lru_cache
 
 from fastapi import Depends
 
-from tg_bot_float_csgo_db_source.dependencies.settings import PARSER_SETTINGS
+from tg_bot_float_csgo_db_source.dependencies.settings import get_scrapper_settings
 from tg_bot_float_csgo_db_source.parsers.additional_info_parser import AdditionalInfoParser
 from tg_bot_float_csgo_db_source.parsers.agents_parser import AgentsParser
 from tg_bot_float_csgo_db_source.parsers.gloves_parser import GlovesParser
@@ -10,26 +11,40 @@ from tg_bot_float_csgo_db_source.parsers.skins_parser import SkinsParser
 from tg_bot_float_csgo_db_source.parsers.weapons_parser import WeaponsParser
 
 
-def get_weapons_parser(parser_settings: PARSER_SETTINGS) -> WeaponsParser:
-    return WeaponsParser(parser_settings)
+@lru_cache
+def get_weapons_parser() -> WeaponsParser:
+    return WeaponsParser(get_scrapper_settings())
 
 
-def get_skins_parser(parser_settings: PARSER_SETTINGS) -> SkinsParser:
-    return SkinsParser(parser_settings)
+@lru_cache
+def get_skins_parser() -> SkinsParser:
+    return SkinsParser(get_scrapper_settings())
 
 
-def get_additional_info_parser(parser_settings: PARSER_SETTINGS) -> AdditionalInfoParser:
-    return AdditionalInfoParser(parser_settings)
+@lru_cache
+def get_additional_info_parser() -> AdditionalInfoParser:
+    return AdditionalInfoParser(get_scrapper_settings())
 
 
-def get_gloves_parser(parser_settings: PARSER_SETTINGS) -> GlovesParser:
-    return GlovesParser(parser_settings)
+@lru_cache
+def get_gloves_parser() -> GlovesParser:
+    return GlovesParser(get_scrapper_settings())
 
 
-def get_agents_parser(parser_settings: PARSER_SETTINGS) -> AgentsParser:
-    return AgentsParser(parser_settings)
+@lru_cache
+def get_agents_parser() -> AgentsParser:
+    return AgentsParser(get_scrapper_settings())
 
 
+# Built in the app lifespan, so patterns are compiled before the first request
+PARSER_GETTERS = (
+    get_weapons_parser,
+    get_skins_parser,
+    get_additional_info_parser,
+    get_gloves_parser,
+    get_agents_parser,
+)
+
 WEAPONS_PARSER = Annotated[WeaponsParser, Depends(get_weapons_parser)]
 
 SKINS_PARSER = Annotated[SkinsParser, Depends(get_skins_parser)]
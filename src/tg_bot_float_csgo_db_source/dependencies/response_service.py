@@ -1,14 +1,28 @@
-from typing import Annotated, AsyncIterable
+from typing import Annotated
+from functools import lru_cache
 
 from fastapi import Depends
+from tg_bot_float_csgo_db_source.dependencies.settings import get_request_settings
 from tg_bot_float_csgo_db_source.response_service.csgo_db_response_service import (
     CsgoDbSourceResponseService,
 )
+from tg_bot_float_misc.curl_session_pool.curl_session_pool import CurlSessionPool
 
 
-async def get_csgo_db_source_response_service() -> AsyncIterable[CsgoDbSourceResponseService]:
-    async with CsgoDbSourceResponseService() as service:
-        yield service
+@lru_cache
+def get_session_pool() -> CurlSessionPool:
+    settings = get_request_settings()
+    return CurlSessionPool(
+        settings.session_max_clients,
+        impersonate_targets=[
+            target.strip() for target in settings.impersonate_targets.split(",") if target.strip()
+        ],
+    )
+
+
+@lru_cache
+def get_csgo_db_source_response_service() -> CsgoDbSourceResponseService:
+    return CsgoDbSourceResponseService(get_session_pool())
 
 
 CSGO_DB_SOURCE_RESPONSE_SERVICE = Annotated[
@@ -18,4 +18,3 @@ def get_scrapper_settings():
 
 
 REQUEST_SETTINGS = Annotated[RequestSettings, Depends(get_request_settings)]
-PARSER_SETTINGS = Annotated[ParserSettings, Depends(get_scrapper_settings)]
@@ -0,0 +1,11 @@
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class CachedPageDTO(BaseModel):
+    page_dto: Any
+    etag: str | None = None
+    last_modified: str | None = None
+    content_hash: str
+    expires_at: float
@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class PageResponseDTO(BaseModel):
+    html: str = ""
+    etag: str | None = None
+    last_modified: str | None = None
+    not_modified: bool = False
@@ -1,6 +1,15 @@
-from typing import List
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
 from fastapi import FastAPI
 
+from tg_bot_float_csgo_db_source.dependencies.parse_executor import get_parse_executor
+from tg_bot_float_csgo_db_source.dependencies.parsers import PARSER_GETTERS
+from tg_bot_float_csgo_db_source.dependencies.response_service import (
+    get_csgo_db_source_response_service,
+    get_session_pool,
+)
+from tg_bot_float_csgo_db_source.dependencies.settings import get_request_settings
 from tg_bot_float_csgo_db_source.router_controllers.csdb_router_controller import (
     CsgoDBRouterController,
 )
@@ -9,9 +18,24 @@ from tg_bot_float_csgo_db_source.middlewares.error_handling_middleware import (
 )
 from tg_bot_float_misc.router_controller.abstract_router_controller import AbstractRouterController
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    for get_parser in PARSER_GETTERS:
+        get_parser()
+    request_settings = get_request_settings()
+    async with get_parse_executor() as parse_executor, get_session_pool():
+        if request_settings.warm_up:
+            await asyncio.gather(
+                parse_executor.warm_up(),
+                get_csgo_db_source_response_service().warm_up(request_settings.base_domen),
+            )
+        yield
+
+
 router_controllers: List[AbstractRouterController] = [CsgoDBRouterController()]
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 app.add_middleware(ErrorHandlingMiddleware)
 
 for controller in router_controllers:
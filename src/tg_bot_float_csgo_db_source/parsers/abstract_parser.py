@@ -1,7 +1,7 @@
 import abc
-import re
 from typing import Generator, Generic, TypeVar
 
+from tg_bot_float_csgo_db_source.parsers.page_scanner import PAGE_MATCHES
 from tg_bot_float_csgo_db_source.settings.parser_settings import ParserSettings
 
 T = TypeVar("T")
@@ -15,13 +15,13 @@ class AbstractParser(abc.ABC, Generic[T]):
     def get_parsed_data(self, page_html: str) -> T:
         pass
 
-    def _extract_regex(self, pattern: re.Pattern[str], page_html: str) -> str | None:
-        if (match := pattern.search(page_html)) is not None:
-            return match.group(1)
+    def _extract_first(self, page_matches: PAGE_MATCHES, name: str) -> str | None:
+        if page_matches[name]:
+            return page_matches[name][0][0]
         return None
 
     def _get_iter_info(
-        self, pattern: re.Pattern[str], response_text: str
+        self, page_matches: PAGE_MATCHES, name: str
     ) -> Generator[str, None, None]:
-        for match in pattern.finditer(response_text):
-            yield match.group(1)
+        for groups in page_matches[name]:
+            yield groups[0]  # type: ignore
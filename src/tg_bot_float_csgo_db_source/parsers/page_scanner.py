@@ -0,0 +1,75 @@
+import re
+from typing import Dict, List, Tuple
+
+PAGE_MATCHES = Dict[str, List[Tuple[str | None, ...]]]
+
+TAG_NAME_REGEX = re.compile(r"<([A-Za-z][A-Za-z0-9]*)([?*+{]?)")
+
+
+class PageScanner:
+    """Extracts the matches of several tag patterns in one pass over a page.
+
+    Every pattern must start with "<" and a literal tag name. The patterns are joined into one
+    lookahead alternation behind that shared "<", so the page is searched once for tag starts and
+    at each tag only the pattern of that tag goes on matching. The lookahead consumes nothing:
+    a match of one pattern may span the tags of the others, and they are still found. Matches of
+    one pattern do not overlap each other, as with a separate finditer per pattern.
+
+    At a given tag only the first matching alternative is tried to the end, so two patterns
+    must never match at the same position: tag names of which one is a prefix of the other are
+    rejected. A single pattern is compiled as it is, keeping the literal prefix search.
+    """
+
+    def __init__(self, patterns: Dict[str, str]) -> None:
+        self._names = list(patterns)
+        # Index of the group wrapping a pattern -> (name, slice of the pattern's own groups)
+        self._fields: Dict[int, Tuple[str, slice]] = {}
+        alternatives: List[str] = []
+        tag_names: Dict[str, str] = {}
+        group_index = 0
+        for name, pattern in patterns.items():
+            tag_name = self._get_tag_name(name, pattern)
+            for other_name, other_tag_name in tag_names.items():
+                if tag_name.startswith(other_tag_name) or other_tag_name.startswith(tag_name):
+                    raise ValueError(
+                        f"Patterns {other_name!r} and {name!r} may match the same tag!"
+                    )
+            tag_names[name] = tag_name
+            inner_groups = re.compile(pattern).groups
+            self._fields[group_index + 1] = (
+                name,
+                slice(group_index + 1, group_index + 1 + inner_groups),
+            )
+            alternatives.append(f"({pattern[1:]})")
+            group_index += 1 + inner_groups
+        if len(patterns) == 1:
+            self._regex = re.compile(next(iter(patterns.values())))
+        else:
+            self._regex = re.compile("<(?=" + "|".join(alternatives) + ")")
+
+    def scan(self, page_html: str) -> PAGE_MATCHES:
+        """Groups of every match by pattern name, in document order."""
+        page_matches: PAGE_MATCHES = {name: [] for name in self._names}
+        if len(self._names) == 1:
+            page_matches[self._names[0]] = [
+                match.groups() for match in self._regex.finditer(page_html)
+            ]
+            return page_matches
+        # End of the last match of every pattern, the "<" it starts with included
+        match_ends = dict.fromkeys(self._names, 0)
+        for match in self._regex.finditer(page_html):
+            name, groups = self._fields[match.lastindex]  # type: ignore
+            if match.start() < match_ends[name]:
+                continue
+            match_ends[name] = match.end(match.lastindex)  # type: ignore
+            page_matches[name].append(match.groups()[groups])
+        return page_matches
+
+    @staticmethod
+    def _get_tag_name(name: str, pattern: str) -> str:
+        tag_match = TAG_NAME_REGEX.match(pattern)
+        if tag_match is None:
+            raise ValueError(f"Pattern {name!r} must start with '<' and a tag name!")
+        tag_name, quantifier = tag_match.groups()
+        # A quantifier applies to the last character only, the rest of the name stays literal
+        return tag_name[:-1] if quantifier else tag_name
@@ -1,5 +1,4 @@
 from typing import List
-import re
 from itertools import islice
 from collections import Counter
 
@@ -7,17 +6,22 @@ from tg_bot_float_common_dtos.csgo_db_source_dtos.skin_dto import WeaponSkinsDTO
 from tg_bot_float_common_dtos.csgo_db_source_dtos.skins_page_dto import SkinsPageDTO
 from tg_bot_float_csgo_db_source.csgo_db_exception import CsgoDbException
 from tg_bot_float_csgo_db_source.parsers.abstract_parser import AbstractParser
+from tg_bot_float_csgo_db_source.parsers.page_scanner import PAGE_MATCHES, PageScanner
 from tg_bot_float_csgo_db_source.settings.parser_settings import ParserSettings
 
 
 class SkinsParser(AbstractParser[SkinsPageDTO]):
     def __init__(self, settings: ParserSettings) -> None:
-        self._skin_name_regex = re.compile(settings.skin_name_regex)
-        self._skin_weapon_name_regex = re.compile(settings.skin_weapon_name_regex)
-        self._skin_rarity_regex = re.compile(settings.skin_rarity_regex)
+        self._page_scanner = PageScanner(
+            {
+                "skin_name": settings.skin_name_regex,
+                "skin_weapon_name": settings.skin_weapon_name_regex,
+                "skin_rarity": settings.skin_rarity_regex,
+            }
+        )
 
-    def _get_correct_weapon_name(self, page_html: str) -> str:
-        if weapon_name := self._extract_regex(self._skin_weapon_name_regex, page_html):
+    def _get_correct_weapon_name(self, page_matches: PAGE_MATCHES) -> str:
+        if weapon_name := self._extract_first(page_matches, "skin_weapon_name"):
             return weapon_name
         raise CsgoDbException("Weapon not found in HTML")
 
@@ -25,21 +29,21 @@ class SkinsParser(AbstractParser[SkinsPageDTO]):
         if page_html == "":
             raise CsgoDbException("No skins found!")
 
-        skin_dtos = self._get_skin_dtos(page_html)
+        skin_dtos = self._get_skin_dtos(self._page_scanner.scan(page_html))
         return SkinsPageDTO(
             weapon_name=skin_dtos[0].weapon_name,
             skins=skin_dtos,
             count=sum(map(lambda dto: dto.count, skin_dtos)),
         )
 
-    def _get_skin_dtos(self, page_html: str) -> List[WeaponSkinsDTO]:
+    def _get_skin_dtos(self, page_matches: PAGE_MATCHES) -> List[WeaponSkinsDTO]:
         weapon_skins_dtos: List[WeaponSkinsDTO] = []
 
-        skin_names_gen = self._get_iter_info(self._skin_name_regex, page_html)
+        skin_names_gen = self._get_iter_info(page_matches, "skin_name")
 
-        rarity_counter: Counter[str] = self._count_rarity(page_html)
+        rarity_counter: Counter[str] = Counter(self._get_iter_info(page_matches, "skin_rarity"))
 
-        correct_weapon_name = self._get_correct_weapon_name(page_html)
+        correct_weapon_name = self._get_correct_weapon_name(page_matches)
 
         for rarity, count in rarity_counter.items():
             names_chunk = list(islice(skin_names_gen, count))
@@ -58,6 +62,3 @@ class SkinsParser(AbstractParser[SkinsPageDTO]):
             weapon_skins_dtos.append(weapon_skin_dto)
 
         return weapon_skins_dtos
-
-    def _count_rarity(self, response_text: str) -> Counter[str]:
-        return Counter(match.group(1) for match in self._skin_rarity_regex.finditer(response_text))
@@ -8,12 +8,17 @@ from tg_bot_float_common_dtos.csgo_db_source_dtos.weapons_page_dto import Weapon
 from tg_bot_float_csgo_db_source.csgo_db_exception import CsgoDbException
 from tg_bot_float_csgo_db_source.settings.parser_settings import ParserSettings
 from tg_bot_float_csgo_db_source.parsers.abstract_parser import AbstractParser
+from tg_bot_float_csgo_db_source.parsers.page_scanner import PAGE_MATCHES, PageScanner
 
 
 class WeaponsParser(AbstractParser[WeaponsPageDTO]):
     def __init__(self, settings: ParserSettings) -> None:
-        self._total_weapon_regex = re.compile(settings.total_weapon_regex)
-        self._weapon_name_regex = re.compile(settings.weapon_name_regex)
+        self._page_scanner = PageScanner(
+            {
+                "total_weapon": settings.total_weapon_regex,
+                "weapon_name": settings.weapon_name_regex,
+            }
+        )
         self._weapon_category_number_regex = re.compile(settings.weapon_category_number_regex)
         self._tags_regex = re.compile(r"<[^>]+>")
 
@@ -21,17 +26,17 @@ class WeaponsParser(AbstractParser[WeaponsPageDTO]):
         if page_html == "":
             raise CsgoDbException("No weapons found!")
 
-        weapon_dtos = self._get_weapon_dtos(page_html)
+        weapon_dtos = self._get_weapon_dtos(self._page_scanner.scan(page_html))
         return WeaponsPageDTO(
             categories=weapon_dtos, count=sum(map(lambda dto: dto.count, weapon_dtos))
         )
 
-    def _get_weapon_dtos(self, page_html: str) -> List[CategoryWeaponsDTO]:
+    def _get_weapon_dtos(self, page_matches: PAGE_MATCHES) -> List[CategoryWeaponsDTO]:
         weapon_dtos: List[CategoryWeaponsDTO] = []
 
-        weapon_names_gen = self._get_iter_info(self._weapon_name_regex, page_html)
+        weapon_names_gen = self._get_iter_info(page_matches, "weapon_name")
 
-        for dto in self._get_weapon_dtos_without_names(page_html):
+        for dto in self._get_weapon_dtos_without_names(page_matches):
             names_chunk = list(islice(weapon_names_gen, dto.count))
             dto.weapons = names_chunk
 
@@ -55,13 +60,13 @@ class WeaponsParser(AbstractParser[WeaponsPageDTO]):
         return weapon_dtos
 
     def _get_weapon_dtos_without_names(
-        self, response_text: str
+        self, page_matches: PAGE_MATCHES
     ) -> Generator[CategoryWeaponsDTO, None, None]:
-        total_weapon_text = self._total_weapon_regex.search(response_text)
+        total_weapon_text = self._extract_first(page_matches, "total_weapon")
 
         if total_weapon_text:
 
-            text_without_tags = self._tags_regex.sub("", total_weapon_text.group(0))
+            text_without_tags = self._tags_regex.sub("", total_weapon_text)
 
             category_number_items = self._weapon_category_number_regex.findall(text_without_tags)
 
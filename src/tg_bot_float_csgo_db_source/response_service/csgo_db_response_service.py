@@ -1,14 +1,44 @@
 from http import HTTPStatus
+from typing import Dict
 
+from curl_cffi import CurlError
 from curl_cffi.requests import AsyncSession
 from curl_cffi.requests.models import Response
 from tg_bot_float_csgo_db_source.csgo_db_exception import CsgoDbException
+from tg_bot_float_csgo_db_source.dtos.page_response_dto import PageResponseDTO
 from tg_bot_float_misc.response_service.abstract_response_service import AbstractResponseService
 
 
 class CsgoDbSourceResponseService(AbstractResponseService):
-    async def _get_response(self, url: str, session: AsyncSession) -> Response:
-        response = await super()._get_response(url, session)
+    async def get_page(
+        self, url: str, etag: str | None = None, last_modified: str | None = None
+    ) -> PageResponseDTO:
+        """Conditional GET of a page: `not_modified` is set when upstream answered 304."""
+        headers: Dict[str, str] = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        response = await self.get_page_response(url, headers)
+        return PageResponseDTO(
+            html="" if response.status_code == HTTPStatus.NOT_MODIFIED else response.text,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            not_modified=response.status_code == HTTPStatus.NOT_MODIFIED,
+        )
+
+    async def warm_up(self, url: str) -> None:
+        """Open the TLS connection to upstream before the first request needs it."""
+        try:
+            await self.get_page_response(url)
+        except (CurlError, CsgoDbException):
+            # Upstream is not reachable yet, the first request will connect on its own
+            pass
+
+    async def _get_response(
+        self, url: str, session: AsyncSession, headers: Dict[str, str] | None = None
+    ) -> Response:
+        response = await super()._get_response(url, session, headers)
         if response.status_code == HTTPStatus.NOT_FOUND:
             raise CsgoDbException("Item with this name not found!")
         return response
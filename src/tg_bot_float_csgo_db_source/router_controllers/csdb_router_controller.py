@@ -1,12 +1,17 @@
+from typing import AsyncIterator
+
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
 
 from tg_bot_float_common_dtos.csgo_db_source_dtos.additional_info_page_dto import (
     AdditionalInfoPageDTO,
 )
 from tg_bot_float_common_dtos.csgo_db_source_dtos.agents_page_dto import AgentsPageDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.catalog_record_dto import CatalogRecordDTO
 from tg_bot_float_common_dtos.csgo_db_source_dtos.gloves_page_dto import GlovesPageDTO
 from tg_bot_float_common_dtos.csgo_db_source_dtos.skins_page_dto import SkinsPageDTO
 from tg_bot_float_common_dtos.csgo_db_source_dtos.weapons_page_dto import WeaponsPageDTO
+from tg_bot_float_csgo_db_source.dependencies.catalog_service import CATALOG_SERVICE
 from tg_bot_float_csgo_db_source.dependencies.page_services import (
     ADDITIONAL_INFO_PAGE_SERVICE,
     AGENTS_PAGE_SERVICE,
@@ -19,6 +24,8 @@ from tg_bot_float_misc.router_controller.abstract_router_controller import Abstr
 
 
 class CsgoDBRouterController(AbstractRouterController):
+    _ndjson_media_type = "application/x-ndjson"
+
     def __init__(self) -> None:
         self._router = APIRouter()
         super().__init__()
@@ -27,6 +34,12 @@ class CsgoDBRouterController(AbstractRouterController):
         self._router.add_api_route(
             "/weapons", self._get_weapons_page, methods=["GET"], response_model=WeaponsPageDTO
         )
+        self._router.add_api_route(
+            "/catalog",
+            self._stream_catalog,
+            methods=["GET"],
+            response_class=StreamingResponse,
+        )
         self._router.add_api_route(
             "/{weapon}/skins",
             self._get_skins_page,
@@ -55,15 +68,12 @@ class CsgoDBRouterController(AbstractRouterController):
     async def _get_weapons_page(
         self, service: WEAPON_PAGE_SERVICE, req_settings: REQUEST_SETTINGS
     ) -> WeaponsPageDTO:
-        return await service.get_page(req_settings.base_domen + req_settings.weapons_path_url)
+        return await service.get_page(req_settings.get_weapons_url())
 
     async def _get_skins_page(
         self, weapon: str, service: SKINS_PAGE_SERVICE, req_settings: REQUEST_SETTINGS
     ) -> SkinsPageDTO:
-        url = req_settings.base_domen + req_settings.skins_path_url.format(
-            weapon=weapon.lower().replace("★ ", "").replace(" ", "-")
-        )
-        return await service.get_page(url)
+        return await service.get_page(req_settings.get_skins_url(weapon))
 
     async def _get_additional_info_page(
         self,
@@ -72,20 +82,26 @@ class CsgoDBRouterController(AbstractRouterController):
         service: ADDITIONAL_INFO_PAGE_SERVICE,
         req_settings: REQUEST_SETTINGS,
     ) -> AdditionalInfoPageDTO:
-        return await service.get_page(
-            req_settings.base_domen
-            + req_settings.additional_info_path_url.format(
-                name=weapon.lower().replace(" ", "-"),
-                skin=skin.lower().replace(" ", "-"),
-            )
-        )
+        return await service.get_page(req_settings.get_additional_info_url(weapon, skin))
 
     async def _get_gloves_page(
         self, service: GLOVES_PAGE_SERVICE, req_settings: REQUEST_SETTINGS
     ) -> GlovesPageDTO:
-        return await service.get_page(req_settings.base_domen + req_settings.gloves_path_url)
+        return await service.get_page(req_settings.get_gloves_url())
 
     async def _get_agents_page(
         self, service: AGENTS_PAGE_SERVICE, req_settings: REQUEST_SETTINGS
     ) -> AgentsPageDTO:
-        return await service.get_page(req_settings.base_domen + req_settings.agents_path_url)
+        return await service.get_page(req_settings.get_agents_url())
+
+    async def _stream_catalog(self, service: CATALOG_SERVICE) -> StreamingResponse:
+        """NDJSON: one CatalogRecordDTO per line, fields that are not set are left out."""
+        catalog_records = await service.stream_catalog()
+        return StreamingResponse(
+            self._to_ndjson(catalog_records), media_type=self._ndjson_media_type
+        )
+
+    @staticmethod
+    async def _to_ndjson(catalog_records: AsyncIterator[CatalogRecordDTO]) -> AsyncIterator[str]:
+        async for catalog_record in catalog_records:
+            yield catalog_record.model_dump_json(exclude_none=True) + "\n"
@@ -0,0 +1,81 @@
+import asyncio
+from typing import AsyncGenerator, AsyncIterator
+
+from tg_bot_float_common_dtos.csgo_db_source_dtos.agents_page_dto import AgentsPageDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.catalog_record_dto import CatalogRecordDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.catalog_summary_dto import CatalogSummaryDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.gloves_page_dto import GlovesPageDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.skins_page_dto import SkinsPageDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.weapons_page_dto import WeaponsPageDTO
+from tg_bot_float_csgo_db_source.services.csgo_db_source_service import CsgoDbSourceService
+from tg_bot_float_csgo_db_source.settings.request_settings import RequestSettings
+
+
+class CatalogService:
+    def __init__(
+        self,
+        settings: RequestSettings,
+        weapons_page_service: CsgoDbSourceService[WeaponsPageDTO],
+        skins_page_service: CsgoDbSourceService[SkinsPageDTO],
+        gloves_page_service: CsgoDbSourceService[GlovesPageDTO],
+        agents_page_service: CsgoDbSourceService[AgentsPageDTO],
+    ) -> None:
+        self._settings = settings
+        self._weapons_page_service = weapons_page_service
+        self._skins_page_service = skins_page_service
+        self._gloves_page_service = gloves_page_service
+        self._agents_page_service = agents_page_service
+
+    async def stream_catalog(self) -> AsyncIterator[CatalogRecordDTO]:
+        """Yield the weapons, gloves and agents pages, then the skins page of every weapon.
+
+        The first three pages are requested before returning, so their errors are raised here and
+        not in the middle of a started stream. Skins pages are requested `catalog_concurrency` at
+        a time and yielded as they complete; a failed one is yielded as an error record. The
+        summary record comes last, so a client can tell a complete stream from a cut off one.
+        """
+        weapons_page, gloves_page, agents_page = await asyncio.gather(
+            self._weapons_page_service.get_page(self._settings.get_weapons_url()),
+            self._gloves_page_service.get_page(self._settings.get_gloves_url()),
+            self._agents_page_service.get_page(self._settings.get_agents_url()),
+        )
+        return self._iter_catalog(weapons_page, gloves_page, agents_page)
+
+    async def _iter_catalog(
+        self, weapons_page: WeaponsPageDTO, gloves_page: GlovesPageDTO, agents_page: AgentsPageDTO
+    ) -> AsyncGenerator[CatalogRecordDTO, None]:
+        yield CatalogRecordDTO(weapons=weapons_page)
+        yield CatalogRecordDTO(gloves=gloves_page)
+        yield CatalogRecordDTO(agents=agents_page)
+
+        semaphore = asyncio.Semaphore(self._settings.catalog_concurrency)
+        tasks = [
+            asyncio.create_task(self._get_skins_record(semaphore, weapon))
+            for category in weapons_page.categories
+            for weapon in category.weapons
+        ]
+        errors = 0
+        try:
+            for next_completed in asyncio.as_completed(tasks):
+                skins_record = await next_completed
+                if skins_record.error is not None:
+                    errors += 1
+                yield skins_record
+        finally:
+            # The client went away or the stream failed, nobody waits for the rest
+            for task in tasks:
+                task.cancel()
+        yield CatalogRecordDTO(summary=CatalogSummaryDTO(weapons=len(tasks), errors=errors))
+
+    async def _get_skins_record(
+        self, semaphore: asyncio.Semaphore, weapon: str
+    ) -> CatalogRecordDTO:
+        async with semaphore:
+            try:
+                skins_page = await self._skins_page_service.get_page(
+                    self._settings.get_skins_url(weapon)
+                )
+            except Exception as exc:
+                # Any failure of one weapon must not end the stream for the others
+                return CatalogRecordDTO(weapon=weapon, error=str(exc) or type(exc).__name__)
+        return CatalogRecordDTO(weapon=weapon, skins=skins_page)
@@ -1,6 +1,8 @@
 from typing import Generic
 
 from tg_bot_float_csgo_db_source.parsers.abstract_parser import T, AbstractParser
+from tg_bot_float_csgo_db_source.services.parse_executor import ParseExecutor
+from tg_bot_float_csgo_db_source.services.parsed_page_cache import ParsedPageCache
 from tg_bot_float_csgo_db_source.response_service.csgo_db_response_service import (
     CsgoDbSourceResponseService,
 )
@@ -8,11 +10,36 @@ from tg_bot_float_csgo_db_source.response_service.csgo_db_response_service impor
 
 class CsgoDbSourceService(Generic[T]):
     def __init__(
-        self, response_service: CsgoDbSourceResponseService, parser: AbstractParser[T]
+        self,
+        response_service: CsgoDbSourceResponseService,
+        parser: AbstractParser[T],
+        parse_executor: ParseExecutor,
+        page_cache: ParsedPageCache,
     ) -> None:
         self._response_service = response_service
         self._parser = parser
+        self._parse_executor = parse_executor
+        self._page_cache = page_cache
 
     async def get_page(self, url: str) -> T:
-        page_html = await self._response_service.get_page_html(url)
-        return self._parser.get_parsed_data(page_html)
+        """Parsed page, from the cache while it is fresh or upstream confirms it unchanged."""
+        cached_page = self._page_cache.get(url)
+        if cached_page is not None and self._page_cache.is_fresh(cached_page):
+            return cached_page.page_dto
+
+        return await self._page_cache.load_once(url, lambda: self._load_page(url))
+
+    async def _load_page(self, url: str) -> T:
+        cached_page = self._page_cache.get(url)
+        page_response = await self._response_service.get_page(
+            url,
+            cached_page.etag if cached_page is not None else None,
+            cached_page.last_modified if cached_page is not None else None,
+        )
+        if cached_page is not None and self._page_cache.is_unchanged(cached_page, page_response):
+            self._page_cache.refresh(url, cached_page, page_response)
+            return cached_page.page_dto
+
+        page_dto = await self._parse_executor.parse(self._parser, page_response.html)
+        self._page_cache.put(url, page_dto, page_response)
+        return page_dto
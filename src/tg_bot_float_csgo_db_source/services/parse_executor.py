@@ -0,0 +1,56 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Self
+
+from tg_bot_float_csgo_db_source.parsers.abstract_parser import T, AbstractParser
+from tg_bot_float_csgo_db_source.settings.parser_settings import ParserSettings
+
+PARSE_EXECUTOR_CLOSED_ERROR_MSG = "Parse executor is used outside of the app lifespan!"
+
+
+class ParseExecutor:
+    """Runs parsers off the event loop.
+
+    At most `parse_queue_size` pages wait for or run in the executor, further callers wait on
+    the event loop. With the process executor parsers and pages are pickled to the workers, so
+    parsing of several pages uses several cores. The executor is started on entering and shut
+    down on exit, so the same instance can be entered again by the next lifespan.
+    """
+
+    def __init__(self, settings: ParserSettings) -> None:
+        self._executor_type = settings.parse_executor
+        self._workers = settings.parse_workers
+        self._queue_size = settings.parse_queue_size
+        self._executor: Executor | None = None
+        self._queue_slots = asyncio.Semaphore(self._queue_size)
+
+    async def __aenter__(self) -> Self:
+        self._executor = (
+            ProcessPoolExecutor(max_workers=self._workers)
+            if self._executor_type == "process"
+            else ThreadPoolExecutor(max_workers=self._workers)
+        )
+        self._queue_slots = asyncio.Semaphore(self._queue_size)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    async def warm_up(self) -> None:
+        """Start every worker, so the first pages do not wait for a worker process to spawn."""
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(executor, int) for _ in range(self._workers)))
+
+    async def parse(self, parser: AbstractParser[T], page_html: str) -> T:
+        async with self._queue_slots:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), parser.get_parsed_data, page_html
+            )
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            raise RuntimeError(PARSE_EXECUTOR_CLOSED_ERROR_MSG)
+        return self._executor
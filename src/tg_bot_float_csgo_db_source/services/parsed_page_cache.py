@@ -0,0 +1,79 @@
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict
+
+from tg_bot_float_csgo_db_source.dtos.cached_page_dto import CachedPageDTO
+from tg_bot_float_csgo_db_source.dtos.page_response_dto import PageResponseDTO
+from tg_bot_float_csgo_db_source.settings.request_settings import RequestSettings
+
+
+class ParsedPageCache:
+    """Parsed page DTOs by upstream URL.
+
+    Entries are served without a request for `page_cache_ttl` seconds. Stale entries keep their
+    validators and content hash, so an unchanged page is revalidated without parsing it again.
+    Concurrent loads of one URL are single-flight: they wait for the load that is running. It
+    runs in its own task, so a disconnected client does not cancel it for the others.
+    """
+
+    def __init__(self, settings: RequestSettings) -> None:
+        self._ttl = settings.page_cache_ttl
+        self._max_entries = settings.page_cache_max_entries
+        self._entries: OrderedDict[str, CachedPageDTO] = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Task[Any]] = {}
+
+    def get(self, url: str) -> CachedPageDTO | None:
+        if (cached_page := self._entries.get(url)) is not None:
+            self._entries.move_to_end(url)
+        return cached_page
+
+    async def load_once(self, url: str, load: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._in_flight.get(url)
+        if task is None:
+            task = asyncio.create_task(self._load(url, load))
+            self._in_flight[url] = task
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def is_fresh(cached_page: CachedPageDTO) -> bool:
+        return cached_page.expires_at > time.time()
+
+    def is_unchanged(self, cached_page: CachedPageDTO, page_response: PageResponseDTO) -> bool:
+        return (
+            page_response.not_modified
+            or self._get_content_hash(page_response) == cached_page.content_hash
+        )
+
+    def put(self, url: str, page_dto: Any, page_response: PageResponseDTO) -> None:
+        self._entries[url] = CachedPageDTO(
+            page_dto=page_dto,
+            etag=page_response.etag,
+            last_modified=page_response.last_modified,
+            content_hash=self._get_content_hash(page_response),
+            expires_at=time.time() + self._ttl,
+        )
+        self._entries.move_to_end(url)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def refresh(self, url: str, cached_page: CachedPageDTO, page_response: PageResponseDTO) -> None:
+        """Extend an entry upstream confirmed as unchanged, keeping validators it did not resend."""
+        self._entries[url] = cached_page.model_copy(
+            update={
+                "etag": page_response.etag or cached_page.etag,
+                "last_modified": page_response.last_modified or cached_page.last_modified,
+                "expires_at": time.time() + self._ttl,
+            }
+        )
+
+    async def _load(self, url: str, load: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            return await load()
+        finally:
+            del self._in_flight[url]
+
+    @staticmethod
+    def _get_content_hash(page_response: PageResponseDTO) -> str:
+        return hashlib.sha256(page_response.html.encode("utf-8")).hexdigest()
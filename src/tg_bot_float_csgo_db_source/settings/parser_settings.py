@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -26,3 +28,8 @@ class ParserSettings(BaseSettings):
 
     # All variables connected with agents
     agent_regex: str
+
+    # All variables connected with parse executor
+    parse_executor: Literal["thread", "process"]
+    parse_workers: int
+    parse_queue_size: int
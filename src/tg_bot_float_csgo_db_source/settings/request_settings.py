@@ -15,3 +15,37 @@ class RequestSettings(BaseSettings):
     additional_info_path_url: str
     gloves_path_url: str
     agents_path_url: str
+
+    # All variables connected with parsed page cache
+    page_cache_ttl: float
+    page_cache_max_entries: int
+
+    # Upstream sessions, one per impersonated browser, opened for the app lifespan
+    impersonate_targets: str
+    session_max_clients: int
+
+    # Connect to upstream and start parse workers on startup
+    warm_up: bool
+
+    # Skins pages requested at once by the catalog stream
+    catalog_concurrency: int
+
+    def get_weapons_url(self) -> str:
+        return self.base_domen + self.weapons_path_url
+
+    def get_skins_url(self, weapon: str) -> str:
+        return self.base_domen + self.skins_path_url.format(
+            weapon=weapon.lower().replace("★ ", "").replace(" ", "-")
+        )
+
+    def get_additional_info_url(self, weapon: str, skin: str) -> str:
+        return self.base_domen + self.additional_info_path_url.format(
+            name=weapon.lower().replace(" ", "-"),
+            skin=skin.lower().replace(" ", "-"),
+        )
+
+    def get_gloves_url(self) -> str:
+        return self.base_domen + self.gloves_path_url
+
+    def get_agents_url(self) -> str:
+        return self.base_domen + self.agents_path_url
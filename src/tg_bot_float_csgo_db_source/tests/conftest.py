@@ -1,10 +1,17 @@
 from pathlib import Path
 import pytest
 
+from tg_bot_float_csgo_db_source.dependencies.page_cache import get_parsed_page_cache
 from tg_bot_float_csgo_db_source.settings.parser_settings import ParserSettings
 from tg_bot_float_csgo_db_source.settings.request_settings import RequestSettings
 
 
+@pytest.fixture(autouse=True)
+def clear_parsed_page_cache() -> None:
+    # The app cache is a singleton, pages cached by one test must not leak into the next one
+    get_parsed_page_cache.cache_clear()
+
+
 @pytest.fixture(scope="session")
 def weapon_page() -> str:
     with open(
@@ -0,0 +1,103 @@
+"""Parse CPU per page of tests/html_pages, the baseline parsers against the current ones.
+
+The parsers of the baseline are exported from git into a temporary directory and timed there, in
+a subprocess running this file against that tree. Both trees must give the same parsed pages.
+
+Run from src: python -m tg_bot_float_csgo_db_source.tests.parsers_benchmark [--rev <git revision>]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# The pages next to this file, the baseline tree is timed on the same pages
+PAGES_DIR = Path(__file__).parent / "html_pages"
+REPEAT = 200
+
+
+def get_cases() -> List[Tuple[str, Any]]:
+    """(page, parser) of the tree on sys.path"""
+    from tg_bot_float_csgo_db_source.parsers.additional_info_parser import AdditionalInfoParser
+    from tg_bot_float_csgo_db_source.parsers.agents_parser import AgentsParser
+    from tg_bot_float_csgo_db_source.parsers.gloves_parser import GlovesParser
+    from tg_bot_float_csgo_db_source.parsers.skins_parser import SkinsParser
+    from tg_bot_float_csgo_db_source.parsers.weapons_parser import WeaponsParser
+    from tg_bot_float_csgo_db_source.settings.parser_settings import ParserSettings
+
+    settings = ParserSettings()  # type: ignore "Load variables from 'parser_variables.env' file"
+    skins, additional_info = SkinsParser(settings), AdditionalInfoParser(settings)
+    return [
+        ("weapons_page", WeaponsParser(settings)),
+        ("desert_eagle_skin_page", skins),
+        ("famas_skin_page", skins),
+        ("karambit_skin_page", skins),
+        ("five_seven_monkey_business_additional_info_page", additional_info),
+        ("p90_emerald_dragon_additional_info_page", additional_info),
+        ("skeleton_knife_slaughter_additional_info_page", additional_info),
+        ("gloves_page", GlovesParser(settings)),
+        ("agents_page", AgentsParser(settings)),
+    ]
+
+
+def measure() -> Dict[str, Tuple[str, float]]:
+    """Page -> (parsed page JSON, seconds per parse)"""
+    results: Dict[str, Tuple[str, float]] = {}
+    for page, parser in get_cases():
+        page_html = (PAGES_DIR / f"{page}.txt").read_text(encoding="UTF-8")
+        parsed_page = parser.get_parsed_data(page_html).model_dump_json()
+        seconds = timeit.timeit(lambda: parser.get_parsed_data(page_html), number=REPEAT)
+        results[page] = (parsed_page, seconds / REPEAT)
+    return results
+
+
+def measure_revision(rev: str) -> Dict[str, Tuple[str, float]]:
+    """measure() in a subprocess, on src of the given revision"""
+    with tempfile.TemporaryDirectory() as tree:
+        # Run from src, the archive of "." holds src of the revision
+        archive = subprocess.run(["git", "archive", rev, "."], capture_output=True, check=True)
+        subprocess.run(["tar", "-x", "-C", tree], input=archive.stdout, check=True)
+        measured = subprocess.run(
+            [sys.executable, __file__, "--measure"],
+            cwd=tree,
+            env={**os.environ, "PYTHONPATH": tree},
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    return {
+        page: (parsed_page, seconds)
+        for page, (parsed_page, seconds) in json.loads(measured.stdout).items()
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rev", help="Revision of the baseline parsers, the root commit if unset")
+    parser.add_argument("--measure", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.measure:
+        print(json.dumps(measure()))
+        return
+    rev = args.rev or subprocess.run(
+        ["git", "rev-list", "--max-parents=0", "HEAD"], capture_output=True, check=True, text=True
+    ).stdout.split()[0]
+    baseline = measure_revision(rev)
+    print(f"{'page':48} {'baseline':>10} {'parser':>10} {'speedup':>8}")
+    for page, (parsed_page, seconds) in measure().items():
+        baseline_parsed_page, baseline_seconds = baseline[page]
+        if baseline_parsed_page != parsed_page:
+            raise AssertionError(f"Parsers disagree on {page}!")
+        print(
+            f"{page:48} {baseline_seconds * 1000:7.3f} ms {seconds * 1000:7.3f} ms "
+            f"{baseline_seconds / seconds:7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
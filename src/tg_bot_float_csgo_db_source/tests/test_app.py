@@ -1,4 +1,7 @@
-from typing import AsyncGenerator, Callable
+import json
+from typing import AsyncGenerator, Callable, Dict
+from unittest.mock import AsyncMock
+
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
@@ -10,27 +13,39 @@ from tg_bot_float_common_dtos.csgo_db_source_dtos.additional_info_page_dto impor
 )
 from tg_bot_float_common_dtos.csgo_db_source_dtos.agent_dto import AgentSkinsDTO
 from tg_bot_float_common_dtos.csgo_db_source_dtos.agents_page_dto import AgentsPageDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.catalog_record_dto import CatalogRecordDTO
 from tg_bot_float_common_dtos.csgo_db_source_dtos.glove_dto import GloveSkinsDTO
 from tg_bot_float_common_dtos.csgo_db_source_dtos.gloves_page_dto import GlovesPageDTO
 from tg_bot_float_common_dtos.csgo_db_source_dtos.skin_dto import WeaponSkinsDTO
 from tg_bot_float_common_dtos.csgo_db_source_dtos.skins_page_dto import SkinsPageDTO
 from tg_bot_float_common_dtos.csgo_db_source_dtos.weapon_dto import CategoryWeaponsDTO
 from tg_bot_float_common_dtos.csgo_db_source_dtos.weapons_page_dto import WeaponsPageDTO
-from tg_bot_float_csgo_db_source.main import app
+from tg_bot_float_csgo_db_source.csgo_db_exception import CsgoDbException
+from tg_bot_float_csgo_db_source.dtos.page_response_dto import PageResponseDTO
+from tg_bot_float_csgo_db_source.main import app, lifespan
+from tg_bot_float_csgo_db_source.response_service.csgo_db_response_service import (
+    CsgoDbSourceResponseService,
+)
 
 
 @pytest_asyncio.fixture(scope="module")
 async def client() -> AsyncGenerator[AsyncClient, None]:
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://localhost") as ac:
-        yield ac
+    # ASGITransport does not run the lifespan, enter it here without connecting to upstream
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(CsgoDbSourceResponseService, "warm_up", AsyncMock())
+        async with lifespan(app):
+            async with AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://localhost"
+            ) as ac:
+                yield ac
 
 
 @pytest.fixture
 def mock_response_service(mocker: MockFixture) -> Callable[[str], None]:
     def _apply(page: str):
         mocker.patch(
-            "tg_bot_float_csgo_db_source.response_service.csgo_db_response_service.CsgoDbSourceResponseService.get_page_html",
-            new=mocker.AsyncMock(return_value=page),
+            "tg_bot_float_csgo_db_source.response_service.csgo_db_response_service.CsgoDbSourceResponseService.get_page",
+            new=mocker.AsyncMock(return_value=PageResponseDTO(html=page)),
         )
 
     return _apply
@@ -325,3 +340,88 @@ async def test_agents_endpoint(
     for result_dto in page_dto.agents:
         if result_dto.fraction_name == result.fraction_name:
             assert len(set(result.skins).intersection(set(result_dto.skins))) == intersection
+
+
+@pytest.mark.asyncio
+async def test_catalog_endpoint(
+    mocker: MockFixture,
+    client: AsyncClient,
+    weapon_page: str,
+    gloves_page: str,
+    agents_page: str,
+) -> None:
+    pages: Dict[str, str] = {
+        "/weapons": weapon_page,
+        "/gloves": gloves_page,
+        "/agents": agents_page,
+    }
+    for weapon in ("desert_eagle", "famas", "karambit"):
+        with open(
+            f"tg_bot_float_csgo_db_source/tests/html_pages/{weapon}_skin_page.txt",
+            "r",
+            encoding="UTF-8",
+        ) as file:
+            pages[f"/weapons/{weapon.replace('_', '-')}"] = file.read()
+
+    async def get_page(url: str, *args: str | None) -> PageResponseDTO:
+        path = url.removeprefix("https://www.csgodatabase.com")
+        if path == "/weapons/zeus-x27":
+            raise RuntimeError()
+        if (page := pages.get(path)) is None:
+            raise CsgoDbException("Item with this name not found!")
+        return PageResponseDTO(html=page)
+
+    mocker.patch(
+        "tg_bot_float_csgo_db_source.response_service.csgo_db_response_service.CsgoDbSourceResponseService.get_page",
+        new=mocker.AsyncMock(side_effect=get_page),
+    )
+    response: Response = await client.get("/catalog")
+
+    assert response.status_code == 200
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    records = [CatalogRecordDTO.model_validate(json.loads(line)) for line in response.iter_lines()]
+
+    assert records[0].weapons is not None and records[0].weapons.count == 55
+
+    assert records[1].gloves is not None and records[2].agents is not None
+
+    skins_records = [record for record in records[3:] if record.skins is not None]
+
+    assert sorted(record.weapon for record in skins_records) == [  # type: ignore
+        "Desert Eagle",
+        "FAMAS",
+        "Karambit",
+    ]
+
+    error_records = [record for record in records[3:] if record.error is not None]
+
+    assert len(error_records) == 52
+
+    # Unexpected errors of one weapon become its error record too
+    assert {record.error for record in error_records} == {
+        "Item with this name not found!",
+        "RuntimeError",
+    }
+
+    assert records[-1].summary is not None
+
+    assert records[-1].summary.model_dump() == {"done": True, "weapons": 55, "errors": 52}
+
+    assert len(records) == 3 + 55 + 1
+
+
+@pytest.mark.asyncio
+async def test_catalog_endpoint_weapons_page_error(
+    mocker: MockFixture, client: AsyncClient
+) -> None:
+    mocker.patch(
+        "tg_bot_float_csgo_db_source.response_service.csgo_db_response_service.CsgoDbSourceResponseService.get_page",
+        new=mocker.AsyncMock(return_value=PageResponseDTO(html="")),
+    )
+    response: Response = await client.get("/catalog")
+
+    assert response.status_code == 403
+
+    assert response.json() == {"message": "No weapons found!"}
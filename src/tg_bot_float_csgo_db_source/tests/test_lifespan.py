@@ -0,0 +1,29 @@
+import pytest
+from pytest_mock import MockFixture
+
+from tg_bot_float_csgo_db_source.dependencies.parse_executor import get_parse_executor
+from tg_bot_float_csgo_db_source.dependencies.parsers import PARSER_GETTERS
+from tg_bot_float_csgo_db_source.dependencies.response_service import get_session_pool
+from tg_bot_float_csgo_db_source.dependencies.settings import get_request_settings
+from tg_bot_float_csgo_db_source.main import app, lifespan
+
+
+@pytest.mark.asyncio
+async def test_lifespan_builds_and_warms_up_singletons(mocker: MockFixture) -> None:
+    warm_up = mocker.patch(
+        "tg_bot_float_csgo_db_source.response_service.csgo_db_response_service.CsgoDbSourceResponseService.warm_up",
+        new=mocker.AsyncMock(),
+    )
+    parse_executor_warm_up = mocker.spy(get_parse_executor(), "warm_up")
+
+    async with lifespan(app):
+        for get_parser in PARSER_GETTERS:
+            assert get_parser() is get_parser()
+
+        assert get_session_pool().get_session() is not None
+
+        warm_up.assert_awaited_once_with(get_request_settings().base_domen)
+        parse_executor_warm_up.assert_called_once()
+
+    with pytest.raises(RuntimeError):
+        get_session_pool().get_session()
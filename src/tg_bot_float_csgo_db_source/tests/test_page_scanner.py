@@ -0,0 +1,114 @@
+import re
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from tg_bot_float_csgo_db_source.parsers.page_scanner import PageScanner
+from tg_bot_float_csgo_db_source.settings.parser_settings import ParserSettings
+
+
+def _read_page(page: str) -> str:
+    with open(
+        Path(f"tg_bot_float_csgo_db_source/tests/html_pages/{page}.txt"), "r", encoding="UTF-8"
+    ) as file:
+        return file.read()
+
+
+def _get_patterns(settings: ParserSettings, page: str) -> Dict[str, str]:
+    if page == "weapons_page":
+        return {
+            "total_weapon": settings.total_weapon_regex,
+            "weapon_name": settings.weapon_name_regex,
+        }
+    if page.endswith("_skin_page"):
+        return {
+            "skin_name": settings.skin_name_regex,
+            "skin_weapon_name": settings.skin_weapon_name_regex,
+            "skin_rarity": settings.skin_rarity_regex,
+        }
+    if page.endswith("_additional_info_page"):
+        return {
+            "quality_stattrak": settings.quality_stattrak_regex,
+            "weapon_skin_name": settings.additional_weapon_skin_name_regex,
+            "rarity": settings.rarity_regex,
+        }
+    if page == "gloves_page":
+        return {"glove": settings.glove_regex}
+    return {"agent": settings.agent_regex}
+
+
+@pytest.mark.parametrize(
+    "page",
+    [
+        "weapons_page",
+        "desert_eagle_skin_page",
+        "famas_skin_page",
+        "karambit_skin_page",
+        "five_seven_monkey_business_additional_info_page",
+        "p90_emerald_dragon_additional_info_page",
+        "skeleton_knife_slaughter_additional_info_page",
+        "gloves_page",
+        "agents_page",
+    ],
+)
+def test_page_scanner_matches_separate_scans(
+    parser_settings_fixture: ParserSettings, page: str
+) -> None:
+    patterns = _get_patterns(parser_settings_fixture, page)
+    page_html = _read_page(page)
+
+    page_matches = PageScanner(patterns).scan(page_html)
+
+    for name, pattern in patterns.items():
+        assert page_matches[name] == [match.groups() for match in re.finditer(pattern, page_html)]
+
+
+def test_page_scanner_groups_by_pattern() -> None:
+    page_scanner = PageScanner(
+        {"bold": r"<b>([^<]+)</b>", "link": r'<a href="([^"]+)">([^<]+)</a>'}
+    )
+
+    page_matches = page_scanner.scan('<b>one</b><a href="/x">x</a><p>skip</p><b>two</b>')
+
+    assert page_matches == {"bold": [("one",), ("two",)], "link": [("/x", "x")]}
+
+
+def test_page_scanner_keeps_overlapping_matches() -> None:
+    patterns = {"item": r"<li>(.*?)</li>", "link": r'<a href="([^"]+)">'}
+    page_html = '<li><a href="/x">x</a></li><li>plain</li><a href="/y">'
+
+    page_matches = PageScanner(patterns).scan(page_html)
+
+    assert page_matches == {
+        "item": [('<a href="/x">x</a>',), ("plain",)],
+        "link": [("/x",), ("/y",)],
+    }
+
+
+def test_page_scanner_does_not_overlap_matches_of_one_pattern() -> None:
+    patterns = {"block": r"<div>(.*?)</div>", "bold": r"<b>([^<]+)</b>"}
+    page_html = "<div>a<div>b</div><b>c</b>"
+
+    page_matches = PageScanner(patterns).scan(page_html)
+
+    assert page_matches["block"] == [("a<div>b",)]
+    assert page_matches["bold"] == [("c",)]
+
+
+def test_page_scanner_patterns_of_one_tag() -> None:
+    with pytest.raises(ValueError) as exc_info:
+        PageScanner({"paragraph": r"<p[^>]*>([^<]+)</p>", "pre": r"<pre>([^<]+)</pre>"})
+
+    assert "may match the same tag" in str(exc_info)
+
+
+def test_page_scanner_empty_page() -> None:
+    assert PageScanner({"bold": r"<b>([^<]+)</b>"}).scan("") == {"bold": []}
+
+
+def test_page_scanner_pattern_without_tag() -> None:
+    with pytest.raises(ValueError) as exc_info:
+        PageScanner({"digits": r"(\d+)"})
+
+    assert "must start with '<'" in str(exc_info)
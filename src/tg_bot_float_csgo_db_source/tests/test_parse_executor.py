@@ -0,0 +1,65 @@
+import asyncio
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+
+from tg_bot_float_csgo_db_source.csgo_db_exception import CsgoDbException
+from tg_bot_float_csgo_db_source.parsers.weapons_parser import WeaponsParser
+from tg_bot_float_csgo_db_source.services.parse_executor import ParseExecutor
+from tg_bot_float_csgo_db_source.settings.parser_settings import ParserSettings
+
+
+@pytest_asyncio.fixture(params=["thread", "process"])
+async def parse_executor(
+    request: pytest.FixtureRequest, parser_settings_fixture: ParserSettings
+) -> AsyncGenerator[ParseExecutor, None]:
+    settings = parser_settings_fixture.model_copy(
+        update={"parse_executor": request.param, "parse_workers": 2, "parse_queue_size": 2}
+    )
+    async with ParseExecutor(settings) as executor:
+        yield executor
+
+
+@pytest.mark.asyncio
+async def test_parse_executor(
+    parse_executor: ParseExecutor, parser_settings_fixture: ParserSettings, weapon_page: str
+) -> None:
+    weapons_parser = WeaponsParser(parser_settings_fixture)
+
+    page_dtos = await asyncio.gather(
+        *(parse_executor.parse(weapons_parser, weapon_page) for _ in range(5))
+    )
+
+    for page_dto in page_dtos:
+        assert page_dto == weapons_parser.get_parsed_data(weapon_page)
+
+
+@pytest.mark.asyncio
+async def test_parse_executor_parser_error(
+    parse_executor: ParseExecutor, parser_settings_fixture: ParserSettings
+) -> None:
+    with pytest.raises(CsgoDbException) as exc_info:
+        await parse_executor.parse(WeaponsParser(parser_settings_fixture), "awddwa")
+
+    assert "Wrong page request!" in str(exc_info)
+
+
+@pytest.mark.asyncio
+async def test_parse_executor_runs_only_while_entered(
+    parser_settings_fixture: ParserSettings, weapon_page: str
+) -> None:
+    parse_executor = ParseExecutor(parser_settings_fixture)
+    weapons_parser = WeaponsParser(parser_settings_fixture)
+
+    with pytest.raises(RuntimeError) as exc_info:
+        await parse_executor.parse(weapons_parser, weapon_page)
+    assert "outside of the app lifespan" in str(exc_info)
+
+    # Every lifespan starts its own executor on the same instance
+    for _ in range(2):
+        async with parse_executor:
+            assert (await parse_executor.parse(weapons_parser, weapon_page)).count == 55
+
+    with pytest.raises(RuntimeError):
+        await parse_executor.parse(weapons_parser, weapon_page)
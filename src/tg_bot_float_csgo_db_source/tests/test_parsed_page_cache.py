@@ -0,0 +1,211 @@
+import asyncio
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from pytest_mock import MockFixture
+
+from tg_bot_float_common_dtos.csgo_db_source_dtos.weapons_page_dto import WeaponsPageDTO
+from tg_bot_float_csgo_db_source.csgo_db_exception import CsgoDbException
+from tg_bot_float_csgo_db_source.dtos.page_response_dto import PageResponseDTO
+from tg_bot_float_csgo_db_source.parsers.weapons_parser import WeaponsParser
+from tg_bot_float_csgo_db_source.response_service.csgo_db_response_service import (
+    CsgoDbSourceResponseService,
+)
+from tg_bot_float_csgo_db_source.services.csgo_db_source_service import CsgoDbSourceService
+from tg_bot_float_csgo_db_source.services.parse_executor import ParseExecutor
+from tg_bot_float_csgo_db_source.services.parsed_page_cache import ParsedPageCache
+from tg_bot_float_csgo_db_source.settings.parser_settings import ParserSettings
+from tg_bot_float_csgo_db_source.settings.request_settings import RequestSettings
+
+URL = "https://www.csgodatabase.com/weapons"
+
+
+@pytest_asyncio.fixture
+async def parse_executor(
+    parser_settings_fixture: ParserSettings,
+) -> AsyncGenerator[ParseExecutor, None]:
+    async with ParseExecutor(parser_settings_fixture) as executor:
+        yield executor
+
+
+def _get_service(
+    mocker: MockFixture,
+    request_settings: RequestSettings,
+    parser_settings: ParserSettings,
+    parse_executor: ParseExecutor,
+    ttl: float,
+) -> CsgoDbSourceService[WeaponsPageDTO]:
+    page_cache = ParsedPageCache(request_settings.model_copy(update={"page_cache_ttl": ttl}))
+    response_service = mocker.Mock(spec=CsgoDbSourceResponseService)
+    parser = WeaponsParser(parser_settings)
+    mocker.spy(parser, "get_parsed_data")
+    return CsgoDbSourceService(response_service, parser, parse_executor, page_cache)
+
+
+@pytest.mark.asyncio
+async def test_fresh_page_is_not_requested(
+    mocker: MockFixture,
+    request_settings_fixture: RequestSettings,
+    parser_settings_fixture: ParserSettings,
+    parse_executor: ParseExecutor,
+    weapon_page: str,
+) -> None:
+    service = _get_service(
+        mocker, request_settings_fixture, parser_settings_fixture, parse_executor, ttl=60
+    )
+    service._response_service.get_page.return_value = PageResponseDTO(html=weapon_page)
+
+    first_dto = await service.get_page(URL)
+    second_dto = await service.get_page(URL)
+
+    assert first_dto is second_dto
+    assert service._response_service.get_page.await_count == 1
+    assert service._parser.get_parsed_data.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "revalidation_response",
+    [
+        PageResponseDTO(not_modified=True),
+        PageResponseDTO(etag='"v2"'),
+    ],
+    ids=["not_modified", "same_content"],
+)
+@pytest.mark.asyncio
+async def test_unchanged_page_is_not_parsed_again(
+    mocker: MockFixture,
+    request_settings_fixture: RequestSettings,
+    parser_settings_fixture: ParserSettings,
+    parse_executor: ParseExecutor,
+    weapon_page: str,
+    revalidation_response: PageResponseDTO,
+) -> None:
+    service = _get_service(
+        mocker, request_settings_fixture, parser_settings_fixture, parse_executor, ttl=0
+    )
+    if not revalidation_response.not_modified:
+        revalidation_response = revalidation_response.model_copy(update={"html": weapon_page})
+    service._response_service.get_page.side_effect = [
+        PageResponseDTO(html=weapon_page, etag='"v1"', last_modified="Mon, 01 Jan 2024"),
+        revalidation_response,
+    ]
+
+    first_dto = await service.get_page(URL)
+    second_dto = await service.get_page(URL)
+
+    assert first_dto is second_dto
+    assert service._parser.get_parsed_data.call_count == 1
+    service._response_service.get_page.assert_awaited_with(URL, '"v1"', "Mon, 01 Jan 2024")
+
+
+@pytest.mark.asyncio
+async def test_changed_page_is_parsed_again(
+    mocker: MockFixture,
+    request_settings_fixture: RequestSettings,
+    parser_settings_fixture: ParserSettings,
+    parse_executor: ParseExecutor,
+    weapon_page: str,
+) -> None:
+    service = _get_service(
+        mocker, request_settings_fixture, parser_settings_fixture, parse_executor, ttl=0
+    )
+    changed_page = weapon_page.replace("Zeus x27", "Zeus x28")
+    service._response_service.get_page.side_effect = [
+        PageResponseDTO(html=weapon_page, etag='"v1"'),
+        PageResponseDTO(html=changed_page, etag='"v2"'),
+    ]
+
+    first_dto = await service.get_page(URL)
+    second_dto = await service.get_page(URL)
+
+    assert service._parser.get_parsed_data.call_count == 2
+    assert "Zeus x27" in first_dto.categories[-1].weapons
+    assert "Zeus x28" in second_dto.categories[-1].weapons
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_load(
+    mocker: MockFixture,
+    request_settings_fixture: RequestSettings,
+    parser_settings_fixture: ParserSettings,
+    parse_executor: ParseExecutor,
+    weapon_page: str,
+) -> None:
+    service = _get_service(
+        mocker, request_settings_fixture, parser_settings_fixture, parse_executor, ttl=60
+    )
+    page_requested = asyncio.Event()
+    release_page = asyncio.Event()
+
+    async def get_page(*args: str | None) -> PageResponseDTO:
+        page_requested.set()
+        await release_page.wait()
+        return PageResponseDTO(html=weapon_page)
+
+    service._response_service.get_page.side_effect = get_page
+
+    first = asyncio.create_task(service.get_page(URL))
+    await page_requested.wait()
+    second = asyncio.create_task(service.get_page(URL))
+    await asyncio.sleep(0)
+    release_page.set()
+
+    assert await first is await second
+    assert service._response_service.get_page.await_count == 1
+    assert service._parser.get_parsed_data.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_does_not_cancel_shared_load(
+    mocker: MockFixture,
+    request_settings_fixture: RequestSettings,
+    parser_settings_fixture: ParserSettings,
+    parse_executor: ParseExecutor,
+    weapon_page: str,
+) -> None:
+    service = _get_service(
+        mocker, request_settings_fixture, parser_settings_fixture, parse_executor, ttl=60
+    )
+    page_requested = asyncio.Event()
+    release_page = asyncio.Event()
+
+    async def get_page(*args: str | None) -> PageResponseDTO:
+        page_requested.set()
+        await release_page.wait()
+        return PageResponseDTO(html=weapon_page)
+
+    service._response_service.get_page.side_effect = get_page
+
+    first = asyncio.create_task(service.get_page(URL))
+    await page_requested.wait()
+    second = asyncio.create_task(service.get_page(URL))
+    await asyncio.sleep(0)
+    first.cancel()
+    release_page.set()
+
+    assert (await second).count == 55
+    assert first.cancelled()
+    assert service._response_service.get_page.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_load_is_not_cached(
+    mocker: MockFixture,
+    request_settings_fixture: RequestSettings,
+    parser_settings_fixture: ParserSettings,
+    parse_executor: ParseExecutor,
+    weapon_page: str,
+) -> None:
+    service = _get_service(
+        mocker, request_settings_fixture, parser_settings_fixture, parse_executor, ttl=60
+    )
+    service._response_service.get_page.side_effect = [
+        CsgoDbException("Item with this name not found!"),
+        PageResponseDTO(html=weapon_page),
+    ]
+
+    with pytest.raises(CsgoDbException):
+        await service.get_page(URL)
+
+    assert (await service.get_page(URL)).count == 55
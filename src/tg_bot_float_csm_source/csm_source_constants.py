@@ -1 +1,2 @@
 NOT_EXIST_ERROR_MSG = "Items with this parameters does not exists in csm market or no items with this offset!"
+BAD_ITEM_ERROR_MSG = "Item of csm market could not be read: {error}"
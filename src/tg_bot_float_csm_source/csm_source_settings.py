@@ -8,3 +8,9 @@ class CsmSourceSettings(BaseSettings):
     base_url: str
     params: str
     headers: str
+    page_limit: int
+    scan_concurrency: int
+    cache_ttl: float
+    cache_max_entries: int
+    impersonate_targets: str
+    session_max_clients: int
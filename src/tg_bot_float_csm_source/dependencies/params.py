@@ -3,6 +3,10 @@ from typing import Annotated
 from fastapi import Depends
 
 from tg_bot_float_csm_source.router_controllers.csm_router_params.csm_params import CsmParams
+from tg_bot_float_csm_source.router_controllers.csm_router_params.csm_scan_params import (
+    CsmScanParams,
+)
 
 
 CSM_PARAMS = Annotated[CsmParams, Depends(CsmParams)]
+CSM_SCAN_PARAMS = Annotated[CsmScanParams, Depends(CsmScanParams)]
@@ -1,10 +1,12 @@
 from functools import lru_cache
-from typing import Annotated, Any, AsyncGenerator
+from typing import Annotated
 
 from fastapi import Depends
 
 from tg_bot_float_csm_source.csm_source_settings import CsmSourceSettings
+from tg_bot_float_csm_source.services.csm_response_cache import CsmResponseCache
 from tg_bot_float_csm_source.services.csm_source_service import CsmService
+from tg_bot_float_misc.curl_session_pool.curl_session_pool import CurlSessionPool
 
 
 @lru_cache
@@ -15,9 +17,28 @@ def get_settings() -> CsmSourceSettings:
 CSM_SOURCE_SETTINGS = Annotated[CsmSourceSettings, Depends(get_settings)]
 
 
-async def get_csm_service(settings: CSM_SOURCE_SETTINGS) -> AsyncGenerator[Any, CsmService]:
-    async with CsmService(settings) as service:
-        yield service
+@lru_cache
+def get_session_pool() -> CurlSessionPool:
+    settings = get_settings()
+    return CurlSessionPool(
+        settings.session_max_clients,
+        impersonate_targets=[
+            target.strip() for target in settings.impersonate_targets.split(",") if target.strip()
+        ],
+    )
+
+
+@lru_cache
+def get_response_cache() -> CsmResponseCache:
+    return CsmResponseCache(get_settings())
+
+
+CSM_RESPONSE_CACHE = Annotated[CsmResponseCache, Depends(get_response_cache)]
+
+
+@lru_cache
+def get_csm_service() -> CsmService:
+    return CsmService(get_settings(), get_session_pool(), get_response_cache())
 
 
 CSM_SERVICE = Annotated[CsmService, Depends(get_csm_service)]
@@ -1,15 +1,22 @@
-from typing import List
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
 from fastapi import FastAPI
 
+from tg_bot_float_csm_source.dependencies.services import get_session_pool
 from tg_bot_float_csm_source.router_controllers.csm_router_controller import CsmRouterController
 from tg_bot_float_csm_source.middlewares.error_handling_middleware import ErrorHandlingMiddleware
 from tg_bot_float_misc.router_controller.abstract_router_controller import AbstractRouterController
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    async with get_session_pool():
+        yield
+
 
 router_controllers: List[AbstractRouterController] = [CsmRouterController()]
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 app.add_middleware(ErrorHandlingMiddleware)
 
 for controller in router_controllers:
@@ -2,8 +2,9 @@ from typing import List
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 
-from tg_bot_float_csm_source.dependencies.params import CSM_PARAMS
-from tg_bot_float_csm_source.dependencies.services import CSM_SERVICE
+from tg_bot_float_csm_source.dependencies.params import CSM_PARAMS, CSM_SCAN_PARAMS
+from tg_bot_float_csm_source.dependencies.services import CSM_RESPONSE_CACHE, CSM_SERVICE
+from tg_bot_float_csm_source.services.dtos.csm_cache_stats_dto import CsmCacheStatsDTO
 from tg_bot_float_common_dtos.csm_source_dtos.csm_item_dto import CsmItemDTO
 from tg_bot_float_misc.router_controller.abstract_router_controller import AbstractRouterController
 
@@ -14,14 +15,34 @@ class CsmRouterController(AbstractRouterController):
         super().__init__()
 
     def _init_routes(self) -> None:
+        self._router.add_api_route(
+            "/cache/stats",
+            self._get_cache_stats,
+            methods=["GET"],
+            response_model=CsmCacheStatsDTO,
+        )
         self._router.add_api_route(
             "/{weapon}/{skin}/{quality}/{stattrak}",
             self._get_csm_items,
             methods=["GET"],
             response_model=None,
         )
+        self._router.add_api_route(
+            "/{weapon}/{skin}/{quality}/{stattrak}/scan",
+            self._scan_csm_items,
+            methods=["GET"],
+            response_model=None,
+        )
 
     async def _get_csm_items(
         self, csm_service: CSM_SERVICE, csm_params: CSM_PARAMS
     ) -> List[CsmItemDTO] | JSONResponse:
         return await csm_service.get_items_from_page(csm_params)
+
+    async def _scan_csm_items(
+        self, csm_service: CSM_SERVICE, csm_scan_params: CSM_SCAN_PARAMS
+    ) -> List[CsmItemDTO] | JSONResponse:
+        return await csm_service.scan_items(csm_scan_params)
+
+    async def _get_cache_stats(self, response_cache: CSM_RESPONSE_CACHE) -> CsmCacheStatsDTO:
+        return response_cache.get_stats()
@@ -0,0 +1,13 @@
+from typing import Literal
+
+from pydantic import Field
+
+from tg_bot_float_csm_source.router_controllers.csm_router_params.csm_params import CsmParams
+
+
+class CsmScanParams(CsmParams):
+    pages: int = Field(default=5, gt=0, le=50)  # Pages scanned from `offset` on
+    sort_by: Literal["price_with_float", "item_float"] = "price_with_float"
+    # Scan stops after the wave in which an item reached one of the thresholds
+    max_float: float | None = Field(default=None, ge=0, le=1)
+    max_price_with_float: float | None = Field(default=None, gt=0)
@@ -0,0 +1,64 @@
+from array import array
+from typing import Any, Dict, List
+
+from tg_bot_float_common_dtos.csm_source_dtos.csm_item_dto import CsmItemDTO
+from tg_bot_float_csm_source.csm_source_constants import BAD_ITEM_ERROR_MSG
+from tg_bot_float_csm_source.services.csm_source_exceptions import CsmSourceExceptions
+
+
+class CsmItemColumns:
+    """Column-wise view of the raw items of one CSM page.
+
+    Items without `overpay.float` are dropped while the columns are filled, so DTOs are built
+    only for items that are returned. Values are checked as they are converted, an item that
+    cannot be read raises CsmSourceExceptions.
+    """
+
+    def __init__(self, items: List[Dict[str, Any]]) -> None:
+        self.names: List[str] = []
+        self.item_floats = array("d")
+        self.prices = array("d")
+        self.overpay_floats = array("d")
+        for item in items:
+            overpay = item.get("overpay")
+            if not overpay or not (overpay_float := overpay.get("float")):
+                continue
+            try:
+                name = item.get("fullName", "")
+                if not isinstance(name, str):
+                    raise TypeError(f"fullName {name!r} is not a string")
+                item_float = float(item.get("float", ""))
+                price = float(item.get("defaultPrice", 0))
+                overpay_float = float(overpay_float)
+            except (TypeError, ValueError) as exc:
+                raise CsmSourceExceptions(BAD_ITEM_ERROR_MSG.format(error=exc)) from exc
+            self.names.append(name)
+            self.item_floats.append(item_float)
+            self.prices.append(price)
+            self.overpay_floats.append(overpay_float)
+
+    def get_prices_with_float(self) -> List[float]:
+        # Rounded to 4 significant digits, as the decimal context with prec=4 did
+        return [
+            float(f"{price + overpay_float:.4g}")
+            for price, overpay_float in zip(self.prices, self.overpay_floats)
+        ]
+
+    def to_dtos(self) -> List[CsmItemDTO]:
+        # Every column was checked while it was filled, so validation is skipped
+        return [
+            CsmItemDTO.model_construct(
+                name=name,
+                item_float=item_float,
+                price=price,
+                price_with_float=price_with_float,
+                overpay_float=overpay_float,
+            )
+            for name, item_float, price, price_with_float, overpay_float in zip(
+                self.names,
+                self.item_floats,
+                self.prices,
+                self.get_prices_with_float(),
+                self.overpay_floats,
+            )
+        ]
@@ -0,0 +1,61 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Tuple
+
+from tg_bot_float_csm_source.csm_source_settings import CsmSourceSettings
+from tg_bot_float_csm_source.services.dtos.csm_cache_stats_dto import CsmCacheStatsDTO
+from tg_bot_float_csm_source.services.dtos.csm_response_dto import CsmResponse
+
+
+class CsmResponseCache:
+    """Short-lived CSM responses with single-flight fetching.
+
+    Concurrent requests for a key that is being fetched wait for that fetch instead of starting
+    their own. The fetch runs in its own task, so a disconnected client does not cancel it for
+    the others.
+    """
+
+    def __init__(self, settings: CsmSourceSettings) -> None:
+        self._ttl = settings.cache_ttl
+        self._max_entries = settings.cache_max_entries
+        self._entries: OrderedDict[str, Tuple[float, CsmResponse]] = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Task[CsmResponse]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+
+    async def get_or_fetch(
+        self, key: str, fetch: Callable[[], Awaitable[CsmResponse]]
+    ) -> CsmResponse:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._hits += 1
+            return entry[1]
+        task = self._in_flight.get(key)
+        if task is None:
+            self._misses += 1
+            task = asyncio.create_task(self._fetch(key, fetch))
+            self._in_flight[key] = task
+        else:
+            self._coalesced += 1
+        return await asyncio.shield(task)
+
+    def get_stats(self) -> CsmCacheStatsDTO:
+        return CsmCacheStatsDTO(
+            hits=self._hits,
+            misses=self._misses,
+            coalesced=self._coalesced,
+            entries=len(self._entries),
+        )
+
+    async def _fetch(self, key: str, fetch: Callable[[], Awaitable[CsmResponse]]) -> CsmResponse:
+        try:
+            csm_response = await fetch()
+        finally:
+            del self._in_flight[key]
+        self._entries[key] = (time.monotonic() + self._ttl, csm_response)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return csm_response
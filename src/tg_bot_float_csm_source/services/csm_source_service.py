@@ -1,45 +1,94 @@
-from decimal import Decimal, localcontext
 import json
-from typing import Any, Dict, List, Self
-
-from curl_cffi.requests import AsyncSession
-from fake_useragent import UserAgent
+import asyncio
+from operator import attrgetter
+from typing import Any, Dict, List, Set, Tuple
 
 from tg_bot_float_csm_source.csm_source_constants import NOT_EXIST_ERROR_MSG
 from tg_bot_float_csm_source.csm_source_settings import CsmSourceSettings
 from tg_bot_float_csm_source.router_controllers.csm_router_params.csm_params import CsmParams
+from tg_bot_float_csm_source.router_controllers.csm_router_params.csm_scan_params import (
+    CsmScanParams,
+)
 from tg_bot_float_csm_source.services.dtos.csm_response_dto import CsmResponse
 from tg_bot_float_csm_source.services.csm_source_exceptions import CsmSourceExceptions
-from tg_bot_float_csm_source.services.dtos.csm_item_response_dto import CsmItemResponseDTO
+from tg_bot_float_csm_source.services.csm_item_columns import CsmItemColumns
+from tg_bot_float_csm_source.services.csm_response_cache import CsmResponseCache
+from tg_bot_float_misc.curl_session_pool.curl_session_pool import CurlSessionPool
 from tg_bot_float_common_dtos.csm_source_dtos.csm_item_dto import CsmItemDTO
 
 
 class CsmService:
-    def __init__(self, settings: CsmSourceSettings) -> None:
+    def __init__(
+        self,
+        settings: CsmSourceSettings,
+        session_pool: CurlSessionPool,
+        response_cache: CsmResponseCache,
+    ) -> None:
         self._settings = settings
+        self._session_pool = session_pool
+        self._response_cache = response_cache
+        # User agent is left to the impersonated browser, so it matches the TLS fingerprint
+        self._headers: Dict[str, Any] = json.loads(settings.headers)
 
-    async def __aenter__(self) -> Self:
-        self._session = AsyncSession()
-        return self
+    async def get_items_from_page(self, csm_params: CsmParams) -> List[CsmItemDTO]:
+        """Parse 1 page from csm source"""
+        items = await self._get_page_items(csm_params)
+        if not items:
+            raise CsmSourceExceptions(NOT_EXIST_ERROR_MSG)
+        return items
 
-    async def __aexit__(self, type, exc, traceback) -> None:
-        await self._session.close()
+    async def scan_items(self, csm_scan_params: CsmScanParams) -> List[CsmItemDTO]:
+        """Parse `pages` pages from `offset` on, merged and sorted by `sort_by`.
 
-    @property
-    def _headers(self) -> Dict[str, Any]:
-        headers = json.loads(self._settings.headers)
-        headers["user-agent"] = f"{UserAgent.random}"
-        return headers
+        Pages are fetched in concurrent waves. The scan ends after the wave that reached the end
+        of the listing or found an item within `max_float` / `max_price_with_float`.
+        """
+        offsets = [
+            csm_scan_params.offset + page * self._settings.page_limit
+            for page in range(csm_scan_params.pages)
+        ]
+        seen_items: Set[Tuple[str, float]] = set()
+        items: List[CsmItemDTO] = []
+        for wave_start in range(0, len(offsets), self._settings.scan_concurrency):
+            wave_offsets = offsets[wave_start : wave_start + self._settings.scan_concurrency]
+            pages = await asyncio.gather(
+                *(
+                    self._get_page_items(csm_scan_params.model_copy(update={"offset": offset}))
+                    for offset in wave_offsets
+                ),
+                return_exceptions=True,
+            )
+            is_listing_end = False
+            for page in pages:
+                if isinstance(page, CsmSourceExceptions):
+                    is_listing_end = True
+                    continue
+                if isinstance(page, BaseException):
+                    raise page
+                for item in page:
+                    if (item.name, item.item_float) not in seen_items:
+                        seen_items.add((item.name, item.item_float))
+                        items.append(item)
+            if is_listing_end or self._is_threshold_met(items, csm_scan_params):
+                break
+        if not items:
+            raise CsmSourceExceptions(NOT_EXIST_ERROR_MSG)
+        return sorted(items, key=attrgetter(csm_scan_params.sort_by))
 
-    async def get_items_from_page(self, csm_params: CsmParams) -> List[CsmItemDTO]:
-        """Parse 1 page from csm source"""
+    @staticmethod
+    def _is_threshold_met(items: List[CsmItemDTO], csm_scan_params: CsmScanParams) -> bool:
+        max_float, max_price = csm_scan_params.max_float, csm_scan_params.max_price_with_float
+        return any(
+            (max_float is not None and item.item_float <= max_float)
+            or (max_price is not None and item.price_with_float <= max_price)
+            for item in items
+        )
+
+    async def _get_page_items(self, csm_params: CsmParams) -> List[CsmItemDTO]:
         link = self._get_valid_link(csm_params)
         csm_response = await self._get_csm_response(link)
         self._check_on_errors(csm_response)
-        items = self._get_csm_items_from_response(csm_response)
-        if not items:
-            raise CsmSourceExceptions(NOT_EXIST_ERROR_MSG)
-        return items
+        return self._get_csm_items_from_response(csm_response)
 
     def _get_valid_link(self, csm_params: CsmParams) -> str:
         weapon = csm_params.weapon.replace(" ", "%20")
@@ -57,43 +106,26 @@ class CsmService:
             quality=quality.lower(),
             stattrak=stattrak,
             offset=csm_params.offset,
+            limit=self._settings.page_limit,
         )
 
     async def _get_csm_response(self, link: str) -> CsmResponse:
-        response = await self._session.get(link, headers=self._headers)
+        # The link is built from normalized params, names are matched case-insensitively
+        return await self._response_cache.get_or_fetch(
+            link.lower(), lambda: self._fetch_csm_response(link)
+        )
+
+    async def _fetch_csm_response(self, link: str) -> CsmResponse:
+        response = await self._session_pool.get_session().get(link, headers=self._headers)
         json_response = response.json()
         return CsmResponse.model_validate(json_response)
 
     @staticmethod
     def _check_on_errors(csm_response: CsmResponse) -> None:
-        if csm_response.error:
+        # A page without items is past the end of the listing
+        if csm_response.error or not csm_response.items:
             raise CsmSourceExceptions(NOT_EXIST_ERROR_MSG)
 
-    def _get_csm_items_from_response(self, csm_response: CsmResponse) -> List[CsmItemDTO]:
-        csm_items: List[CsmItemDTO] = []
-        for item in csm_response.items:
-            item_response_dto = CsmItemResponseDTO.model_validate(item)
-            if item_response_dto.overpay and (
-                overpay_float := item_response_dto.overpay.get("float")
-            ):
-                csm_skin_response_dto = self._get_csm_item_dto(item_response_dto, overpay_float)
-                csm_items.append(csm_skin_response_dto)
-        return csm_items
-
-    def _get_csm_item_dto(self, item: CsmItemResponseDTO, overpay_float: str) -> CsmItemDTO:
-        default_price_with_float = self._get_default_price_with_float(
-            item.defaultPrice, float(overpay_float)
-        )
-        return CsmItemDTO(
-            name=item.fullName,
-            item_float=float(item.float),
-            price=item.defaultPrice,
-            price_with_float=default_price_with_float,
-            overpay_float=float(overpay_float),
-        )
-
     @staticmethod
-    def _get_default_price_with_float(default_price: float, overpay_float: float) -> float:
-        with localcontext() as context:
-            context.prec = 4
-            return float(Decimal(default_price + overpay_float) * 1)
+    def _get_csm_items_from_response(csm_response: CsmResponse) -> List[CsmItemDTO]:
+        return CsmItemColumns(csm_response.items).to_dtos()
@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class CsmCacheStatsDTO(BaseModel):
+    hits: int
+    misses: int
+    coalesced: int
+    entries: int
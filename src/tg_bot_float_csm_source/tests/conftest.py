@@ -0,0 +1,8 @@
+import pytest
+
+from tg_bot_float_csm_source.csm_source_settings import CsmSourceSettings
+
+
+@pytest.fixture
+def csm_settings() -> CsmSourceSettings:
+    return CsmSourceSettings()  # type: ignore "Load variables from csm_source_variables.env file"
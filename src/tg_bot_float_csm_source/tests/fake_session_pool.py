@@ -0,0 +1,41 @@
+from typing import Any, Dict, List
+from urllib.parse import parse_qs, urlsplit
+
+
+def get_csm_item(item_id: int, overpay_float: float | None = 0.5) -> Dict[str, Any]:
+    """Raw CSM item, its float and price derived from the id."""
+    item: Dict[str, Any] = {
+        "fullName": f"AK-47 | Redline #{item_id}",
+        "float": str(item_id / 1000),
+        "defaultPrice": 10 + item_id,
+    }
+    if overpay_float is not None:
+        item["overpay"] = {"float": overpay_float}
+    return item
+
+
+class FakeCsmResponse:
+    def __init__(self, response_json: Dict[str, Any]) -> None:
+        self._response_json = response_json
+
+    def json(self) -> Dict[str, Any]:
+        return self._response_json
+
+
+class FakeSessionPool:
+    """Serves CSM pages by their `offset` query parameter, `requested_offsets` records the calls.
+
+    An offset missing from `pages` is answered with an empty page.
+    """
+
+    def __init__(self, pages: Dict[int, List[Dict[str, Any]]]) -> None:
+        self.pages = pages
+        self.requested_offsets: List[int] = []
+
+    def get_session(self) -> "FakeSessionPool":
+        return self
+
+    async def get(self, link: str, headers: Dict[str, Any]) -> FakeCsmResponse:
+        offset = int(parse_qs(urlsplit(link).query)["offset"][0])
+        self.requested_offsets.append(offset)
+        return FakeCsmResponse({"items": self.pages.get(offset, [])})
@@ -0,0 +1,91 @@
+from decimal import Decimal, localcontext
+from typing import Any, AsyncGenerator, Dict
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient, ASGITransport
+
+from tg_bot_float_csm_source.csm_source_settings import CsmSourceSettings
+from tg_bot_float_csm_source.dependencies.services import get_csm_service
+from tg_bot_float_csm_source.main import app
+from tg_bot_float_csm_source.services.csm_item_columns import CsmItemColumns
+from tg_bot_float_csm_source.services.csm_response_cache import CsmResponseCache
+from tg_bot_float_csm_source.services.csm_source_exceptions import CsmSourceExceptions
+from tg_bot_float_csm_source.services.csm_source_service import CsmService
+from tg_bot_float_csm_source.tests.fake_session_pool import FakeSessionPool, get_csm_item
+
+
+def get_decimal_price_with_float(default_price: float, overpay_float: float) -> float:
+    """Price with float as CsmService computed it before the columns."""
+    with localcontext() as context:
+        context.prec = 4
+        return float(Decimal(default_price + overpay_float) * 1)
+
+
+@pytest.mark.parametrize(
+    "default_price, overpay_float",
+    [
+        (1.0, 0.125),  # 1.125, an exact tie rounded half to even
+        (1.0, 0.135),  # 1.135, a tie in decimal only
+        (2.0, 0.0005),  # 2.0005
+        (12.0, 0.345),  # 12.345
+        (99.99, 0.005),  # 99.995, just below the tie in binary
+        (999.0, 0.5),  # 999.5, a tie on the fourth digit
+        (9999.0, 0.5),  # 9999.5, rounds up to 10000
+        (12344.0, 1.0),  # 12345, a tie above 10000 rounded down to 12340
+        (12354.0, 1.0),  # 12355, a tie above 10000 rounded up to 12360
+        (123456.0, 0.7),
+        (0.0001234, 0.00004),
+    ],
+)
+def test_price_with_float_rounding_matches_decimal(
+    default_price: float, overpay_float: float
+) -> None:
+    columns = CsmItemColumns(
+        [{"float": "0.1", "defaultPrice": default_price, "overpay": {"float": overpay_float}}]
+    )
+
+    assert columns.get_prices_with_float() == [
+        get_decimal_price_with_float(default_price, overpay_float)
+    ]
+
+
+@pytest.mark.parametrize(
+    "item",
+    [
+        {"fullName": "AK-47 | Redline", "defaultPrice": 10, "overpay": {"float": 0.5}},
+        {**get_csm_item(1), "float": None},
+        {**get_csm_item(1), "defaultPrice": "ten"},
+        {**get_csm_item(1), "overpay": {"float": "much"}},
+        {**get_csm_item(1), "fullName": 47},
+    ],
+    ids=["missing float", "null float", "non-numeric price", "non-numeric overpay", "bad name"],
+)
+def test_bad_item_raises(item: Dict[str, Any]) -> None:
+    with pytest.raises(CsmSourceExceptions) as exc_info:
+        CsmItemColumns([get_csm_item(2), item])
+
+    assert "could not be read" in exc_info.value.msg
+
+
+@pytest_asyncio.fixture
+async def client(csm_settings: CsmSourceSettings) -> AsyncGenerator[AsyncClient, None]:
+    session_pool = FakeSessionPool(
+        {0: [get_csm_item(1), {**get_csm_item(2), "defaultPrice": "ten"}]}
+    )
+    app.dependency_overrides[get_csm_service] = lambda: CsmService(
+        csm_settings, session_pool, CsmResponseCache(csm_settings)  # type: ignore "Fake pool"
+    )
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://localhost") as ac:
+            yield ac
+    finally:
+        app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_bad_item_is_reported_not_a_server_error(client: AsyncClient) -> None:
+    response = await client.get("/AK-47/Redline/Field-Tested/false")
+
+    assert response.status_code != 500
+    assert "could not be read" in response.json()["message"]
@@ -0,0 +1,124 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List
+
+import pytest
+
+from tg_bot_float_csm_source.csm_source_settings import CsmSourceSettings
+from tg_bot_float_csm_source.services import csm_response_cache
+from tg_bot_float_csm_source.services.csm_response_cache import CsmResponseCache
+from tg_bot_float_csm_source.services.dtos.csm_response_dto import CsmResponse
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+class FakeFetch:
+    """Upstream call of the cache, held until `release` is set; counts the calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    def __call__(self, items: List[Dict[str, Any]]) -> Callable[[], Awaitable[CsmResponse]]:
+        async def fetch() -> CsmResponse:
+            self.calls += 1
+            await self.release.wait()
+            return CsmResponse(items=items)
+
+        return fetch
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(csm_response_cache, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def cache(csm_settings: CsmSourceSettings, clock: FakeClock) -> CsmResponseCache:
+    return CsmResponseCache(
+        csm_settings.model_copy(update={"cache_ttl": 32, "cache_max_entries": 2})
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_gets_share_one_fetch(cache: CsmResponseCache) -> None:
+    fetch = FakeFetch()
+    fetch.release.clear()
+
+    waiters = [
+        asyncio.create_task(cache.get_or_fetch("page", fetch([{"id": 1}]))) for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    fetch.release.set()
+    responses = await asyncio.gather(*waiters)
+
+    assert fetch.calls == 1
+    assert all(response.items == [{"id": 1}] for response in responses)
+    stats = cache.get_stats()
+    assert (stats.misses, stats.coalesced, stats.hits, stats.entries) == (1, 4, 0, 1)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_keeps_shared_fetch(cache: CsmResponseCache) -> None:
+    fetch = FakeFetch()
+    fetch.release.clear()
+    cancelled = asyncio.create_task(cache.get_or_fetch("page", fetch([{"id": 1}])))
+    waiter = asyncio.create_task(cache.get_or_fetch("page", fetch([{"id": 2}])))
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    fetch.release.set()
+
+    assert (await waiter).items == [{"id": 1}]
+    assert cancelled.cancelled()
+    assert fetch.calls == 1
+    # The fetch finished for the remaining waiter and was cached
+    assert (await cache.get_or_fetch("page", fetch([{"id": 3}]))).items == [{"id": 1}]
+
+
+@pytest.mark.asyncio
+async def test_entry_expires_after_ttl(cache: CsmResponseCache, clock: FakeClock) -> None:
+    fetch = FakeFetch()
+    await cache.get_or_fetch("page", fetch([{"id": 1}]))
+
+    clock.now = 31.5
+    assert (await cache.get_or_fetch("page", fetch([{"id": 2}]))).items == [{"id": 1}]
+    clock.now = 32
+    assert (await cache.get_or_fetch("page", fetch([{"id": 2}]))).items == [{"id": 2}]
+
+    assert fetch.calls == 2
+    stats = cache.get_stats()
+    assert (stats.misses, stats.coalesced, stats.hits) == (2, 0, 1)
+
+
+@pytest.mark.asyncio
+async def test_oldest_entry_is_evicted(cache: CsmResponseCache) -> None:
+    fetch = FakeFetch()
+    for key in ("first", "second", "third"):
+        await cache.get_or_fetch(key, fetch([{"key": key}]))
+
+    assert cache.get_stats().entries == 2
+    await cache.get_or_fetch("first", fetch([{"key": "refetched"}]))
+    assert fetch.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_is_not_cached(cache: CsmResponseCache) -> None:
+    async def failing_fetch() -> CsmResponse:
+        raise ValueError("upstream failed")
+
+    with pytest.raises(ValueError):
+        await cache.get_or_fetch("page", failing_fetch)
+
+    fetch = FakeFetch()
+    assert (await cache.get_or_fetch("page", fetch([{"id": 1}]))).items == [{"id": 1}]
+    assert fetch.calls == 1
@@ -0,0 +1,103 @@
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from tg_bot_float_csm_source.csm_source_settings import CsmSourceSettings
+from tg_bot_float_csm_source.router_controllers.csm_router_params.csm_params import CsmParams
+from tg_bot_float_csm_source.router_controllers.csm_router_params.csm_scan_params import (
+    CsmScanParams,
+)
+from tg_bot_float_csm_source.services.csm_response_cache import CsmResponseCache
+from tg_bot_float_csm_source.services.csm_source_exceptions import CsmSourceExceptions
+from tg_bot_float_csm_source.services.csm_source_service import CsmService
+from tg_bot_float_csm_source.tests.fake_session_pool import FakeSessionPool, get_csm_item
+
+
+def get_service(
+    csm_settings: CsmSourceSettings, pages: Dict[int, List[Dict[str, Any]]]
+) -> Tuple[CsmService, FakeSessionPool]:
+    # Pages of two items in waves of two pages
+    settings = csm_settings.model_copy(update={"page_limit": 2, "scan_concurrency": 2})
+    session_pool = FakeSessionPool(pages)
+    service = CsmService(
+        settings, session_pool, CsmResponseCache(settings)  # type: ignore "Fake session pool"
+    )
+    return service, session_pool
+
+
+@pytest.fixture
+def scan_params() -> CsmScanParams:
+    return CsmScanParams(
+        weapon="AK-47", skin="Redline", quality="Field-Tested", stattrak=False, pages=6
+    )
+
+
+@pytest.mark.asyncio
+async def test_scan_merges_and_sorts_pages(
+    csm_settings: CsmSourceSettings, scan_params: CsmScanParams
+) -> None:
+    service, session_pool = get_service(
+        csm_settings,
+        {
+            0: [get_csm_item(5), get_csm_item(3)],
+            2: [get_csm_item(4), get_csm_item(3)],
+            4: [get_csm_item(1), get_csm_item(2)],
+            6: [get_csm_item(6), get_csm_item(7)],
+            8: [get_csm_item(8), get_csm_item(9)],
+            10: [get_csm_item(10), get_csm_item(11)],
+        },
+    )
+
+    items = await service.scan_items(scan_params)
+
+    # Item 3 moved between pages and is returned once
+    assert [item.item_float for item in items] == [item_id / 1000 for item_id in range(1, 12)]
+    assert sorted(session_pool.requested_offsets) == [0, 2, 4, 6, 8, 10]
+
+
+@pytest.mark.asyncio
+async def test_empty_page_ends_scan(
+    csm_settings: CsmSourceSettings, scan_params: CsmScanParams
+) -> None:
+    service, session_pool = get_service(
+        csm_settings,
+        {
+            0: [get_csm_item(1), get_csm_item(2)],
+            # The listing ends at offset 2, the next wave is not requested
+            4: [get_csm_item(5), get_csm_item(6)],
+        },
+    )
+
+    items = await service.scan_items(scan_params)
+
+    assert [item.item_float for item in items] == [0.001, 0.002]
+    assert sorted(session_pool.requested_offsets) == [0, 2]
+
+
+@pytest.mark.asyncio
+async def test_page_without_float_overpay_does_not_end_scan(
+    csm_settings: CsmSourceSettings, scan_params: CsmScanParams
+) -> None:
+    service, session_pool = get_service(
+        csm_settings,
+        {
+            0: [get_csm_item(1, overpay_float=None), get_csm_item(2, overpay_float=None)],
+            2: [get_csm_item(3, overpay_float=None)],
+            4: [get_csm_item(5)],
+        },
+    )
+
+    items = await service.scan_items(scan_params)
+
+    assert [item.item_float for item in items] == [0.005]
+    assert sorted(session_pool.requested_offsets) == [0, 2, 4, 6]
+
+
+@pytest.mark.asyncio
+async def test_empty_first_page(csm_settings: CsmSourceSettings) -> None:
+    service, _ = get_service(csm_settings, {})
+
+    with pytest.raises(CsmSourceExceptions):
+        await service.get_items_from_page(
+            CsmParams(weapon="AK-47", skin="Redline", quality="Field-Tested", stattrak=False)
+        )
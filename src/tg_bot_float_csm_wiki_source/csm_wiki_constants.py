@@ -1,2 +1,3 @@
 FORBIDDEN_ERROR_MSG = "Forbidden: Access is denied"
 NO_INFO_ERROR_MSG = "no info about provided skin"
+CATALOG_STORE_CLOSED_ERROR_MSG = "Catalog store is used outside of the app lifespan!"
@@ -11,3 +11,11 @@ class CsmWikiSourceSettings(BaseSettings):
     graphql_url: str
     graphql_query: str
     headers: str
+    graphql_batch_size: int
+    graphql_batch_concurrency: int
+    http2: bool
+    session_count: int
+    session_max_clients: int
+    user_agent_pool_size: int
+    catalog_path: str
+    catalog_fresh_ttl: float
@@ -1,10 +1,14 @@
 from functools import lru_cache
-from typing import Annotated, Any, AsyncGenerator
+from typing import Annotated
 
+from curl_cffi import CurlHttpVersion
 from fastapi import Depends
 
 from tg_bot_float_csm_wiki_source.services.csm_wiki_source_service import CsmWikiSourceService
+from tg_bot_float_csm_wiki_source.services.csm_wiki_catalog_store import CsmWikiCatalogStore
+from tg_bot_float_csm_wiki_source.services.user_agent_pool import UserAgentPool
 from tg_bot_float_csm_wiki_source.csm_wiki_source_settings import CsmWikiSourceSettings
+from tg_bot_float_misc.curl_session_pool.curl_session_pool import CurlSessionPool
 
 
 @lru_cache
@@ -15,11 +19,34 @@ def get_csm_wiki_source_settings() -> CsmWikiSourceSettings:
 CSM_WIKI_SOURCE_SETTINGS = Annotated[CsmWikiSourceSettings, Depends(get_csm_wiki_source_settings)]
 
 
-async def get_csm_wiki_source_service(
-    settings: CSM_WIKI_SOURCE_SETTINGS,
-) -> AsyncGenerator[CsmWikiSourceService, Any]:
-    async with CsmWikiSourceService(settings) as service:
-        yield service
+@lru_cache
+def get_session_pool() -> CurlSessionPool:
+    settings = get_csm_wiki_source_settings()
+    return CurlSessionPool(
+        settings.session_max_clients,
+        session_count=settings.session_count,
+        http_version=CurlHttpVersion.V2_0 if settings.http2 else CurlHttpVersion.V1_1,
+    )
+
+
+@lru_cache
+def get_user_agent_pool() -> UserAgentPool:
+    return UserAgentPool(get_csm_wiki_source_settings())
+
+
+@lru_cache
+def get_catalog_store() -> CsmWikiCatalogStore:
+    return CsmWikiCatalogStore(get_csm_wiki_source_settings())
+
+
+@lru_cache
+def get_csm_wiki_source_service() -> CsmWikiSourceService:
+    return CsmWikiSourceService(
+        get_csm_wiki_source_settings(),
+        get_session_pool(),
+        get_user_agent_pool(),
+        get_catalog_store(),
+    )
 
 
 CSM_WIKI_SKIN_SERVICE = Annotated[CsmWikiSourceService, Depends(get_csm_wiki_source_service)]
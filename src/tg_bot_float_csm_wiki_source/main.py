@@ -1,6 +1,12 @@
-from typing import List
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
 from fastapi import FastAPI
 
+from tg_bot_float_csm_wiki_source.dependencies.services import (
+    get_catalog_store,
+    get_csm_wiki_source_service,
+    get_session_pool,
+)
 from tg_bot_float_csm_wiki_source.router_controllers.csm_wiki_router_controller import (
     CsmWikiRouterController,
 )
@@ -9,9 +15,18 @@ from tg_bot_float_csm_wiki_source.middlewares.error_handling_middleware import (
 )
 from tg_bot_float_misc.router_controller.abstract_router_controller import AbstractRouterController
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Built before the first request, so the user agent pool is loaded at startup
+    get_csm_wiki_source_service()
+    async with get_session_pool(), get_catalog_store():
+        yield
+
+
 router_controllers: List[AbstractRouterController] = [CsmWikiRouterController()]
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 app.add_middleware(ErrorHandlingMiddleware)
 
 for controller in router_controllers:
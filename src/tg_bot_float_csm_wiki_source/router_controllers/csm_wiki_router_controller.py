@@ -1,7 +1,13 @@
+from typing import List
+
 from fastapi import APIRouter
 
 from tg_bot_float_csm_wiki_source.dependencies.services import CSM_WIKI_SKIN_SERVICE
+from tg_bot_float_common_dtos.csm_wiki_source_dtos.csm_wiki_batch_item_dto import (
+    CsmWikiBatchItemDTO,
+)
 from tg_bot_float_common_dtos.csm_wiki_source_dtos.csm_wiki_dto import CsmWikiDTO
+from tg_bot_float_common_dtos.csm_wiki_source_dtos.csm_wiki_skin_dto import CsmWikiSkinDTO
 from tg_bot_float_misc.router_controller.abstract_router_controller import AbstractRouterController
 
 
@@ -11,6 +17,8 @@ class CsmWikiRouterController(AbstractRouterController):
         super().__init__()
 
     def _init_routes(self) -> None:
+        self._router.add_api_route("/catalog", self._get_csm_wiki_catalog, methods=["GET"])
+        self._router.add_api_route("/batch", self._get_csm_wiki_skins_data, methods=["POST"])
         self._router.add_api_route(
             "/{weapon}/{skin}", self._get_csm_wiki_skin_data, methods=["GET"]
         )
@@ -19,3 +27,13 @@ class CsmWikiRouterController(AbstractRouterController):
         self, weapon: str, skin: str, csm_wiki_service: CSM_WIKI_SKIN_SERVICE
     ) -> CsmWikiDTO:
         return await csm_wiki_service.get_weapon_skin_data(weapon, skin)
+
+    async def _get_csm_wiki_skins_data(
+        self, skin_dtos: List[CsmWikiSkinDTO], csm_wiki_service: CSM_WIKI_SKIN_SERVICE
+    ) -> List[CsmWikiBatchItemDTO]:
+        return await csm_wiki_service.get_weapon_skins_data(skin_dtos)
+
+    async def _get_csm_wiki_catalog(
+        self, csm_wiki_service: CSM_WIKI_SKIN_SERVICE
+    ) -> List[CsmWikiBatchItemDTO]:
+        return await csm_wiki_service.get_catalog()
@@ -0,0 +1,126 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Self
+
+from tg_bot_float_common_dtos.csm_wiki_source_dtos.csm_wiki_batch_item_dto import (
+    CsmWikiBatchItemDTO,
+)
+from tg_bot_float_common_dtos.csm_wiki_source_dtos.csm_wiki_dto import CsmWikiDTO
+from tg_bot_float_common_dtos.csm_wiki_source_dtos.csm_wiki_skin_dto import CsmWikiSkinDTO
+from tg_bot_float_csm_wiki_source.csm_wiki_constants import CATALOG_STORE_CLOSED_ERROR_MSG
+from tg_bot_float_csm_wiki_source.csm_wiki_source_settings import CsmWikiSourceSettings
+from tg_bot_float_csm_wiki_source.services.dtos.catalog_entry_dto import CatalogEntryDTO
+
+
+class CsmWikiCatalogStore:
+    """SQLite store of the last known wiki data of every skin, keyed by "{weapon} | {skin}".
+
+    Qualities and StatTrak availability of a skin practically never change, so entries are
+    served even when stale and only revalidated in the background.
+    """
+
+    _create_table_sql = """
+        CREATE TABLE IF NOT EXISTS catalog (
+            name TEXT PRIMARY KEY,
+            weapon TEXT NOT NULL,
+            skin TEXT NOT NULL,
+            csm_wiki TEXT NOT NULL,
+            updated_at REAL NOT NULL
+        )
+    """
+
+    def __init__(self, settings: CsmWikiSourceSettings) -> None:
+        self._path = Path(settings.catalog_path)
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    async def __aenter__(self) -> Self:
+        await asyncio.to_thread(self._connect)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore
+        await asyncio.to_thread(self._close)
+
+    async def get_many(self, skin_dtos: List[CsmWikiSkinDTO]) -> Dict[str, CatalogEntryDTO]:
+        return await asyncio.to_thread(self._get_many, [self.get_name(dto) for dto in skin_dtos])
+
+    async def put_many(self, items: List[CsmWikiBatchItemDTO]) -> None:
+        await asyncio.to_thread(self._put_many, items)
+
+    async def get_catalog(self) -> List[CsmWikiBatchItemDTO]:
+        return await asyncio.to_thread(self._get_catalog)
+
+    @staticmethod
+    def get_name(skin_dto: CsmWikiSkinDTO) -> str:
+        return f"{skin_dto.weapon} | {skin_dto.skin}"
+
+    def _connect(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self._path, check_same_thread=False, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(self._create_table_sql)
+        self._connection = connection
+
+    def _close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            raise RuntimeError(CATALOG_STORE_CLOSED_ERROR_MSG)
+        return self._connection
+
+    def _get_many(self, names: List[str]) -> Dict[str, CatalogEntryDTO]:
+        entries: Dict[str, CatalogEntryDTO] = {}
+        with self._lock:
+            connection = self._get_connection()
+            # Stay below the default SQLite limit of host parameters
+            for start in range(0, len(names), 500):
+                batch = names[start : start + 500]
+                rows = connection.execute(
+                    "SELECT name, csm_wiki, updated_at FROM catalog "
+                    f"WHERE name IN ({', '.join('?' * len(batch))})",
+                    batch,
+                ).fetchall()
+                for name, csm_wiki, updated_at in rows:
+                    entries[name] = CatalogEntryDTO(
+                        csm_wiki=CsmWikiDTO.model_validate_json(csm_wiki), updated_at=updated_at
+                    )
+        return entries
+
+    def _put_many(self, items: List[CsmWikiBatchItemDTO]) -> None:
+        updated_at = time.time()
+        rows = [
+            (
+                self.get_name(item),
+                item.weapon,
+                item.skin,
+                item.csm_wiki.model_dump_json(),
+                updated_at,
+            )
+            for item in items
+            if item.csm_wiki is not None
+        ]
+        with self._lock:
+            self._get_connection().executemany(
+                "INSERT OR REPLACE INTO catalog VALUES (?, ?, ?, ?, ?)", rows
+            )
+
+    def _get_catalog(self) -> List[CsmWikiBatchItemDTO]:
+        with self._lock:
+            rows = (
+                self._get_connection()
+                .execute("SELECT weapon, skin, csm_wiki FROM catalog ORDER BY name")
+                .fetchall()
+            )
+        return [
+            CsmWikiBatchItemDTO(
+                weapon=weapon, skin=skin, csm_wiki=CsmWikiDTO.model_validate_json(csm_wiki)
+            )
+            for weapon, skin, csm_wiki in rows
+        ]
@@ -1,40 +1,147 @@
+import asyncio
 import json
-from typing import Any, Dict, Self, Set
-
-from curl_cffi import CurlHttpVersion
-from curl_cffi.requests import AsyncSession
-from fake_useragent import UserAgent
-
+import logging
+import time
+from typing import Any, Dict, List, Set
 
+from tg_bot_float_common_dtos.csm_wiki_source_dtos.csm_wiki_batch_item_dto import (
+    CsmWikiBatchItemDTO,
+)
 from tg_bot_float_common_dtos.csm_wiki_source_dtos.csm_wiki_dto import CsmWikiDTO
+from tg_bot_float_common_dtos.csm_wiki_source_dtos.csm_wiki_skin_dto import CsmWikiSkinDTO
 from tg_bot_float_csm_wiki_source.csm_wiki_source_exceptions import CsmWikiSourceExceptions
 from tg_bot_float_csm_wiki_source.csm_wiki_source_settings import CsmWikiSourceSettings
+from tg_bot_float_csm_wiki_source.services.csm_wiki_catalog_store import CsmWikiCatalogStore
+from tg_bot_float_csm_wiki_source.services.dtos.catalog_entry_dto import CatalogEntryDTO
+from tg_bot_float_csm_wiki_source.services.user_agent_pool import UserAgentPool
 from tg_bot_float_csm_wiki_source.services.dtos.graphql_item_data_dto import CsmWikiItemDTO
 from tg_bot_float_csm_wiki_source.services.dtos.graphql_response import GraphqlResponse
 from tg_bot_float_csm_wiki_source.services.dtos.graphql_csm_wiki_data_dto import (
     CsmWikiGraphqlDTO,
 )
+from tg_bot_float_misc.curl_session_pool.curl_session_pool import CurlSessionPool
+
+logger = logging.getLogger(__name__)
 
 
 class CsmWikiSourceService:
-    def __init__(self, csm_wiki_source_settings: CsmWikiSourceSettings) -> None:
+    def __init__(
+        self,
+        csm_wiki_source_settings: CsmWikiSourceSettings,
+        session_pool: CurlSessionPool,
+        user_agent_pool: UserAgentPool,
+        catalog_store: CsmWikiCatalogStore,
+    ) -> None:
         self._settings = csm_wiki_source_settings
-
-    async def __aenter__(self) -> Self:
-        self._session = AsyncSession(http_version=CurlHttpVersion.V1_1)
-        return self
-
-    async def __aexit__(self, type, exc, traceback) -> None:
-        await self._session.close()
+        self._session_pool = session_pool
+        self._user_agent_pool = user_agent_pool
+        self._catalog_store = catalog_store
+        self._revalidating_names: Set[str] = set()
+        self._revalidation_tasks: Set[asyncio.Task[None]] = set()
+        self._base_headers: Dict[str, Any] = json.loads(self._settings.headers)
+        graphql_query = json.loads(self._settings.graphql_query, strict=False)
+        self._operation_name: str = graphql_query["operationName"]
+        self._query: str = graphql_query["query"]
+        # Fields requested for one skin, reused by every alias of a batch query
+        field_call = f"{self._operation_name}(name: $name)"
+        self._selection_set = self._query[
+            self._query.index(field_call) + len(field_call) : self._query.rindex("}")
+        ].strip()
 
     @property
     def _headers(self) -> Dict[str, Any]:
-        headers = json.loads(self._settings.headers)
-        headers["user-agent"] = f"{UserAgent().random}"
-        return headers
+        return {**self._base_headers, "user-agent": self._user_agent_pool.get_user_agent()}
 
     async def get_weapon_skin_data(self, weapon: str, skin: str) -> CsmWikiDTO:
-        graphql_response = await self._get_graphql_response(weapon, skin)
+        skin_dto = CsmWikiSkinDTO(weapon=weapon, skin=skin)
+        entry = (await self._catalog_store.get_many([skin_dto])).get(
+            self._catalog_store.get_name(skin_dto)
+        )
+        if entry is None:
+            csm_wiki_dto = await self._fetch_weapon_skin_data(weapon, skin)
+            await self._catalog_store.put_many(
+                [CsmWikiBatchItemDTO(weapon=weapon, skin=skin, csm_wiki=csm_wiki_dto)]
+            )
+            return csm_wiki_dto
+        if self._is_stale(entry):
+            self._revalidate([skin_dto])
+        return entry.csm_wiki
+
+    async def get_weapon_skins_data(
+        self, skin_dtos: List[CsmWikiSkinDTO]
+    ) -> List[CsmWikiBatchItemDTO]:
+        """Known skins are answered from the catalog store, only unknown ones are fetched live."""
+        get_name = self._catalog_store.get_name
+        entries = await self._catalog_store.get_many(skin_dtos)
+        stale_skin_dtos = [
+            skin_dto
+            for skin_dto in skin_dtos
+            if get_name(skin_dto) in entries and self._is_stale(entries[get_name(skin_dto)])
+        ]
+        if stale_skin_dtos:
+            self._revalidate(stale_skin_dtos)
+
+        missing_skin_dtos = {
+            get_name(skin_dto): skin_dto
+            for skin_dto in skin_dtos
+            if get_name(skin_dto) not in entries
+        }
+        fetched_items: Dict[str, CsmWikiBatchItemDTO] = {}
+        if missing_skin_dtos:
+            fetched = await self._fetch_weapon_skins_data(list(missing_skin_dtos.values()))
+            await self._catalog_store.put_many(fetched)
+            fetched_items = {get_name(item): item for item in fetched}
+
+        return [
+            (
+                CsmWikiBatchItemDTO(
+                    weapon=skin_dto.weapon,
+                    skin=skin_dto.skin,
+                    csm_wiki=entries[get_name(skin_dto)].csm_wiki,
+                )
+                if get_name(skin_dto) in entries
+                else fetched_items[get_name(skin_dto)]
+            )
+            for skin_dto in skin_dtos
+        ]
+
+    async def get_catalog(self) -> List[CsmWikiBatchItemDTO]:
+        return await self._catalog_store.get_catalog()
+
+    def _is_stale(self, entry: CatalogEntryDTO) -> bool:
+        return time.time() - entry.updated_at > self._settings.catalog_fresh_ttl
+
+    def _revalidate(self, skin_dtos: List[CsmWikiSkinDTO]) -> None:
+        skin_dtos_by_name = {
+            self._catalog_store.get_name(skin_dto): skin_dto
+            for skin_dto in skin_dtos
+            if self._catalog_store.get_name(skin_dto) not in self._revalidating_names
+        }
+        if not skin_dtos_by_name:
+            return
+        self._revalidating_names.update(skin_dtos_by_name)
+        task = asyncio.create_task(self._revalidate_in_background(skin_dtos_by_name))
+        self._revalidation_tasks.add(task)
+        task.add_done_callback(self._revalidation_tasks.discard)
+
+    async def _revalidate_in_background(
+        self, skin_dtos_by_name: Dict[str, CsmWikiSkinDTO]
+    ) -> None:
+        try:
+            fetched = await self._fetch_weapon_skins_data(list(skin_dtos_by_name.values()))
+            await self._catalog_store.put_many(fetched)
+        except Exception:
+            # The stale entries stay served, the next request for them retries the revalidation
+            logger.warning(
+                "Revalidation of %d csm_wiki catalog entries failed",
+                len(skin_dtos_by_name),
+                exc_info=True,
+            )
+        finally:
+            self._revalidating_names.difference_update(skin_dtos_by_name)
+
+    async def _fetch_weapon_skin_data(self, weapon: str, skin: str) -> CsmWikiDTO:
+        graphql_response = await self._get_graphql_response(self._prep_query(weapon, skin))
         if graphql_response.errors:
             raise CsmWikiSourceExceptions(
                 ", ".join([item["message"] for item in graphql_response.errors])
@@ -42,14 +149,91 @@ class CsmWikiSourceService:
         csm_wiki_graphql_dto = CsmWikiGraphqlDTO.model_validate(graphql_response.data)
         return self._get_csm_wiki_dto(csm_wiki_graphql_dto)
 
+    async def _fetch_weapon_skins_data(
+        self, skin_dtos: List[CsmWikiSkinDTO]
+    ) -> List[CsmWikiBatchItemDTO]:
+        """Get data of many skins with `graphql_batch_size` aliased fields per GraphQL request.
+
+        Errors of a single skin are returned in its item, errors of a whole request are raised.
+        """
+        batch_size = self._settings.graphql_batch_size
+        semaphore = asyncio.Semaphore(self._settings.graphql_batch_concurrency)
+
+        async def get_batch(batch: List[CsmWikiSkinDTO]) -> List[CsmWikiBatchItemDTO]:
+            async with semaphore:
+                return await self._get_batch_data(batch)
+
+        batches = await asyncio.gather(
+            *(
+                get_batch(skin_dtos[start : start + batch_size])
+                for start in range(0, len(skin_dtos), batch_size)
+            )
+        )
+        return [item for batch in batches for item in batch]
+
+    async def _get_batch_data(self, skin_dtos: List[CsmWikiSkinDTO]) -> List[CsmWikiBatchItemDTO]:
+        graphql_response = await self._get_graphql_response(self._prep_batch_query(skin_dtos))
+        errors_by_alias: Dict[str, List[str]] = {}
+        for error in graphql_response.errors:
+            if not error.get("path"):
+                raise CsmWikiSourceExceptions(error["message"])
+            errors_by_alias.setdefault(str(error["path"][0]), []).append(error["message"])
+
+        batch_items: List[CsmWikiBatchItemDTO] = []
+        for index, skin_dto in enumerate(skin_dtos):
+            alias = self._get_alias(index)
+            if alias in errors_by_alias:
+                batch_items.append(
+                    CsmWikiBatchItemDTO(
+                        weapon=skin_dto.weapon,
+                        skin=skin_dto.skin,
+                        error=", ".join(errors_by_alias[alias]),
+                    )
+                )
+                continue
+            csm_wiki_graphql_dto = CsmWikiGraphqlDTO(
+                get_min_available=graphql_response.data.get(alias) or []
+            )
+            batch_items.append(
+                CsmWikiBatchItemDTO(
+                    weapon=skin_dto.weapon,
+                    skin=skin_dto.skin,
+                    csm_wiki=self._get_csm_wiki_dto(csm_wiki_graphql_dto),
+                )
+            )
+        return batch_items
+
     def _prep_query(self, weapon: str, skin: str) -> Dict[str, Any]:
-        graphql_query = json.loads(self._settings.graphql_query, strict=False)
-        graphql_query["variables"]["name"] = f"{weapon} | {skin}"
-        return graphql_query
+        return {
+            "operationName": self._operation_name,
+            "variables": {"name": f"{weapon} | {skin}"},
+            "query": self._query,
+        }
+
+    def _prep_batch_query(self, skin_dtos: List[CsmWikiSkinDTO]) -> Dict[str, Any]:
+        operation_name = f"{self._operation_name}_batch"
+        variables = {
+            f"name{index}": f"{skin_dto.weapon} | {skin_dto.skin}"
+            for index, skin_dto in enumerate(skin_dtos)
+        }
+        definitions = ", ".join(f"${variable}: String!" for variable in variables)
+        fields = "\n".join(
+            f"  {self._get_alias(index)}: {self._operation_name}(name: $name{index}) "
+            f"{self._selection_set}"
+            for index in range(len(skin_dtos))
+        )
+        return {
+            "operationName": operation_name,
+            "variables": variables,
+            "query": f"query {operation_name}({definitions}) {{\n{fields}\n}}",
+        }
+
+    @staticmethod
+    def _get_alias(index: int) -> str:
+        return f"item{index}"
 
-    async def _get_graphql_response(self, weapon: str, skin: str) -> GraphqlResponse:
-        graphql_query = self._prep_query(weapon, skin)
-        response = await self._session.post(
+    async def _get_graphql_response(self, graphql_query: Dict[str, Any]) -> GraphqlResponse:
+        response = await self._session_pool.get_session().post(
             self._settings.base_url + self._settings.graphql_url,
             json=graphql_query,
             headers=self._headers,
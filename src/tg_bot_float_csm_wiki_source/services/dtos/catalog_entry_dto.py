@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+from tg_bot_float_common_dtos.csm_wiki_source_dtos.csm_wiki_dto import CsmWikiDTO
+
+
+class CatalogEntryDTO(BaseModel):
+    csm_wiki: CsmWikiDTO
+    updated_at: float
@@ -0,0 +1,18 @@
+import itertools
+
+from fake_useragent import UserAgent
+
+from tg_bot_float_csm_wiki_source.csm_wiki_source_settings import CsmWikiSourceSettings
+
+
+class UserAgentPool:
+    """User agents sampled once at startup, so the browser database is loaded only once."""
+
+    def __init__(self, settings: CsmWikiSourceSettings) -> None:
+        user_agent = UserAgent()
+        self._rotation = itertools.cycle(
+            [user_agent.random for _ in range(settings.user_agent_pool_size)]
+        )
+
+    def get_user_agent(self) -> str:
+        return next(self._rotation)
@@ -0,0 +1,9 @@
+import pytest
+
+from tg_bot_float_csm_wiki_source.csm_wiki_source_settings import CsmWikiSourceSettings
+
+
+@pytest.fixture
+def csm_wiki_settings() -> CsmWikiSourceSettings:
+    settings = CsmWikiSourceSettings()  # type: ignore "Load variables from csm_wiki_source_variables.env file"
+    return settings.model_copy(update={"user_agent_pool_size": 2})
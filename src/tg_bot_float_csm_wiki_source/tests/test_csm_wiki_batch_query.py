@@ -0,0 +1,126 @@
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from tg_bot_float_common_dtos.csm_wiki_source_dtos.csm_wiki_dto import CsmWikiDTO
+from tg_bot_float_common_dtos.csm_wiki_source_dtos.csm_wiki_skin_dto import CsmWikiSkinDTO
+from tg_bot_float_csm_wiki_source.csm_wiki_source_exceptions import CsmWikiSourceExceptions
+from tg_bot_float_csm_wiki_source.csm_wiki_source_settings import CsmWikiSourceSettings
+from tg_bot_float_csm_wiki_source.services.csm_wiki_catalog_store import CsmWikiCatalogStore
+from tg_bot_float_csm_wiki_source.services.csm_wiki_source_service import CsmWikiSourceService
+from tg_bot_float_csm_wiki_source.services.user_agent_pool import UserAgentPool
+
+SKIN_DTOS = [
+    CsmWikiSkinDTO(weapon="AK-47", skin="Redline"),
+    CsmWikiSkinDTO(weapon="AWP", skin="Gone"),
+    CsmWikiSkinDTO(weapon="M4A4", skin="Howl"),
+]
+
+# item1 failed on the wiki, item2 came back null
+BATCH_RESPONSE: Dict[str, Any] = {
+    "data": {
+        "item0": [
+            {"name": "AK-47 | Redline (Field-Tested)", "isStatTrack": False},
+            {"name": "StatTrak™ AK-47 | Redline (Minimal Wear)", "isStatTrack": True},
+        ],
+        "item1": None,
+        "item2": None,
+    },
+    "errors": [
+        {"message": "Item not found", "path": ["item1"]},
+        {"message": "Timeout", "path": ["item1", 0, "source"]},
+    ],
+}
+
+
+class FakeGraphqlResponse:
+    def __init__(self, response_json: Dict[str, Any]) -> None:
+        self._response_json = response_json
+
+    def json(self) -> Dict[str, Any]:
+        return self._response_json
+
+
+class FakeSessionPool:
+    """Answers every GraphQL request with `response_json`, `posted` records the request bodies."""
+
+    def __init__(self, response_json: Dict[str, Any]) -> None:
+        self.response_json = response_json
+        self.posted: List[Dict[str, Any]] = []
+
+    def get_session(self) -> "FakeSessionPool":
+        return self
+
+    async def post(
+        self, url: str, json: Dict[str, Any], headers: Dict[str, Any]
+    ) -> FakeGraphqlResponse:
+        self.posted.append(json)
+        return FakeGraphqlResponse(self.response_json)
+
+
+def get_service(
+    settings: CsmWikiSourceSettings, response_json: Dict[str, Any]
+) -> Tuple[CsmWikiSourceService, FakeSessionPool]:
+    session_pool = FakeSessionPool(response_json)
+    service = CsmWikiSourceService(
+        settings,
+        session_pool,  # type: ignore "Fake session pool"
+        UserAgentPool(settings),
+        CsmWikiCatalogStore(settings),
+    )
+    return service, session_pool
+
+
+@pytest.mark.asyncio
+async def test_batch_query_aliases_every_skin(csm_wiki_settings: CsmWikiSourceSettings) -> None:
+    service, session_pool = get_service(csm_wiki_settings, BATCH_RESPONSE)
+
+    await service._get_batch_data(SKIN_DTOS)
+
+    (graphql_query,) = session_pool.posted
+    assert graphql_query["operationName"] == "get_min_available_batch"
+    assert graphql_query["variables"] == {
+        "name0": "AK-47 | Redline",
+        "name1": "AWP | Gone",
+        "name2": "M4A4 | Howl",
+    }
+    query = graphql_query["query"]
+    assert query.startswith(
+        "query get_min_available_batch($name0: String!, $name1: String!, $name2: String!) {"
+    )
+    for index in range(3):
+        assert f"item{index}: get_min_available(name: $name{index}) {{" in query
+    assert query.count("bestPrice") == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_response_maps_errored_and_null_aliases(
+    csm_wiki_settings: CsmWikiSourceSettings,
+) -> None:
+    service, _ = get_service(csm_wiki_settings, BATCH_RESPONSE)
+
+    redline, gone, howl = await service._get_batch_data(SKIN_DTOS)
+
+    assert (redline.weapon, redline.skin, redline.error) == ("AK-47", "Redline", None)
+    assert redline.csm_wiki is not None
+    assert sorted(redline.csm_wiki.qualities) == ["Field-Tested", "Minimal Wear"]
+    assert redline.csm_wiki.stattrak_existence
+    # Every error of the errored alias is kept, its data is not read
+    assert (gone.weapon, gone.skin) == ("AWP", "Gone")
+    assert gone.error == "Item not found, Timeout"
+    assert gone.csm_wiki is None
+    # A null alias is a skin the wiki has no listings of
+    assert howl.error is None
+    assert howl.csm_wiki == CsmWikiDTO(qualities=[], stattrak_existence=False)
+
+
+@pytest.mark.asyncio
+async def test_batch_request_error_raises(csm_wiki_settings: CsmWikiSourceSettings) -> None:
+    service, _ = get_service(
+        csm_wiki_settings, {"data": {}, "errors": [{"message": "Query is too complex"}]}
+    )
+
+    with pytest.raises(CsmWikiSourceExceptions) as exc_info:
+        await service._get_batch_data(SKIN_DTOS)
+
+    assert exc_info.value.message == "Query is too complex"
@@ -1,6 +1,10 @@
 from fastapi import APIRouter, Request
 
+from tg_bot_float_common_dtos.update_db_scheduler_dtos.source_data_delta_dto import (
+    SourceDataDeltaDTO,
+)
 from tg_bot_float_db_app.api.dependencies.db_service_factory import BOT_DB_SERVICE_FACTORY
+from tg_bot_float_db_app.database.services.dtos.db_refresher_dtos import DbRefreshReportDTO
 from tg_bot_float_misc.router_controller.abstract_router_controller import (
     AbstractRouterController,
 )
@@ -13,8 +17,18 @@ class DBRouterController(AbstractRouterController):
 
     def _init_routes(self):
         self._router.add_api_route("/update_db", self._update_db, methods=["POST"])
+        self._router.add_api_route("/apply_delta", self._apply_delta, methods=["POST"])
+
+    async def _update_db(
+        self, request: Request, service_factory: BOT_DB_SERVICE_FACTORY
+    ) -> DbRefreshReportDTO:
+        async with service_factory:
+            db_refresher_service = service_factory.get_db_refresher_service()
+            return await db_refresher_service.update(request.stream())
 
-    async def _update_db(self, request: Request, service_factory: BOT_DB_SERVICE_FACTORY) -> None:
+    async def _apply_delta(
+        self, delta_dto: SourceDataDeltaDTO, service_factory: BOT_DB_SERVICE_FACTORY
+    ) -> DbRefreshReportDTO:
         async with service_factory:
             db_refresher_service = service_factory.get_db_refresher_service()
-            await db_refresher_service.update(await request.body())
+            return await db_refresher_service.apply_delta(delta_dto)
@@ -1,3 +1,7 @@
 class BotDbException(Exception):
     def __init__(self, msg: str):
         self.msg = msg
+
+
+class BotDbConflictException(BotDbException):
+    pass
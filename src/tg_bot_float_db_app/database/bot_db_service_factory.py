@@ -9,6 +9,7 @@ from tg_bot_float_db_app.database.services.relation_service import RelationServi
 from tg_bot_float_db_app.database.services.user_service import UserService
 from tg_bot_float_db_app.database.services.subscription_service import SubscriptionService
 from tg_bot_float_db_app.database.services.bot_db_refresher_service import BotDBRefresherService
+from tg_bot_float_db_app.database.services.catalog_bulk_service import CatalogBulkService
 
 
 class BotDbServiceFactory:
@@ -49,18 +50,10 @@ class BotDbServiceFactory:
     def get_relation_service(self) -> RelationService:
         return RelationService(self._session)
 
+    def get_catalog_bulk_service(self) -> CatalogBulkService:
+        return CatalogBulkService(self._session)
+
     def get_db_refresher_service(self) -> BotDBRefresherService:
-        weapon_service = self.get_weapon_service()
-        skin_service = self.get_skin_service()
-        quality_service = self.get_quality_service()
+        catalog_bulk_service = self.get_catalog_bulk_service()
         relation_service = self.get_relation_service()
-        glove_service = self.get_glove_service()
-        agent_service = self.get_agent_service()
-        return BotDBRefresherService(
-            weapon_service,
-            skin_service,
-            quality_service,
-            relation_service,
-            glove_service,
-            agent_service,
-        )
+        return BotDBRefresherService(catalog_bulk_service, relation_service)
@@ -10,6 +10,7 @@ from tg_bot_float_db_app.database.models.subscription_model import SubscriptionM
 from tg_bot_float_db_app.database.models.user_model import UserModel
 from tg_bot_float_db_app.database.models.skin_model import SkinModel
 from tg_bot_float_db_app.database.models.relation_model import RelationModel
+from tg_bot_float_db_app.database.models.catalog_state_model import CatalogStateModel
 from tg_bot_float_db_app.db_settings import DBSettings
 
 
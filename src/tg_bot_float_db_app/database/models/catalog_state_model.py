@@ -0,0 +1,12 @@
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from tg_bot_float_db_app.database.models.base import Base
+
+
+class CatalogStateModel(Base):
+    __tablename__ = "catalog_state"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, nullable=False, unique=True)
+
+    snapshot_hash: Mapped[str] = mapped_column(String, nullable=False)
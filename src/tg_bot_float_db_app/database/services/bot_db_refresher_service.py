@@ -1,253 +1,316 @@
-import pickle
-from typing import List
+import asyncio
+from typing import AsyncIterator, Dict, Iterable, List, Set, Tuple
 
-import brotli
-
-
-from tg_bot_float_common_dtos.update_db_scheduler_dtos.agent_relation_dto import AgentRelationDTO
-from tg_bot_float_common_dtos.update_db_scheduler_dtos.glove_relation_dto import GloveRelationDTO
-from tg_bot_float_common_dtos.update_db_scheduler_dtos.relation_data_dto import RelationDataDTO
-from tg_bot_float_common_dtos.update_db_scheduler_dtos.source_data_tree_dto import SourceDataTreeDTO
-from tg_bot_float_db_app.database.services.agent_service import AgentService
+from tg_bot_float_common_dtos.update_db_scheduler_dtos.source_data_delta_dto import (
+    SourceDataDeltaDTO,
+)
+from tg_bot_float_common_dtos.update_db_scheduler_dtos.source_data_names_dto import (
+    SourceDataNamesDTO,
+)
+from tg_bot_float_common_dtos.update_db_scheduler_dtos.source_data_tables_dto import (
+    SourceDataTablesDTO,
+)
+from tg_bot_float_db_app.bot_db_exception import BotDbConflictException, BotDbException
+from tg_bot_float_db_app.database.models.agent_model import AgentModel
+from tg_bot_float_db_app.database.models.glove_model import GloveModel
+from tg_bot_float_db_app.database.models.quality_model import QualityModel
+from tg_bot_float_db_app.database.models.skin_model import SkinModel
+from tg_bot_float_db_app.database.models.weapon_model import WeaponModel
+from tg_bot_float_db_app.database.services.catalog_bulk_service import (
+    NAMED_MODEL,
+    SKIN_OWNER_IDS,
+    CatalogBulkService,
+)
 from tg_bot_float_db_app.database.services.dtos.db_refresher_dtos import (
-    CreateDeleteDTO,
+    DbRefreshReportDTO,
     IdRelationsCreateDeleteDTO,
+    RefreshCountDTO,
+)
+from tg_bot_float_db_app.database.services.relation_service import RELATION_IDS, RelationService
+from tg_bot_float_db_app.db_app_constants import CATALOG_SNAPSHOT_CONFLICT_ERROR_MSG
+from tg_bot_float_misc.source_data_tree_codec.source_data_snapshot import SourceDataSnapshot
+from tg_bot_float_misc.source_data_tree_codec.source_data_tree_codec import SourceDataTreeDecoder
+from tg_bot_float_misc.source_data_tree_codec.source_data_tree_codec_exception import (
+    SourceDataTreeCodecException,
 )
-from tg_bot_float_db_app.database.services.glove_service import GloveService
-from tg_bot_float_db_app.database.services.quality_service import QualityService
-from tg_bot_float_db_app.database.services.relation_service import RelationService
-from tg_bot_float_db_app.database.services.skin_service import SkinService
-from tg_bot_float_db_app.database.services.weapon_service import WeaponService
-
-from tg_bot_float_common_dtos.schema_dtos.weapon_dto import WeaponDTO
-from tg_bot_float_common_dtos.schema_dtos.skin_dto import SkinDTO
-from tg_bot_float_common_dtos.schema_dtos.quality_dto import QualityDTO
-from tg_bot_float_common_dtos.schema_dtos.agent_dto import AgentDTO
-from tg_bot_float_common_dtos.schema_dtos.glove_dto import GloveDTO
-from tg_bot_float_common_dtos.schema_dtos.relation_dto import RelationDTO
 
 
 class BotDBRefresherService:
+    _relations_chunk_size = 5000
+
     def __init__(
         self,
-        weapon_service: WeaponService,
-        skin_service: SkinService,
-        quality_service: QualityService,
+        catalog_bulk_service: CatalogBulkService,
         relation_service: RelationService,
-        glove_service: GloveService,
-        agent_service: AgentService,
     ):
-        self._weapon_service = weapon_service
-        self._skin_service = skin_service
-        self._quality_service = quality_service
+        self._catalog_bulk_service = catalog_bulk_service
         self._relation_service = relation_service
-        self._glove_service = glove_service
-        self._agent_service = agent_service
 
-    async def update(self, request: bytes) -> None:
+    async def update(self, request_stream: AsyncIterator[bytes]) -> DbRefreshReportDTO:
         """Update Weapon, Skin, Quality, Relations tables in database.
 
         Args:
-            request (bytes): an object of SourceDataTreeDTO, pickled and compressed with brotli
+            request_stream (AsyncIterator[bytes]): chunks of SourceDataTreeDTO encoded with
+                SourceDataTreeEncoder
+
+        Returns:
+            DbRefreshReportDTO: how many rows were created, deleted and left unchanged
         """
-        db_dto = self._deserialize_request(request)
-        await self._update_tables(db_dto)
+        db_dto = await self._decode_request(request_stream)
+        snapshot = await asyncio.to_thread(SourceDataSnapshot.from_tables, db_dto)
+        return await self._update_tables(db_dto, snapshot.hash)
+
+    async def apply_delta(self, delta_dto: SourceDataDeltaDTO) -> DbRefreshReportDTO:
+        """Apply only the rows changed since the snapshot the database was last updated to.
+
+        Args:
+            delta_dto (SourceDataDeltaDTO): rows added and removed between two source snapshots
+
+        Raises:
+            BotDbConflictException: database is not at `delta_dto.base_hash`, full update required
+
+        Returns:
+            DbRefreshReportDTO: how many rows were created and deleted
+        """
+        async with self._catalog_bulk_service.transaction():
+            actual_hash = await self._catalog_bulk_service.get_snapshot_hash()
+            if actual_hash != delta_dto.base_hash:
+                raise BotDbConflictException(
+                    CATALOG_SNAPSHOT_CONFLICT_ERROR_MSG.format(
+                        actual_hash=actual_hash, base_hash=delta_dto.base_hash
+                    )
+                )
+            # Skins are unlinked from removed gloves and agents before those are deleted,
+            # otherwise the delete would cascade to the skins
+            relations_deleted = await self._remove_delta_relations(delta_dto.removed)
+            names_deleted = await self._remove_delta_names(delta_dto.removed)
+            names_created = await self._add_delta_names(delta_dto.added)
+            relations_created = await self._add_delta_relations(delta_dto.added)
+            await self._catalog_bulk_service.set_snapshot_hash(delta_dto.target_hash)
+        names_count = {
+            model: RefreshCountDTO(created=names_created[model], deleted=names_deleted[model])
+            for model in names_created
+        }
+        return DbRefreshReportDTO(
+            weapons=names_count[WeaponModel],
+            skins=names_count[SkinModel],
+            qualities=names_count[QualityModel],
+            gloves=names_count[GloveModel],
+            agents=names_count[AgentModel],
+            relations=RefreshCountDTO(created=relations_created, deleted=relations_deleted),
+        )
 
     @staticmethod
-    def _deserialize_request(request: bytes) -> SourceDataTreeDTO:
-        to_unpickle = brotli.decompress(request)  # type: ignore
-        return pickle.loads(to_unpickle)  # type: ignore
-
-    async def _update_tables(self, db_dto: SourceDataTreeDTO) -> None:
-        await self._update_weapons(db_dto.weapons)
-        await self._update_skins(db_dto.skins)
-        await self._update_qualities(db_dto.qualities)
-        await self._update_relations(db_dto.relations)
-        await self._update_gloves(db_dto.gloves)
-        await self._update_agents(db_dto.agents)
-        await self._update_glove_relations(db_dto.glove_relations)
-        await self._update_agent_relations(db_dto.agent_relations)
-
-    async def _update_weapons(self, weapons: List[WeaponDTO]) -> None:
-        create_delete_dto = await self._get_weapon_create_delete_dto(weapons)
-
-        if to_delete := create_delete_dto.names_to_delete:
-            await self._weapon_service.delete_many_by_name(to_delete)
-
-        if to_create := create_delete_dto.dtos_to_create:
-            weapon_db_models = await self._weapon_service.create_many(
-                list(create_delete_dto.dtos_to_create.values())
+    async def _decode_request(request_stream: AsyncIterator[bytes]) -> SourceDataTablesDTO:
+        decoder = SourceDataTreeDecoder()
+        try:
+            async for chunk in request_stream:
+                await asyncio.to_thread(decoder.feed, chunk)
+            return decoder.finish()
+        except SourceDataTreeCodecException as exc:
+            raise BotDbException(exc.msg) from exc
+
+    async def _update_tables(
+        self, db_dto: SourceDataTablesDTO, snapshot_hash: str
+    ) -> DbRefreshReportDTO:
+        async with self._catalog_bulk_service.transaction():
+            gloves = await self._catalog_bulk_service.reconcile_names(GloveModel, db_dto.gloves)
+            agents = await self._catalog_bulk_service.reconcile_names(AgentModel, db_dto.agents)
+            weapons = await self._catalog_bulk_service.reconcile_names(WeaponModel, db_dto.weapons)
+            skins = await self._catalog_bulk_service.reconcile_names(SkinModel, db_dto.skins)
+            qualities = await self._catalog_bulk_service.reconcile_names(
+                QualityModel, db_dto.qualities
             )
-
-            for weapon_db_model in weapon_db_models:
-                to_create[weapon_db_model.name].id = weapon_db_model.id
-
-    async def _get_weapon_create_delete_dto(
-        self, weapons: List[WeaponDTO]
-    ) -> CreateDeleteDTO[WeaponDTO]:
-        weapon_dtos_to_create = {weapon.name: weapon for weapon in weapons if weapon.name}
-        weapon_names_to_delete: List[str] = []
-        for weapon_db_model in await self._weapon_service.get_all():
-            if weapon_dto := weapon_dtos_to_create.pop(weapon_db_model.name, None):
-                weapon_dto.id = weapon_db_model.id
-            else:
-                weapon_names_to_delete.append(weapon_db_model.name)
-        return CreateDeleteDTO(
-            dtos_to_create=weapon_dtos_to_create, names_to_delete=weapon_names_to_delete
+            skin_ids = self._get_ids_by_index(db_dto.skins, skins.ids_by_name)
+            relations_count = await self._update_relations(
+                db_dto.relations,
+                self._get_ids_by_index(db_dto.weapons, weapons.ids_by_name),
+                skin_ids,
+                self._get_ids_by_index(db_dto.qualities, qualities.ids_by_name),
+            )
+            await self._catalog_bulk_service.link_skins_to_gloves(
+                self._get_skin_owner_ids(
+                    db_dto.glove_relations,
+                    self._get_ids_by_index(db_dto.gloves, gloves.ids_by_name),
+                    skin_ids,
+                )
+            )
+            await self._catalog_bulk_service.link_skins_to_agents(
+                self._get_skin_owner_ids(
+                    db_dto.agent_relations,
+                    self._get_ids_by_index(db_dto.agents, agents.ids_by_name),
+                    skin_ids,
+                )
+            )
+            await self._catalog_bulk_service.set_snapshot_hash(snapshot_hash)
+        return DbRefreshReportDTO(
+            weapons=weapons.count,
+            skins=skins.count,
+            qualities=qualities.count,
+            gloves=gloves.count,
+            agents=agents.count,
+            relations=relations_count,
         )
 
-    async def _update_skins(self, skins: List[SkinDTO]) -> None:
-        create_delete_dto = await self._get_skin_create_delete_dto(skins)
+    async def _remove_delta_relations(self, removed: SourceDataNamesDTO) -> int:
+        ids_by_name = await self._get_delta_ids_by_name(removed)
+        relations_ids = self._get_delta_relations_ids(removed, ids_by_name)
+        deleted_count = await self._catalog_bulk_service.delete_relations(relations_ids)
 
-        if to_delete := create_delete_dto.names_to_delete:
-            await self._skin_service.delete_many_by_name(to_delete)
+        await self._catalog_bulk_service.unlink_skins_from_gloves(
+            self._get_delta_skin_owner_ids(
+                removed.glove_relations, ids_by_name[GloveModel], ids_by_name[SkinModel]
+            )
+        )
+        await self._catalog_bulk_service.unlink_skins_from_agents(
+            self._get_delta_skin_owner_ids(
+                removed.agent_relations, ids_by_name[AgentModel], ids_by_name[SkinModel]
+            )
+        )
+        return deleted_count
+
+    async def _remove_delta_names(self, removed: SourceDataNamesDTO) -> Dict[NAMED_MODEL, int]:
+        return {
+            model: await self._catalog_bulk_service.delete_names(model, names)
+            for model, names in self._get_delta_names(removed).items()
+        }
+
+    async def _add_delta_names(self, added: SourceDataNamesDTO) -> Dict[NAMED_MODEL, int]:
+        return {
+            model: await self._catalog_bulk_service.insert_names(model, names)
+            for model, names in self._get_delta_names(added).items()
+        }
+
+    async def _add_delta_relations(self, added: SourceDataNamesDTO) -> int:
+        ids_by_name = await self._get_delta_ids_by_name(added)
+        relations_ids = self._get_delta_relations_ids(added, ids_by_name)
+        await self._catalog_bulk_service.create_relations(relations_ids)
+
+        await self._catalog_bulk_service.link_skins_to_gloves(
+            self._get_delta_skin_owner_ids(
+                added.glove_relations, ids_by_name[GloveModel], ids_by_name[SkinModel]
+            )
+        )
+        await self._catalog_bulk_service.link_skins_to_agents(
+            self._get_delta_skin_owner_ids(
+                added.agent_relations, ids_by_name[AgentModel], ids_by_name[SkinModel]
+            )
+        )
+        return len(relations_ids)
+
+    async def _get_delta_ids_by_name(
+        self, names_dto: SourceDataNamesDTO
+    ) -> Dict[NAMED_MODEL, Dict[str, int]]:
+        """Ids of every name referenced by relation rows of the delta."""
+        names: Dict[NAMED_MODEL, Set[str]] = {
+            model: set() for model in (GloveModel, AgentModel, WeaponModel, SkinModel, QualityModel)
+        }
+        for weapon, skin, quality, _ in names_dto.relations:
+            names[WeaponModel].add(weapon)
+            names[SkinModel].add(skin)
+            names[QualityModel].add(quality)
+        for glove, skin in names_dto.glove_relations:
+            names[GloveModel].add(glove)
+            names[SkinModel].add(skin)
+        for agent, skin in names_dto.agent_relations:
+            names[AgentModel].add(agent)
+            names[SkinModel].add(skin)
+        return {
+            model: await self._catalog_bulk_service.get_ids_by_name(model, sorted(model_names))
+            for model, model_names in names.items()
+        }
 
-        if to_create := create_delete_dto.dtos_to_create:
-            skin_db_models = await self._skin_service.create_many(list(to_create.values()))
+    @staticmethod
+    def _get_delta_names(names_dto: SourceDataNamesDTO) -> Dict[NAMED_MODEL, List[str]]:
+        return {
+            GloveModel: names_dto.gloves,
+            AgentModel: names_dto.agents,
+            WeaponModel: names_dto.weapons,
+            SkinModel: names_dto.skins,
+            QualityModel: names_dto.qualities,
+        }
 
-            for skin_db_model in skin_db_models:
-                to_create[skin_db_model.name].id = skin_db_model.id
+    @staticmethod
+    def _get_delta_relations_ids(
+        names_dto: SourceDataNamesDTO, ids_by_name: Dict[NAMED_MODEL, Dict[str, int]]
+    ) -> List[RELATION_IDS]:
+        # Rows referencing a name missing from the database were already removed with it
+        weapon_ids, skin_ids = ids_by_name[WeaponModel], ids_by_name[SkinModel]
+        quality_ids = ids_by_name[QualityModel]
+        return [
+            (weapon_ids[weapon], skin_ids[skin], quality_ids[quality], stattrak_existence)
+            for weapon, skin, quality, stattrak_existence in names_dto.relations
+            if weapon in weapon_ids and skin in skin_ids and quality in quality_ids
+        ]
 
-    async def _get_skin_create_delete_dto(self, skins: List[SkinDTO]) -> CreateDeleteDTO[SkinDTO]:
-        skin_dtos_to_create = {skin.name: skin for skin in skins if skin.name}
-        skin_names_to_delete: List[str] = []
-        for skin_db_model in await self._skin_service.get_all():
-            if skin_dto := skin_dtos_to_create.pop(skin_db_model.name, None):
-                skin_dto.id = skin_db_model.id
-            else:
-                skin_names_to_delete.append(skin_db_model.name)
-        return CreateDeleteDTO(
-            dtos_to_create=skin_dtos_to_create, names_to_delete=skin_names_to_delete
-        )
+    @staticmethod
+    def _get_delta_skin_owner_ids(
+        owner_relations: Iterable[Tuple[str, str]],
+        owner_ids: Dict[str, int],
+        skin_ids: Dict[str, int],
+    ) -> List[SKIN_OWNER_IDS]:
+        return [
+            (skin_ids[skin], owner_ids[owner])
+            for owner, skin in owner_relations
+            if owner in owner_ids and skin in skin_ids
+        ]
 
-    async def _update_qualities(self, qualities: List[QualityDTO]) -> None:
-        create_delete_dto = await self._get_quality_create_delete_dto(qualities)
-
-        if to_delete := create_delete_dto.names_to_delete:
-            await self._quality_service.delete_many_by_name(to_delete)
-
-        if to_create := create_delete_dto.dtos_to_create:
-            quality_db_models = await self._quality_service.create_many(list(to_create.values()))
-
-            for quality_db_model in quality_db_models:
-                to_create[quality_db_model.name].id = quality_db_model.id
-
-    async def _get_quality_create_delete_dto(
-        self, qualities: List[QualityDTO]
-    ) -> CreateDeleteDTO[QualityDTO]:
-        quality_dtos_to_create = {quality.name: quality for quality in qualities if quality.name}
-        quality_names_to_delete: List[str] = []
-        for quality_db_model in await self._quality_service.get_all():
-            if quality_dto := quality_dtos_to_create.pop(quality_db_model.name, None):
-                quality_dto.id = quality_db_model.id
-            else:
-                quality_names_to_delete.append(quality_db_model.name)
-        return CreateDeleteDTO(
-            dtos_to_create=quality_dtos_to_create, names_to_delete=quality_names_to_delete
+    async def _update_relations(
+        self,
+        relations: List[Tuple[int, int, int, bool]],
+        weapon_ids: List[int],
+        skin_ids: List[int],
+        quality_ids: List[int],
+    ) -> RefreshCountDTO:
+        id_relations_create_delete_dto = await self._get_ids_relations_create_delete_dto(
+            relations, weapon_ids, skin_ids, quality_ids
         )
-
-    async def _update_relations(self, relations: List[RelationDataDTO]) -> None:
-        id_relations_create_delete_dto = await self._get_ids_relations_create_delete_dto(relations)
         if to_delete := id_relations_create_delete_dto.ids_relations_to_delete:
-            await self._relation_service.delete_many_by_id(to_delete)
+            await self._catalog_bulk_service.delete_relations(to_delete)
 
         if to_create := id_relations_create_delete_dto.ids_relations_to_create:
-            await self._relation_service.create_many(to_create)
+            await self._catalog_bulk_service.create_relations(to_create)
+
+        return RefreshCountDTO(
+            created=len(to_create),
+            deleted=len(to_delete),
+            unchanged=id_relations_create_delete_dto.unchanged_count,
+        )
 
     async def _get_ids_relations_create_delete_dto(
-        self, relations: List[RelationDataDTO]
+        self,
+        relations: List[Tuple[int, int, int, bool]],
+        weapon_ids: List[int],
+        skin_ids: List[int],
+        quality_ids: List[int],
     ) -> IdRelationsCreateDeleteDTO:
-        ids_relations_to_create = [
-            RelationDTO(
-                weapon_id=relation.weapon.id,
-                skin_id=relation.skin.id,
-                quality_id=relation.quality.id,
-                stattrak_existence=relation.stattrak_existence,
-            )
-            for relation in relations
-        ]
-        ids_relations_to_delete: List[RelationDTO] = []
-        for relation_db_model in await self._relation_service.get_all():
-            if (
-                relation_id_dto := RelationDTO(
-                    weapon_id=relation_db_model.weapon_id,
-                    skin_id=relation_db_model.skin_id,
-                    quality_id=relation_db_model.quality_id,
-                    stattrak_existence=relation_db_model.stattrak_existence,
-                )
-            ) in ids_relations_to_create:
-                ids_relations_to_create.remove(relation_id_dto)
-            else:
-                ids_relations_to_delete.append(relation_id_dto)
+        ids_relations_to_create: Set[RELATION_IDS] = {
+            (weapon_ids[weapon], skin_ids[skin], quality_ids[quality], stattrak_existence)
+            for weapon, skin, quality, stattrak_existence in relations
+        }
+        ids_relations_to_delete: List[RELATION_IDS] = []
+        unchanged_count = 0
+        async for relation_ids_chunk in self._relation_service.stream_all_ids(
+            self._relations_chunk_size
+        ):
+            for relation_ids in relation_ids_chunk:
+                if relation_ids in ids_relations_to_create:
+                    ids_relations_to_create.remove(relation_ids)
+                    unchanged_count += 1
+                else:
+                    ids_relations_to_delete.append(relation_ids)
         return IdRelationsCreateDeleteDTO(
-            ids_relations_to_create=ids_relations_to_create,
+            ids_relations_to_create=list(ids_relations_to_create),
             ids_relations_to_delete=ids_relations_to_delete,
+            unchanged_count=unchanged_count,
         )
 
-    async def _update_gloves(self, gloves: List[GloveDTO]) -> None:
-        create_delete_dto = await self._get_glove_create_delete_dto(gloves)
-
-        if to_delete := create_delete_dto.names_to_delete:
-            await self._glove_service.delete_many_by_name(to_delete)
-
-        if to_create := create_delete_dto.dtos_to_create:
-            glove_db_models = await self._glove_service.create_many(list(to_create.values()))
-
-            for glove_db_model in glove_db_models:
-                to_create[glove_db_model.name].id = glove_db_model.id
-
-    async def _get_glove_create_delete_dto(
-        self, gloves: List[GloveDTO]
-    ) -> CreateDeleteDTO[GloveDTO]:
-        glove_dtos_to_create = {glove.name: glove for glove in gloves if glove.name}
-        glove_names_to_delete: List[str] = []
-        for glove_db_model in await self._glove_service.get_all():
-            if glove_dto := glove_dtos_to_create.pop(glove_db_model.name, None):
-                glove_dto.id = glove_db_model.id
-            else:
-                glove_names_to_delete.append(glove_db_model.name)
-        return CreateDeleteDTO(
-            dtos_to_create=glove_dtos_to_create, names_to_delete=glove_names_to_delete
-        )
-
-    async def _update_agents(self, agents: List[AgentDTO]) -> None:
-        create_delete_dto = await self._get_agent_create_delete_dto(agents)
-
-        if to_delete := create_delete_dto.names_to_delete:
-            await self._agent_service.delete_many_by_name(to_delete)
-
-        if to_create := create_delete_dto.dtos_to_create:
-            agent_db_models = await self._agent_service.create_many(list(to_create.values()))
-
-            for agent_db_model in agent_db_models:
-                to_create[agent_db_model.name].id = agent_db_model.id
-
-    async def _get_agent_create_delete_dto(
-        self, agents: List[AgentDTO]
-    ) -> CreateDeleteDTO[AgentDTO]:
-        agent_dtos_to_create = {agent.name: agent for agent in agents if agent.name}
-        agent_names_to_delete: List[str] = []
-        for agent_db_model in await self._agent_service.get_all():
-            if agent_dto := agent_dtos_to_create.pop(agent_db_model.name, None):
-                agent_dto.id = agent_db_model.id
-            else:
-                agent_names_to_delete.append(agent_db_model.name)
-        return CreateDeleteDTO(
-            dtos_to_create=agent_dtos_to_create, names_to_delete=agent_names_to_delete
-        )
-
-    async def _update_glove_relations(self, glove_relations: List[GloveRelationDTO]) -> None:
-        for glove_relation in glove_relations:
-            glove_db_model = await self._glove_service.get_by_name(str(glove_relation.glove.name))
-            skin_db_models = await self._skin_service.get_many_by_name(
-                [str(skin.name) for skin in glove_relation.skins]
-            )
-            await self._glove_service.update_relations(glove_db_model, list(skin_db_models))
+    @staticmethod
+    def _get_ids_by_index(names: List[str], ids_by_name: Dict[str, int]) -> List[int]:
+        return [ids_by_name[name] for name in names]
 
-    async def _update_agent_relations(self, agent_relations: List[AgentRelationDTO]) -> None:
-        for agent_relation in agent_relations:
-            agent_db_model = await self._agent_service.get_by_name(str(agent_relation.agent.name))
-            skin_db_models = await self._skin_service.get_many_by_name(
-                [str(skin.name) for skin in agent_relation.skins]
-            )
-            await self._agent_service.update_relations(agent_db_model, list(skin_db_models))
+    @staticmethod
+    def _get_skin_owner_ids(
+        owner_relations: List[Tuple[int, int]], owner_ids: List[int], skin_ids: List[int]
+    ) -> List[SKIN_OWNER_IDS]:
+        return [(skin_ids[skin], owner_ids[owner]) for owner, skin in owner_relations]
@@ -0,0 +1,215 @@
+from typing import Dict, Iterable, Sequence, Set, Tuple, Type, TypeVar
+
+from sqlalchemy import Integer, column, delete, select, tuple_, update, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncSessionTransaction
+
+from tg_bot_float_db_app.database.models.agent_model import AgentModel
+from tg_bot_float_db_app.database.models.catalog_state_model import CatalogStateModel
+from tg_bot_float_db_app.database.models.glove_model import GloveModel
+from tg_bot_float_db_app.database.models.quality_model import QualityModel
+from tg_bot_float_db_app.database.models.relation_model import RelationModel
+from tg_bot_float_db_app.database.models.skin_model import SkinModel
+from tg_bot_float_db_app.database.models.weapon_model import WeaponModel
+from tg_bot_float_db_app.database.services.dtos.db_refresher_dtos import (
+    NamesReconcileDTO,
+    RefreshCountDTO,
+)
+from tg_bot_float_db_app.database.services.relation_service import RELATION_IDS
+
+NAMED_MODEL = Type[WeaponModel | SkinModel | QualityModel | GloveModel | AgentModel]
+
+SKIN_OWNER_IDS = Tuple[int, int]  # (skin_id, glove_id or agent_id)
+
+ItemT = TypeVar("ItemT")
+
+
+class CatalogBulkService:
+    """Set-based reconciliation of catalog tables.
+
+    Nothing here commits: every statement runs inside the transaction opened with `transaction()`,
+    so a refresh is applied atomically.
+    """
+
+    _batch_size = 1000
+    _catalog_state_id = 1
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    def transaction(self) -> AsyncSessionTransaction:
+        return self._session.begin()
+
+    async def reconcile_names(
+        self, model: NAMED_MODEL, names: Iterable[str | None]
+    ) -> NamesReconcileDTO:
+        """Make `model` table contain exactly `names`.
+
+        Missing names are inserted with multi-row upserts, names absent from the source are deleted.
+
+        Returns:
+            NamesReconcileDTO: id of every name from the source and created/deleted/unchanged counts
+        """
+        source_names: Set[str] = {name for name in names if name}
+        result = await self._session.execute(select(model.name, model.id))
+        ids_by_name: Dict[str, int] = dict(result.tuples().all())
+
+        names_to_delete = sorted(ids_by_name.keys() - source_names)
+        await self.delete_names(model, names_to_delete)
+        for name in names_to_delete:
+            del ids_by_name[name]
+
+        names_to_create = sorted(source_names - ids_by_name.keys())
+        ids_by_name.update(await self.create_names(model, names_to_create))
+
+        return NamesReconcileDTO(
+            ids_by_name=ids_by_name,
+            count=RefreshCountDTO(
+                created=len(names_to_create),
+                deleted=len(names_to_delete),
+                unchanged=len(source_names) - len(names_to_create),
+            ),
+        )
+
+    async def get_ids_by_name(self, model: NAMED_MODEL, names: Sequence[str]) -> Dict[str, int]:
+        ids_by_name: Dict[str, int] = {}
+        for batch in self._batched(names):
+            result = await self._session.execute(
+                select(model.name, model.id).where(model.name.in_(batch))
+            )
+            ids_by_name.update(result.tuples().all())
+        return ids_by_name
+
+    async def create_names(self, model: NAMED_MODEL, names: Sequence[str]) -> Dict[str, int]:
+        ids_by_name: Dict[str, int] = {}
+        for batch in self._batched(names):
+            insert_stmt = insert(model).values([{"name": name} for name in batch])
+            do_update_stmt = insert_stmt.on_conflict_do_update(
+                index_elements=["name"], set_={"name": insert_stmt.excluded.name}
+            )
+            returning_stmt = do_update_stmt.returning(model.name, model.id)
+            result = await self._session.execute(returning_stmt)
+            ids_by_name.update(result.tuples().all())
+        return ids_by_name
+
+    async def insert_names(self, model: NAMED_MODEL, names: Sequence[str]) -> int:
+        """Insert the names missing from `model` table, existing names are left as they are.
+
+        Returns:
+            int: count of the rows actually inserted
+        """
+        inserted_rows = 0
+        for batch in self._batched(names):
+            insert_stmt = insert(model).values([{"name": name} for name in batch])
+            returning_stmt = insert_stmt.on_conflict_do_nothing(index_elements=["name"]).returning(
+                model.id
+            )
+            result = await self._session.execute(returning_stmt)
+            inserted_rows += len(result.scalars().all())
+        return inserted_rows
+
+    async def delete_names(self, model: NAMED_MODEL, names: Sequence[str]) -> int:
+        deleted_rows = 0
+        for batch in self._batched(names):
+            result = await self._session.execute(delete(model).where(model.name.in_(batch)))
+            deleted_rows += result.rowcount
+        return deleted_rows
+
+    async def get_snapshot_hash(self) -> str | None:
+        select_stmt = select(CatalogStateModel.snapshot_hash).where(
+            CatalogStateModel.id == self._catalog_state_id
+        )
+        return await self._session.scalar(select_stmt.with_for_update())
+
+    async def set_snapshot_hash(self, snapshot_hash: str) -> None:
+        insert_stmt = insert(CatalogStateModel).values(
+            id=self._catalog_state_id, snapshot_hash=snapshot_hash
+        )
+        do_update_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=["id"], set_={"snapshot_hash": snapshot_hash}
+        )
+        await self._session.execute(do_update_stmt)
+
+    async def delete_relations(self, relations_ids: Sequence[RELATION_IDS]) -> int:
+        deleted_rows = 0
+        for batch in self._batched(relations_ids):
+            result = await self._session.execute(
+                delete(RelationModel).where(
+                    tuple_(
+                        RelationModel.weapon_id,
+                        RelationModel.skin_id,
+                        RelationModel.quality_id,
+                        RelationModel.stattrak_existence,
+                    ).in_(batch)
+                )
+            )
+            deleted_rows += result.rowcount
+        return deleted_rows
+
+    async def create_relations(self, relations_ids: Sequence[RELATION_IDS]) -> None:
+        for batch in self._batched(relations_ids):
+            insert_stmt = insert(RelationModel).values(
+                [
+                    {
+                        "weapon_id": weapon_id,
+                        "skin_id": skin_id,
+                        "quality_id": quality_id,
+                        "stattrak_existence": stattrak_existence,
+                    }
+                    for weapon_id, skin_id, quality_id, stattrak_existence in batch
+                ]
+            )
+            do_update_stmt = insert_stmt.on_conflict_do_update(
+                index_elements=["weapon_id", "skin_id", "quality_id"],
+                set_={"stattrak_existence": insert_stmt.excluded.stattrak_existence},
+            )
+            await self._session.execute(do_update_stmt)
+
+    async def link_skins_to_gloves(self, skin_glove_ids: Sequence[SKIN_OWNER_IDS]) -> None:
+        await self._link_skins_to_owner("glove_id", skin_glove_ids)
+
+    async def link_skins_to_agents(self, skin_agent_ids: Sequence[SKIN_OWNER_IDS]) -> None:
+        await self._link_skins_to_owner("agent_id", skin_agent_ids)
+
+    async def unlink_skins_from_gloves(self, skin_glove_ids: Sequence[SKIN_OWNER_IDS]) -> None:
+        await self._unlink_skins_from_owner("glove_id", skin_glove_ids)
+
+    async def unlink_skins_from_agents(self, skin_agent_ids: Sequence[SKIN_OWNER_IDS]) -> None:
+        await self._unlink_skins_from_owner("agent_id", skin_agent_ids)
+
+    async def _link_skins_to_owner(
+        self, owner_column: str, skin_owner_ids: Sequence[SKIN_OWNER_IDS]
+    ) -> None:
+        for batch in self._batched(skin_owner_ids):
+            skin_owner_values = values(
+                column("skin_id", Integer), column("owner_id", Integer), name="skin_owner"
+            ).data(list(batch))
+            update_stmt = (
+                update(SkinModel)
+                .where(SkinModel.id == skin_owner_values.c.skin_id)
+                .values({owner_column: skin_owner_values.c.owner_id})
+                .execution_options(synchronize_session=False)
+            )
+            await self._session.execute(update_stmt)
+
+    async def _unlink_skins_from_owner(
+        self, owner_column: str, skin_owner_ids: Sequence[SKIN_OWNER_IDS]
+    ) -> None:
+        for batch in self._batched(skin_owner_ids):
+            skin_owner_values = values(
+                column("skin_id", Integer), column("owner_id", Integer), name="skin_owner"
+            ).data(list(batch))
+            update_stmt = (
+                update(SkinModel)
+                .where(
+                    SkinModel.id == skin_owner_values.c.skin_id,
+                    getattr(SkinModel, owner_column) == skin_owner_values.c.owner_id,
+                )
+                .values({owner_column: None})
+                .execution_options(synchronize_session=False)
+            )
+            await self._session.execute(update_stmt)
+
+    def _batched(self, items: Sequence[ItemT]) -> Iterable[Sequence[ItemT]]:
+        for start in range(0, len(items), self._batch_size):
+            yield items[start : start + self._batch_size]
@@ -1,17 +1,31 @@
-from typing import Dict, Generic, List, TypeVar
+from typing import Dict, List
 
 from pydantic import BaseModel
 
-from tg_bot_float_common_dtos.schema_dtos.relation_dto import RelationDTO
+from tg_bot_float_db_app.database.services.relation_service import RELATION_IDS
 
-ModelT = TypeVar("ModelT")
 
+class IdRelationsCreateDeleteDTO(BaseModel):
+    ids_relations_to_create: List[RELATION_IDS]
+    ids_relations_to_delete: List[RELATION_IDS]
+    unchanged_count: int = 0
 
-class CreateDeleteDTO(BaseModel, Generic[ModelT]):
-    dtos_to_create: Dict[str, ModelT]
-    names_to_delete: List[str]
 
+class RefreshCountDTO(BaseModel):
+    created: int = 0
+    deleted: int = 0
+    unchanged: int = 0
 
-class IdRelationsCreateDeleteDTO(BaseModel):
-    ids_relations_to_create: List[RelationDTO]
-    ids_relations_to_delete: List[RelationDTO]
+
+class NamesReconcileDTO(BaseModel):
+    ids_by_name: Dict[str, int]
+    count: RefreshCountDTO
+
+
+class DbRefreshReportDTO(BaseModel):
+    weapons: RefreshCountDTO = RefreshCountDTO()
+    skins: RefreshCountDTO = RefreshCountDTO()
+    qualities: RefreshCountDTO = RefreshCountDTO()
+    gloves: RefreshCountDTO = RefreshCountDTO()
+    agents: RefreshCountDTO = RefreshCountDTO()
+    relations: RefreshCountDTO = RefreshCountDTO()
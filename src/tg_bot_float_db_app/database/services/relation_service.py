@@ -1,4 +1,4 @@
-from typing import List
+from typing import AsyncGenerator, List, Tuple
 
 from sqlalchemy import select, delete, tuple_, ScalarResult
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -20,6 +20,9 @@ from tg_bot_float_common_dtos.schema_dtos.relation_dto import RelationDTO
 from tg_bot_float_common_dtos.db_app_dtos.relation_name_dto import RelationNameDTO
 
 
+RELATION_IDS = Tuple[int, int, int, bool]  # (weapon_id, skin_id, quality_id, stattrak_existence)
+
+
 class RelationService:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -88,6 +91,19 @@ class RelationService:
         select_stmt = select(RelationModel)
         return await self._session.scalars(select_stmt)
 
+    async def stream_all_ids(
+        self, chunk_size: int
+    ) -> AsyncGenerator[List[RELATION_IDS], None]:
+        select_stmt = select(
+            RelationModel.weapon_id,
+            RelationModel.skin_id,
+            RelationModel.quality_id,
+            RelationModel.stattrak_existence,
+        ).execution_options(yield_per=chunk_size)
+        result = await self._session.stream(select_stmt)
+        async for partition in result.partitions():
+            yield [row.tuple() for row in partition]
+
     async def get_all_paginated(self) -> Page[RelationModel]:
         select_stmt = select(RelationModel)
         return await paginate(self._session, select_stmt)
@@ -1,3 +1,6 @@
 ENTITY_FOUND_ERROR_MSG = "{entity} with {identifier} - {entity_identifier!r} already exist"
 ENTITY_NOT_FOUND_ERROR_MSG = "{entity} with {identifier} - {entity_identifier!r} does not exist!"
 NONE_FIELD_IN_ENTITY_ERROR_MSG = "{entity} fields cannot be None: {fields}"
+CATALOG_SNAPSHOT_CONFLICT_ERROR_MSG = (
+    "Catalog snapshot {actual_hash!r} does not match delta base {base_hash!r}, full update required!"
+)
@@ -6,7 +6,7 @@ from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
 
-from tg_bot_float_db_app.bot_db_exception import BotDbException
+from tg_bot_float_db_app.bot_db_exception import BotDbConflictException, BotDbException
 
 
 class ErrorHandlingMiddleware(BaseHTTPMiddleware):
@@ -16,6 +16,8 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
 
         try:
             return await call_next(request)
+        except BotDbConflictException as exc:
+            return JSONResponse(status_code=status.HTTP_409_CONFLICT, content={"message": exc.msg})
         except BotDbException as exc:
             return JSONResponse(
                 status_code=status.HTTP_400_BAD_REQUEST, content={"message": exc.msg}
@@ -0,0 +1,9 @@
+from enum import IntEnum
+
+
+class CrawlPriority(IntEnum):
+    """Lower value is crawled first: catalog pages, then skins pages, then quality lookups."""
+
+    CATALOG = 0
+    SKINS = 1
+    QUALITIES = 2
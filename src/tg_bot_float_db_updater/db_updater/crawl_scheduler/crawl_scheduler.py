@@ -0,0 +1,119 @@
+import asyncio
+import itertools
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Self, Tuple, TypeVar
+
+from tg_bot_float_db_updater.db_updater.crawl_scheduler.crawl_priority import CrawlPriority
+from tg_bot_float_db_updater.db_updater.dtos.crawl_metrics_dto import (
+    CrawlMetricsDTO,
+    CrawlPriorityMetricsDTO,
+)
+from tg_bot_float_db_updater.db_updater_settings import DbUpdaterSettings
+from tg_bot_float_misc.rate_limit.token_bucket import TokenBucket
+
+ResultT = TypeVar("ResultT")
+
+CRAWL_JOB = Tuple[
+    CrawlPriority, int, str, Callable[[], Awaitable[Any]], "asyncio.Future[Any]"
+]  # (priority, sequence number, host, call, result future)
+
+
+class CrawlScheduler:
+    """Runs upstream requests through a bounded priority queue.
+
+    A fixed pool of workers takes jobs in priority order, every host has its own concurrency cap
+    and token bucket. `run` waits while the queue is full, so producers are slowed down to the
+    pace upstream is crawled at.
+    """
+
+    def __init__(self, settings: DbUpdaterSettings) -> None:
+        self._settings = settings
+        self._queue: asyncio.PriorityQueue[CRAWL_JOB] = asyncio.PriorityQueue(
+            maxsize=settings.crawl_queue_size
+        )
+        self._sequence = itertools.count()
+        self._workers: List[asyncio.Task[None]] = []
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._host_buckets: Dict[str, TokenBucket] = {}
+        self._in_flight_by_host: Dict[str, int] = {}
+        self._priority_metrics = {priority: CrawlPriorityMetricsDTO() for priority in CrawlPriority}
+
+    async def __aenter__(self) -> Self:
+        self._workers = [
+            asyncio.create_task(self._work()) for _ in range(self._settings.crawl_workers)
+        ]
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def run(
+        self,
+        priority: CrawlPriority,
+        host: str,
+        func: Callable[..., Awaitable[ResultT]],
+        *args: Any,
+    ) -> ResultT:
+        future: asyncio.Future[ResultT] = asyncio.get_running_loop().create_future()
+        await self._queue.put((priority, next(self._sequence), host, partial(func, *args), future))
+        self._priority_metrics[priority].submitted += 1
+        return await future
+
+    def get_metrics(self) -> CrawlMetricsDTO:
+        return CrawlMetricsDTO(
+            workers=len(self._workers),
+            queued=self._queue.qsize(),
+            in_flight=sum(self._in_flight_by_host.values()),
+            in_flight_by_host=dict(self._in_flight_by_host),
+            priorities={
+                priority.name.lower(): metrics.model_copy()
+                for priority, metrics in self._priority_metrics.items()
+            },
+        )
+
+    async def _work(self) -> None:
+        while True:
+            priority, _, host, call, future = await self._queue.get()
+            try:
+                if not future.cancelled():
+                    await self._run_job(priority, host, call, future)
+            finally:
+                self._queue.task_done()
+
+    async def _run_job(
+        self,
+        priority: CrawlPriority,
+        host: str,
+        call: Callable[[], Awaitable[Any]],
+        future: "asyncio.Future[Any]",
+    ) -> None:
+        async with self._get_host_semaphore(host):
+            await self._get_host_bucket(host).acquire()
+            self._in_flight_by_host[host] = self._in_flight_by_host.get(host, 0) + 1
+            try:
+                result = await call()
+            except Exception as exc:
+                self._priority_metrics[priority].failed += 1
+                if not future.cancelled():
+                    future.set_exception(exc)
+            else:
+                self._priority_metrics[priority].completed += 1
+                if not future.cancelled():
+                    future.set_result(result)
+            finally:
+                self._in_flight_by_host[host] -= 1
+
+    def _get_host_semaphore(self, host: str) -> asyncio.Semaphore:
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self._settings.crawl_host_concurrency)
+        return self._host_semaphores[host]
+
+    def _get_host_bucket(self, host: str) -> TokenBucket:
+        if host not in self._host_buckets:
+            self._host_buckets[host] = TokenBucket(
+                self._settings.crawl_rate_per_second, self._settings.crawl_burst
+            )
+        return self._host_buckets[host]
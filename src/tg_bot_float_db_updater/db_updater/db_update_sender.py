@@ -1,11 +1,17 @@
-import pickle
-from typing import Self
+from typing import AsyncGenerator, Self
 
 from aiohttp import ClientSession
-import brotli  # type: ignore
+from fastapi import status
 
+from tg_bot_float_common_dtos.update_db_scheduler_dtos.source_data_delta_dto import (
+    SourceDataDeltaDTO,
+)
 from tg_bot_float_db_updater.db_updater_settings import DbUpdaterSettings
 from tg_bot_float_common_dtos.update_db_scheduler_dtos.source_data_tree_dto import SourceDataTreeDTO
+from tg_bot_float_misc.source_data_tree_codec.source_data_tree_codec import (
+    SOURCE_DATA_TREE_CONTENT_TYPE,
+    SourceDataTreeEncoder,
+)
 
 
 class DbUpdateSender:
@@ -14,6 +20,7 @@ class DbUpdateSender:
     def __init__(self, settings: DbUpdaterSettings, session: ClientSession) -> None:
         self._settings = settings
         self._session = session
+        self._encoder = SourceDataTreeEncoder()
 
     async def __aenter__(self) -> Self:
         return self
@@ -22,10 +29,29 @@ class DbUpdateSender:
         await self._session.close()
 
     async def send(self, db_dto: SourceDataTreeDTO) -> None:
-        bytes_db_dto = pickle.dumps(db_dto)
-        compressed_db_dto = brotli.compress(bytes_db_dto)  # type: ignore
         async with self._session.post(
             self._settings.db_update_url,
-            data=compressed_db_dto,
+            data=self._encode(db_dto),
+            headers={"Content-Type": SOURCE_DATA_TREE_CONTENT_TYPE},
         ) as response:
             assert response.status in self._success_statuses
+
+    async def send_delta(self, delta_dto: SourceDataDeltaDTO) -> bool:
+        """Send only the changed rows.
+
+        Returns:
+            bool: False if the db_app is not at the delta base snapshot and needs a full update
+        """
+        async with self._session.post(
+            self._settings.db_apply_delta_url,
+            data=delta_dto.model_dump_json(),
+            headers={"Content-Type": "application/json"},
+        ) as response:
+            if response.status == status.HTTP_409_CONFLICT:
+                return False
+            assert response.status in self._success_statuses
+            return True
+
+    async def _encode(self, db_dto: SourceDataTreeDTO) -> AsyncGenerator[bytes, None]:
+        for chunk in self._encoder.encode(db_dto):
+            yield chunk
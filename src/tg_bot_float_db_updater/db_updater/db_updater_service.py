@@ -1,20 +1,42 @@
 import asyncio
-from typing import Awaitable, Dict, List
+from typing import Awaitable, Callable, Dict, List, TypeVar
 
-from tg_bot_float_common_dtos.csgo_database_source_dtos.agents_page_dto import AgentsPageDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.agents_page_dto import AgentsPageDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.gloves_page_dto import GlovesPageDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.skins_page_dto import SkinsPageDTO
 from tg_bot_float_common_dtos.schema_dtos.agent_dto import AgentDTO
 from tg_bot_float_common_dtos.schema_dtos.glove_dto import GloveDTO
 from tg_bot_float_common_dtos.schema_dtos.quality_dto import QualityDTO
 from tg_bot_float_common_dtos.schema_dtos.weapon_dto import WeaponDTO
 from tg_bot_float_common_dtos.schema_dtos.skin_dto import SkinDTO
+from tg_bot_float_common_dtos.update_db_scheduler_dtos.source_data_names_dto import (
+    SourceDataNamesDTO,
+)
+from tg_bot_float_db_updater.db_updater.crawl_scheduler.crawl_priority import CrawlPriority
+from tg_bot_float_db_updater.db_updater.crawl_scheduler.crawl_scheduler import CrawlScheduler
 from tg_bot_float_db_updater.db_updater.db_update_sender import DbUpdateSender
+from tg_bot_float_db_updater.db_updater.dtos.csgo_db_catalog_dto import CsgoDbCatalogDTO
+from tg_bot_float_db_updater.db_updater.dtos.db_update_result_dto import (
+    DbUpdateResultDTO,
+    DeadLetterDTO,
+)
+from tg_bot_float_db_updater.db_updater.dtos.failed_subtrees_dto import FailedSubtreesDTO
+from tg_bot_float_db_updater.db_updater.retry_policy.retry_policy import RetryPolicy
+from tg_bot_float_db_updater.db_updater.source_data_snapshot_store import SourceDataSnapshotStore
 from tg_bot_float_db_updater.db_updater.data_tree_from_source import DataTreeFromSource
+from tg_bot_float_db_updater.db_updater.source_data_getter.abstract_source_data_getter import (
+    AbstractSourceGetter,
+)
 from tg_bot_float_db_updater.db_updater.source_data_getter.csm_wiki_source_getter_service import (
     CsmWikiSourceGetter,
 )
 from tg_bot_float_db_updater.db_updater.source_data_getter.csgo_db_source_getter import (
     CsgoDbSourceDataGetter,
 )
+from tg_bot_float_db_updater.db_updater_exception import DbUpdaterException
+from tg_bot_float_misc.source_data_tree_codec.source_data_snapshot import SourceDataSnapshot
+
+ResultT = TypeVar("ResultT")
 
 
 class DbUpdaterService:
@@ -23,87 +45,204 @@ class DbUpdaterService:
         csgo_db_source_data_getter: CsgoDbSourceDataGetter,
         csm_wiki_source_getter: CsmWikiSourceGetter,
         db_update_sender: DbUpdateSender,
+        snapshot_store: SourceDataSnapshotStore,
+        crawl_scheduler: CrawlScheduler,
+        retry_policy: RetryPolicy,
     ) -> None:
         self._csgo_db_source_data_getter = csgo_db_source_data_getter
         self._csm_wiki_source_data_getter = csm_wiki_source_getter
         self._db_update_sender = db_update_sender
+        self._snapshot_store = snapshot_store
+        self._crawl_scheduler = crawl_scheduler
+        self._retry_policy = retry_policy
+        self._dead_letters: List[DeadLetterDTO] = []
+        self._failed_subtrees = FailedSubtreesDTO()
 
-    async def update(self) -> None:
+    async def update(self) -> DbUpdateResultDTO:
+        """Crawl the sources and send the catalog to the db_app.
+
+        Pages that still fail after retries are skipped together with their subtree and listed
+        as dead letters. The rows of the previous snapshot under the failed subtrees are kept,
+        so the db_app gets a delta that applies everything else and removes none of them. Without
+        a previous snapshot, or when the db_app is not at it, nothing is sent then: a full update
+        would delete the missing subtrees.
+        """
+        self._dead_letters = []
+        self._failed_subtrees = FailedSubtreesDTO()
         datatree = DataTreeFromSource()
         await self._process_datatree(datatree)
-        await self._db_update_sender.send(datatree.to_dto())
+
+        db_dto = datatree.to_dto()
+        snapshot = await asyncio.to_thread(SourceDataSnapshot.from_tree, db_dto)
+        previous_snapshot = await self._snapshot_store.load()
+        if self._dead_letters:
+            if previous_snapshot is None:
+                return DbUpdateResultDTO(sent=False, dead_letters=self._dead_letters)
+            snapshot = self._keep_failed_subtrees(snapshot, previous_snapshot)
+        # An unchanged catalog is still sent as an empty delta: the db_app answers 409 when it
+        # is not at the local snapshot (restored, refreshed by hand), then a full update follows
+        if previous_snapshot is None or not await self._db_update_sender.send_delta(
+            snapshot.get_delta(previous_snapshot)
+        ):
+            if self._dead_letters:
+                return DbUpdateResultDTO(sent=False, dead_letters=self._dead_letters)
+            await self._db_update_sender.send(db_dto)
+        elif previous_snapshot.hash == snapshot.hash:
+            return DbUpdateResultDTO(sent=False, dead_letters=self._dead_letters)
+        await self._snapshot_store.save(snapshot)
+        return DbUpdateResultDTO(sent=True, dead_letters=self._dead_letters)
+
+    def _keep_failed_subtrees(
+        self, snapshot: SourceDataSnapshot, previous_snapshot: SourceDataSnapshot
+    ) -> SourceDataSnapshot:
+        """Add the rows of `previous_snapshot` under the failed subtrees to `snapshot`."""
+        failed_subtrees = self._failed_subtrees
+        previous = previous_snapshot.names_dto
+        relations = [
+            relation
+            for relation in previous.relations
+            if failed_subtrees.all_weapons
+            or relation[0] in failed_subtrees.weapons
+            or (relation[0], relation[1]) in failed_subtrees.weapon_skins
+        ]
+        glove_relations = previous.glove_relations if failed_subtrees.gloves else []
+        agent_relations = previous.agent_relations if failed_subtrees.agents else []
+        names_dto = snapshot.names_dto
+        return SourceDataSnapshot(
+            SourceDataNamesDTO(
+                weapons=names_dto.weapons
+                + (previous.weapons if failed_subtrees.all_weapons else []),
+                skins=names_dto.skins
+                + [skin for _, skin, _, _ in relations]
+                + [skin for _, skin in glove_relations + agent_relations],
+                qualities=names_dto.qualities + [quality for _, _, quality, _ in relations],
+                gloves=names_dto.gloves + (previous.gloves if failed_subtrees.gloves else []),
+                agents=names_dto.agents + (previous.agents if failed_subtrees.agents else []),
+                relations=names_dto.relations + relations,
+                glove_relations=names_dto.glove_relations + glove_relations,
+                agent_relations=names_dto.agent_relations + agent_relations,
+            )
+        )
+
+    async def _crawl(
+        self,
+        priority: CrawlPriority,
+        getter: AbstractSourceGetter,
+        func: Callable[..., Awaitable[ResultT]],
+        *args: str,
+    ) -> ResultT | None:
+        """Crawl one page with retries, None if it failed and was put to the dead letters."""
+        endpoint = f"{getter.host}/{func.__name__}"
+        try:
+            return await self._retry_policy.run(
+                endpoint, self._crawl_scheduler.run, priority, getter.host, func, *args
+            )
+        except DbUpdaterException as exc:
+            self._dead_letters.append(
+                DeadLetterDTO(endpoint=endpoint, arguments=list(args), error=exc.msg)
+            )
+            return None
 
     async def _process_datatree(self, datatree: DataTreeFromSource) -> None:
-        await asyncio.gather(
-            self._process_agents_in_datatree(datatree),
-            self._process_gloves_in_datatree(datatree),
-            self._process_weapons_in_datatree(datatree),
+        catalog_dto: CsgoDbCatalogDTO | None = await self._crawl(
+            CrawlPriority.CATALOG,
+            self._csgo_db_source_data_getter,
+            self._csgo_db_source_data_getter.get_catalog,
         )
+        if catalog_dto is None:
+            self._failed_subtrees.all_weapons = True
+            self._failed_subtrees.gloves = True
+            self._failed_subtrees.agents = True
+            return
+        self._process_agents_in_datatree(datatree, catalog_dto.agents)
+        self._process_gloves_in_datatree(datatree, catalog_dto.gloves)
+        await self._process_weapons_in_datatree(datatree, catalog_dto)
 
-    async def _process_gloves_in_datatree(self, datatree: DataTreeFromSource) -> None:
-        gloves_page_dtos = await self._csgo_db_source_data_getter.get_gloves_page()
+    def _process_gloves_in_datatree(
+        self, datatree: DataTreeFromSource, gloves_page_dto: GlovesPageDTO
+    ) -> None:
         gloves_relations: Dict[str, List[SkinDTO]] = {}
-        for glove_page in gloves_page_dtos:
-            glove_skin_dtos: List[SkinDTO] = datatree.add_skins(glove_page.skins)
-            gloves_relations[glove_page.glove_name] = glove_skin_dtos
+        for glove_skins_dto in gloves_page_dto.gloves:
+            glove_skin_dtos: List[SkinDTO] = datatree.add_skins(glove_skins_dto.skins)
+            gloves_relations[glove_skins_dto.glove_name] = glove_skin_dtos
         glove_dtos: List[GloveDTO] = datatree.add_gloves(list(gloves_relations.keys()))
         for glove_dto in glove_dtos:
             for glove_skin_dto in gloves_relations[str(glove_dto.name)]:
                 datatree.add_glove_relations(glove_dto, glove_skin_dto)
 
-    async def _process_agents_in_datatree(self, datatree: DataTreeFromSource) -> None:
-        agents_page_dtos: List[AgentsPageDTO] = (
-            await self._csgo_db_source_data_getter.get_agents_page()
-        )
+    def _process_agents_in_datatree(
+        self, datatree: DataTreeFromSource, agents_page_dto: AgentsPageDTO
+    ) -> None:
         agent_relations: Dict[str, List[SkinDTO]] = {}
-        for agent_page in agents_page_dtos:
-            agent_skin_dtos: List[SkinDTO] = datatree.add_skins(agent_page.skins)
-            agent_relations[agent_page.fraction_name] = agent_skin_dtos
+        for agent_skins_dto in agents_page_dto.agents:
+            agent_skin_dtos: List[SkinDTO] = datatree.add_skins(agent_skins_dto.skins)
+            agent_relations[agent_skins_dto.fraction_name] = agent_skin_dtos
         agent_dtos: List[AgentDTO] = datatree.add_agents(list(agent_relations.keys()))
         for agent_dto in agent_dtos:
             for agent_skin_dto in agent_relations[str(agent_dto.name)]:
                 datatree.add_agent_relations(agent_dto, agent_skin_dto)
 
-    async def _process_weapons_in_datatree(self, datatree: DataTreeFromSource) -> None:
-        tasks: List[Awaitable[None]] = []
-        weapons_page = await self._csgo_db_source_data_getter.get_weapons_page()
+    async def _process_weapons_in_datatree(
+        self, datatree: DataTreeFromSource, catalog_dto: CsgoDbCatalogDTO
+    ) -> None:
         weapon_dtos: List[WeaponDTO] = datatree.add_weapons(
-            weapons_page.weapons + weapons_page.knives + weapons_page.other
+            [weapon for category in catalog_dto.weapons.categories for weapon in category.weapons]
         )
-        for weapon_dto in weapon_dtos:
-            task = asyncio.create_task(
-                self._process_skins_for_weapon_in_datatree(datatree, weapon_dto)
+        await asyncio.gather(
+            *(
+                self._process_skins_for_weapon_in_datatree(
+                    datatree, weapon_dto, catalog_dto.skins.get(str(weapon_dto.name))
+                )
+                for weapon_dto in weapon_dtos
             )
-            tasks.append(task)
-        await asyncio.gather(*tasks)
+        )
 
     async def _process_skins_for_weapon_in_datatree(
-        self, datatree: DataTreeFromSource, weapon_dto: WeaponDTO
+        self,
+        datatree: DataTreeFromSource,
+        weapon_dto: WeaponDTO,
+        skins_page: SkinsPageDTO | None,
     ) -> None:
-        tasks: List[Awaitable[None]] = []
-        skins_page = await self._csgo_db_source_data_getter.get_skins_page(str(weapon_dto.name))
-        skin_dtos = datatree.add_skins(skins_page.skins)
-        for skin_dto in skin_dtos:
-            task = asyncio.create_task(
-                self._process_qualities_stattrak_for_weapon_skin_in_datattree(
-                    datatree, weapon_dto, skin_dto
-                )
+        if skins_page is None:
+            # The catalog has an error record for the weapon, its skins page is tried on its own
+            skins_page = await self._crawl(
+                CrawlPriority.SKINS,
+                self._csgo_db_source_data_getter,
+                self._csgo_db_source_data_getter.get_skins_page,
+                str(weapon_dto.name),
             )
-            tasks.append(task)
-        await asyncio.gather(*tasks)
+        if skins_page is None:
+            self._failed_subtrees.weapons.add(str(weapon_dto.name))
+            return
+        skin_dtos = datatree.add_skins(
+            [skin for rarity_skins in skins_page.skins for skin in rarity_skins.skins]
+        )
+        await self._process_qualities_stattrak_for_weapon_skins_in_datatree(
+            datatree, weapon_dto, skin_dtos
+        )
 
-    async def _process_qualities_stattrak_for_weapon_skin_in_datattree(
+    async def _process_qualities_stattrak_for_weapon_skins_in_datatree(
         self,
         datatree: DataTreeFromSource,
         weapon_dto: WeaponDTO,
-        skin_dto: SkinDTO,
+        skin_dtos: List[SkinDTO],
     ) -> None:
-        csm_wiki_dto = await self._csm_wiki_source_data_getter.get_csm_wiki_skin_data(
+        csm_wiki_dtos = await self._crawl(
+            CrawlPriority.QUALITIES,
+            self._csm_wiki_source_data_getter,
+            self._csm_wiki_source_data_getter.get_csm_wiki_skins_data,
             str(weapon_dto.name),
-            str(skin_dto.name),
+            *(str(skin_dto.name) for skin_dto in skin_dtos),
         )
-        quality_dtos: List[QualityDTO] = datatree.add_qualities(csm_wiki_dto.qualities)
-        for quality_dto in quality_dtos:
-            datatree.add_relation(
-                weapon_dto, skin_dto, quality_dto, csm_wiki_dto.stattrak_existence
+        if csm_wiki_dtos is None:
+            self._failed_subtrees.weapon_skins.update(
+                (str(weapon_dto.name), str(skin_dto.name)) for skin_dto in skin_dtos
             )
+            return
+        for skin_dto in skin_dtos:
+            csm_wiki_dto = csm_wiki_dtos[str(skin_dto.name)]
+            quality_dtos: List[QualityDTO] = datatree.add_qualities(csm_wiki_dto.qualities)
+            for quality_dto in quality_dtos:
+                datatree.add_relation(
+                    weapon_dto, skin_dto, quality_dto, csm_wiki_dto.stattrak_existence
+                )
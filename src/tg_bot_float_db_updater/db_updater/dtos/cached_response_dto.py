@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class CachedResponseDTO(BaseModel):
+    body: str
+    etag: str | None = None
+    last_modified: str | None = None
+    expires_at: float
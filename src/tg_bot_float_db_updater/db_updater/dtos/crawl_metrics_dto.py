@@ -0,0 +1,17 @@
+from typing import Dict
+
+from pydantic import BaseModel
+
+
+class CrawlPriorityMetricsDTO(BaseModel):
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+
+
+class CrawlMetricsDTO(BaseModel):
+    workers: int
+    queued: int
+    in_flight: int
+    in_flight_by_host: Dict[str, int]
+    priorities: Dict[str, CrawlPriorityMetricsDTO]
@@ -0,0 +1,17 @@
+from typing import Dict
+
+from pydantic import BaseModel
+
+from tg_bot_float_common_dtos.csgo_db_source_dtos.agents_page_dto import AgentsPageDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.gloves_page_dto import GlovesPageDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.skins_page_dto import SkinsPageDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.weapons_page_dto import WeaponsPageDTO
+
+
+class CsgoDbCatalogDTO(BaseModel):
+    """The csgo_db catalog stream collected into pages."""
+
+    weapons: WeaponsPageDTO
+    gloves: GlovesPageDTO
+    agents: AgentsPageDTO
+    skins: Dict[str, SkinsPageDTO] = {}  # by weapon, without the failed or empty pages
@@ -0,0 +1,14 @@
+from typing import List
+
+from pydantic import BaseModel
+
+
+class DeadLetterDTO(BaseModel):
+    endpoint: str
+    arguments: List[str] = []
+    error: str
+
+
+class DbUpdateResultDTO(BaseModel):
+    sent: bool
+    dead_letters: List[DeadLetterDTO] = []
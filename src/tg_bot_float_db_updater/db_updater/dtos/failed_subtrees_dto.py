@@ -0,0 +1,13 @@
+from typing import Set, Tuple
+
+from pydantic import BaseModel
+
+
+class FailedSubtreesDTO(BaseModel):
+    """Parts of the catalog that were not crawled because their page went to the dead letters."""
+
+    all_weapons: bool = False
+    gloves: bool = False
+    agents: bool = False
+    weapons: Set[str] = set()  # skins page failed
+    weapon_skins: Set[Tuple[str, str]] = set()  # (weapon, skin), csm_wiki page failed
@@ -0,0 +1,125 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, List, Self, Tuple
+
+from tg_bot_float_db_updater.db_updater.dtos.cached_response_dto import CachedResponseDTO
+from tg_bot_float_db_updater.db_updater_settings import DbUpdaterSettings
+
+
+class SourceResponseCache:
+    """SQLite-backed cache of source responses shared by all getters.
+
+    Entries outlive their TTL so they can be revalidated with ETag / Last-Modified, the least
+    recently used ones are evicted once the stored bodies exceed `response_cache_max_bytes`.
+    """
+
+    _create_table_sql = """
+        CREATE TABLE IF NOT EXISTS response (
+            url TEXT PRIMARY KEY,
+            body TEXT NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            expires_at REAL NOT NULL,
+            accessed_at REAL NOT NULL,
+            size INTEGER NOT NULL
+        )
+    """
+    _create_index_sql = "CREATE INDEX IF NOT EXISTS response_accessed_at ON response (accessed_at)"
+
+    def __init__(self, settings: DbUpdaterSettings) -> None:
+        self._path = Path(settings.response_cache_path)
+        self._max_bytes = settings.response_cache_max_bytes
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    async def __aenter__(self) -> Self:
+        await asyncio.to_thread(self._connect)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore
+        await asyncio.to_thread(self._close)
+
+    async def get(self, url: str) -> CachedResponseDTO | None:
+        return await asyncio.to_thread(self._get, url)
+
+    async def put(
+        self, url: str, body: str, etag: str | None, last_modified: str | None, ttl: float
+    ) -> None:
+        await asyncio.to_thread(self._put, url, body, etag, last_modified, ttl)
+
+    async def refresh(self, url: str, ttl: float) -> None:
+        """Extend the TTL of an entry upstream confirmed as not modified."""
+        await asyncio.to_thread(
+            self._execute,
+            "UPDATE response SET expires_at = ? WHERE url = ?",
+            (time.time() + ttl, url),
+        )
+
+    async def invalidate(self, url: str) -> None:
+        await asyncio.to_thread(self._execute, "DELETE FROM response WHERE url = ?", (url,))
+
+    def _connect(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self._path, check_same_thread=False, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(self._create_table_sql)
+        connection.execute(self._create_index_sql)
+        self._connection = connection
+
+    def _close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _get(self, url: str) -> CachedResponseDTO | None:
+        with self._lock:
+            connection = self._get_connection()
+            row = connection.execute(
+                "SELECT body, etag, last_modified, expires_at FROM response WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE response SET accessed_at = ? WHERE url = ?", (time.time(), url)
+            )
+        body, etag, last_modified, expires_at = row
+        return CachedResponseDTO(
+            body=body, etag=etag, last_modified=last_modified, expires_at=expires_at
+        )
+
+    def _put(
+        self, url: str, body: str, etag: str | None, last_modified: str | None, ttl: float
+    ) -> None:
+        now = time.time()
+        with self._lock:
+            connection = self._get_connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO response VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, body, etag, last_modified, now + ttl, now, len(body)),
+            )
+            self._evict(connection)
+
+    def _execute(self, sql: str, parameters: Tuple[Any, ...]) -> None:
+        with self._lock:
+            self._get_connection().execute(sql, parameters)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        (total_size,) = connection.execute("SELECT COALESCE(SUM(size), 0) FROM response").fetchone()
+        if total_size <= self._max_bytes:
+            return
+        urls_to_delete: List[Tuple[str]] = []
+        for url, size in connection.execute("SELECT url, size FROM response ORDER BY accessed_at"):
+            urls_to_delete.append((url,))
+            total_size -= size
+            if total_size <= self._max_bytes:
+                break
+        connection.executemany("DELETE FROM response WHERE url = ?", urls_to_delete)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            raise RuntimeError("SourceResponseCache is used outside of its context")
+        return self._connection
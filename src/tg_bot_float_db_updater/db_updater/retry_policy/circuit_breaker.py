@@ -0,0 +1,30 @@
+import time
+
+
+class CircuitBreaker:
+    """Opens after `failure_threshold` failures in a row and rejects requests for `reset_timeout`
+    seconds, then lets requests through again; one more failure opens it right away."""
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+
+    def allows_request(self) -> bool:
+        if self._opened_at is None:
+            return True
+        if time.monotonic() - self._opened_at < self._reset_timeout:
+            return False
+        self._opened_at = None
+        self._failures = self._failure_threshold - 1
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._failures >= self._failure_threshold:
+            self._opened_at = time.monotonic()
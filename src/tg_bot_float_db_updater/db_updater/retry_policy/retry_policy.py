@@ -0,0 +1,64 @@
+import asyncio
+import random
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+from aiohttp import ClientError
+
+from tg_bot_float_db_updater.db_updater.retry_policy.circuit_breaker import CircuitBreaker
+from tg_bot_float_db_updater.db_updater_constants import (
+    CIRCUIT_OPEN_ERROR_MSG,
+    RETRIES_EXHAUSTED_ERROR_MSG,
+)
+from tg_bot_float_db_updater.db_updater_exception import DbUpdaterException
+from tg_bot_float_db_updater.db_updater_settings import DbUpdaterSettings
+
+ResultT = TypeVar("ResultT")
+
+
+class RetryPolicy:
+    """Bounded retries with decorrelated jitter backoff and a circuit breaker per endpoint.
+
+    Raises DbUpdaterException once attempts are exhausted or while the endpoint circuit is open.
+    """
+
+    _retryable_exceptions = (ClientError, asyncio.TimeoutError, ValueError, DbUpdaterException)
+
+    def __init__(self, settings: DbUpdaterSettings) -> None:
+        self._settings = settings
+        self._circuit_breakers: Dict[str, CircuitBreaker] = {}
+
+    async def run(
+        self, endpoint: str, func: Callable[..., Awaitable[ResultT]], *args: Any
+    ) -> ResultT:
+        circuit_breaker = self._get_circuit_breaker(endpoint)
+        delay = self._settings.retry_base_delay
+        attempt = 0
+        while True:
+            if not circuit_breaker.allows_request():
+                raise DbUpdaterException(CIRCUIT_OPEN_ERROR_MSG.format(endpoint=endpoint))
+            attempt += 1
+            try:
+                result = await func(*args)
+            except self._retryable_exceptions as exc:
+                circuit_breaker.record_failure()
+                if attempt >= self._settings.retry_max_attempts:
+                    raise DbUpdaterException(
+                        RETRIES_EXHAUSTED_ERROR_MSG.format(
+                            endpoint=endpoint, attempts=attempt, error=str(exc)
+                        )
+                    ) from exc
+                delay = min(
+                    self._settings.retry_max_delay,
+                    random.uniform(self._settings.retry_base_delay, delay * 3),
+                )
+                await asyncio.sleep(delay)
+            else:
+                circuit_breaker.record_success()
+                return result
+
+    def _get_circuit_breaker(self, endpoint: str) -> CircuitBreaker:
+        if endpoint not in self._circuit_breakers:
+            self._circuit_breakers[endpoint] = CircuitBreaker(
+                self._settings.circuit_failure_threshold, self._settings.circuit_reset_timeout
+            )
+        return self._circuit_breakers[endpoint]
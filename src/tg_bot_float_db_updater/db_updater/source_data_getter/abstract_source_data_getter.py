@@ -1,19 +1,40 @@
-from abc import ABC
-from typing import Any, Self
+import json
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Self
+from urllib.parse import urlsplit
 
-from aiohttp import ClientSession
-from aiohttp.client_exceptions import ContentTypeError
-from aiohttp_retry import ExponentialRetry, RetryClient
+from aiohttp import ClientSession, hdrs
 
+from tg_bot_float_db_updater.db_updater.response_cache.source_response_cache import (
+    SourceResponseCache,
+)
 from tg_bot_float_db_updater.db_updater_settings import DbUpdaterSettings
 
 
 class AbstractSourceGetter(ABC):
-    _retry_options = ExponentialRetry(exceptions={ContentTypeError})
+    _not_modified_status = 304
+    _cacheable_status = 200
+    _server_error_status = 500
 
-    def __init__(self, settings: DbUpdaterSettings, session: ClientSession) -> None:
+    def __init__(
+        self,
+        settings: DbUpdaterSettings,
+        session: ClientSession,
+        response_cache: SourceResponseCache,
+    ) -> None:
         self._settings = settings
         self._session = session
+        self._response_cache = response_cache
+
+    @property
+    def host(self) -> str:
+        return urlsplit(self._base_url).netloc
+
+    @property
+    @abstractmethod
+    def _base_url(self) -> str:
+        pass
 
     async def __aenter__(self) -> Self:
         return self
@@ -21,10 +42,35 @@ class AbstractSourceGetter(ABC):
     async def __aexit__(self, exc_type, exc_val, exc_tb):  # type: ignore
         await self._session.close()
 
-    async def _get_response(self, link: str) -> Any:
-        retry_session = RetryClient(self._session)
-        async with retry_session.get(
-            link,
-            retry_options=self._retry_options,
-        ) as response:
-            return await response.json()
+    async def _get_response(self, link: str, ttl: float) -> Any:
+        """Get JSON from `link`, served from the response cache while it is fresher than `ttl`.
+
+        Expired entries are revalidated with If-None-Match / If-Modified-Since when upstream sent
+        validators, a 304 answer extends the entry without downloading the body again.
+        """
+        cached_response = await self._response_cache.get(link)
+        if cached_response is not None and cached_response.expires_at > time.time():
+            return json.loads(cached_response.body)
+
+        headers: Dict[str, str] = {}
+        if cached_response is not None and cached_response.etag:
+            headers[hdrs.IF_NONE_MATCH] = cached_response.etag
+        if cached_response is not None and cached_response.last_modified:
+            headers[hdrs.IF_MODIFIED_SINCE] = cached_response.last_modified
+
+        async with self._session.get(link, headers=headers) as response:
+            if response.status == self._not_modified_status and cached_response is not None:
+                await self._response_cache.refresh(link, ttl)
+                return json.loads(cached_response.body)
+            if response.status >= self._server_error_status:
+                response.raise_for_status()
+            json_response = await response.json()
+            if response.status == self._cacheable_status:
+                await self._response_cache.put(
+                    link,
+                    json.dumps(json_response, ensure_ascii=False),
+                    response.headers.get(hdrs.ETAG),
+                    response.headers.get(hdrs.LAST_MODIFIED),
+                    ttl,
+                )
+            return json_response
@@ -1,44 +1,69 @@
-import asyncio
-from typing import List
-from tg_bot_float_common_dtos.csgo_database_source_dtos.agents_page_dto import AgentsPageDTO
-from tg_bot_float_common_dtos.csgo_database_source_dtos.gloves_page_dto import GlovesPageDTO
-from tg_bot_float_common_dtos.csgo_database_source_dtos.skins_page_dto import SkinsPageDTO
-from tg_bot_float_common_dtos.csgo_database_source_dtos.weapons_page_dto import WeaponsPageDTO
+from typing import Dict
+
+from tg_bot_float_common_dtos.csgo_db_source_dtos.agents_page_dto import AgentsPageDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.catalog_record_dto import CatalogRecordDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.catalog_summary_dto import CatalogSummaryDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.gloves_page_dto import GlovesPageDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.skins_page_dto import SkinsPageDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.weapons_page_dto import WeaponsPageDTO
+from tg_bot_float_db_updater.db_updater.dtos.csgo_db_catalog_dto import CsgoDbCatalogDTO
 from tg_bot_float_db_updater.db_updater.source_data_getter.abstract_source_data_getter import (
     AbstractSourceGetter,
 )
+from tg_bot_float_db_updater.db_updater_constants import (
+    CATALOG_CUT_OFF_ERROR_MSG,
+    EMPTY_SKINS_PAGE_ERROR_MSG,
+)
+from tg_bot_float_db_updater.db_updater_exception import DbUpdaterException
 
 
 class CsgoDbSourceDataGetter(AbstractSourceGetter):
+    @property
+    def _base_url(self) -> str:
+        return self._settings.csgo_db_url
+
+    async def get_catalog(self) -> CsgoDbCatalogDTO:
+        """The whole csgo_db catalog, read from the NDJSON stream of its catalog endpoint.
 
-    async def get_weapons_page(self) -> WeaponsPageDTO:
-        json_response = await self._get_response(
-            self._settings.csgo_db_url + self._settings.csgo_db_weapons_url
+        Weapons whose skins page failed on csgo_db, or came empty, are left out of `skins`.
+        A stream that ends before its summary record was cut off and raises.
+        """
+        weapons_page: WeaponsPageDTO | None = None
+        gloves_page: GlovesPageDTO | None = None
+        agents_page: AgentsPageDTO | None = None
+        skins: Dict[str, SkinsPageDTO] = {}
+        summary: CatalogSummaryDTO | None = None
+        async with self._session.get(
+            self._settings.csgo_db_url + self._settings.csgo_db_catalog_url
+        ) as response:
+            response.raise_for_status()
+            async for line in response.content:
+                if not line.strip():
+                    continue
+                record = CatalogRecordDTO.model_validate_json(line)
+                weapons_page = record.weapons or weapons_page
+                gloves_page = record.gloves or gloves_page
+                agents_page = record.agents or agents_page
+                summary = record.summary or summary
+                if record.weapon is not None and record.skins is not None and record.skins.skins:
+                    skins[record.weapon] = record.skins
+        if summary is None or weapons_page is None or gloves_page is None or agents_page is None:
+            raise DbUpdaterException(CATALOG_CUT_OFF_ERROR_MSG)
+        return CsgoDbCatalogDTO(
+            weapons=weapons_page,
+            gloves=gloves_page,
+            agents=agents_page,
+            skins=skins,
         )
-        return WeaponsPageDTO.model_validate(json_response)
 
     async def get_skins_page(self, weapon: str) -> SkinsPageDTO:
         weapon_name = weapon.lower().replace("★ ", "").replace(" ", "-")
-        while True:
-            json_response = await self._get_response(
-                self._settings.csgo_db_url
-                + self._settings.csgo_db_skins_url.format(weapon=weapon_name)
-            )
-            skins_page_dto = SkinsPageDTO.model_validate(json_response)
-            if skins_page_dto.skins:
-                print(f"Found skins for weapon: {weapon_name}")
-                print(f"Number of skins: {len(skins_page_dto.skins)}")
-                return skins_page_dto
-            await asyncio.sleep(1)  # Wait before retrying
-
-    async def get_gloves_page(self) -> List[GlovesPageDTO]:
-        json_response = await self._get_response(
-            self._settings.csgo_db_url + self._settings.csgo_db_gloves_url
-        )
-        return [GlovesPageDTO.model_validate(item) for item in json_response]
-
-    async def get_agents_page(self) -> List[AgentsPageDTO]:
-        json_response = await self._get_response(
-            self._settings.csgo_db_url + self._settings.csgo_db_agents_url
+        link = self._settings.csgo_db_url + self._settings.csgo_db_skins_url.format(
+            weapon=weapon_name
         )
-        return [AgentsPageDTO.model_validate(item) for item in json_response]
+        json_response = await self._get_response(link, self._settings.csgo_db_skins_ttl)
+        skins_page_dto = SkinsPageDTO.model_validate(json_response)
+        if not skins_page_dto.skins:
+            await self._response_cache.invalidate(link)  # Do not serve the empty page on retry
+            raise DbUpdaterException(EMPTY_SKINS_PAGE_ERROR_MSG.format(weapon=weapon_name))
+        return skins_page_dto
@@ -1,14 +1,59 @@
+import time
+from typing import Dict
+
+from tg_bot_float_common_dtos.csm_wiki_source_dtos.csm_wiki_batch_item_dto import (
+    CsmWikiBatchItemDTO,
+)
 from tg_bot_float_common_dtos.csm_wiki_source_dtos.csm_wiki_dto import CsmWikiDTO
+from tg_bot_float_common_dtos.csm_wiki_source_dtos.csm_wiki_skin_dto import CsmWikiSkinDTO
 from tg_bot_float_db_updater.db_updater.source_data_getter.abstract_source_data_getter import (
     AbstractSourceGetter,
 )
 
 
 class CsmWikiSourceGetter(AbstractSourceGetter):
-    async def get_csm_wiki_skin_data(self, weapon: str, skin: str) -> CsmWikiDTO:
-        response = await self._get_response(
-            self._settings.csm_wiki_url.format(weapon=weapon, skin=skin)
-        )
-        if response.get("message"):
-            return CsmWikiDTO()
-        return CsmWikiDTO.model_validate(response)
+    @property
+    def _base_url(self) -> str:
+        return self._settings.csm_wiki_url
+
+    async def get_csm_wiki_skins_data(self, weapon: str, *skins: str) -> Dict[str, CsmWikiDTO]:
+        """Data of the `skins` of `weapon` by skin name.
+
+        Skins missing from the response cache are fetched with one csm_wiki batch request, every
+        skin is cached under its own `csm_wiki_url` link.
+        """
+        csm_wiki_dtos: Dict[str, CsmWikiDTO] = {}
+        for skin in skins:
+            cached_response = await self._response_cache.get(self._get_skin_link(weapon, skin))
+            if cached_response is not None and cached_response.expires_at > time.time():
+                csm_wiki_dtos[skin] = CsmWikiDTO.model_validate_json(cached_response.body)
+        missing_skin_dtos = [
+            CsmWikiSkinDTO(weapon=weapon, skin=skin).model_dump()
+            for skin in skins
+            if skin not in csm_wiki_dtos
+        ]
+        if not missing_skin_dtos:
+            return csm_wiki_dtos
+
+        async with self._session.post(
+            self._settings.csm_wiki_batch_url, json=missing_skin_dtos
+        ) as response:
+            response.raise_for_status()
+            json_response = await response.json()
+        for batch_item_dto in map(CsmWikiBatchItemDTO.model_validate, json_response):
+            if batch_item_dto.csm_wiki is None:
+                # csm_wiki has no info about the skin: no qualities, not cached either
+                csm_wiki_dtos[batch_item_dto.skin] = CsmWikiDTO()
+                continue
+            await self._response_cache.put(
+                self._get_skin_link(weapon, batch_item_dto.skin),
+                batch_item_dto.csm_wiki.model_dump_json(),
+                None,
+                None,
+                self._settings.csm_wiki_ttl,
+            )
+            csm_wiki_dtos[batch_item_dto.skin] = batch_item_dto.csm_wiki
+        return csm_wiki_dtos
+
+    def _get_skin_link(self, weapon: str, skin: str) -> str:
+        return self._settings.csm_wiki_url.format(weapon=weapon, skin=skin)
@@ -0,0 +1,35 @@
+import asyncio
+import os
+from pathlib import Path
+
+from tg_bot_float_common_dtos.update_db_scheduler_dtos.source_data_names_dto import (
+    SourceDataNamesDTO,
+)
+from tg_bot_float_db_updater.db_updater_settings import DbUpdaterSettings
+from tg_bot_float_misc.source_data_tree_codec.source_data_snapshot import SourceDataSnapshot
+
+
+class SourceDataSnapshotStore:
+    """Keeps the snapshot last delivered to the db_app, deltas are computed against it."""
+
+    def __init__(self, settings: DbUpdaterSettings) -> None:
+        self._path = Path(settings.snapshot_path)
+
+    async def load(self) -> SourceDataSnapshot | None:
+        return await asyncio.to_thread(self._load)
+
+    async def save(self, snapshot: SourceDataSnapshot) -> None:
+        await asyncio.to_thread(self._save, snapshot)
+
+    def _load(self) -> SourceDataSnapshot | None:
+        try:
+            names_json = self._path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        return SourceDataSnapshot(SourceDataNamesDTO.model_validate_json(names_json))
+
+    def _save(self, snapshot: SourceDataSnapshot) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_suffix(".tmp")
+        tmp_path.write_text(snapshot.names_dto.model_dump_json(), encoding="utf-8")
+        os.replace(tmp_path, self._path)
@@ -0,0 +1,4 @@
+EMPTY_SKINS_PAGE_ERROR_MSG = "Skins page of {weapon!r} is empty"
+CATALOG_CUT_OFF_ERROR_MSG = "csgo_db catalog stream ended before its summary"
+CIRCUIT_OPEN_ERROR_MSG = "Circuit of {endpoint!r} is open, request skipped"
+RETRIES_EXHAUSTED_ERROR_MSG = "{endpoint!r} failed {attempts} times, last error: {error!r}"
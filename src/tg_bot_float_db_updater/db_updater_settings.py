@@ -7,9 +7,24 @@ class DbUpdaterSettings(BaseSettings):
     )
 
     db_update_url: str
+    db_apply_delta_url: str
+    snapshot_path: str
     csgo_db_url: str
-    csgo_db_weapons_url: str
+    csgo_db_catalog_url: str
     csgo_db_skins_url: str
-    csgo_db_gloves_url: str
-    csgo_db_agents_url: str
     csm_wiki_url: str
+    csm_wiki_batch_url: str
+    csgo_db_skins_ttl: float
+    csm_wiki_ttl: float
+    response_cache_path: str
+    response_cache_max_bytes: int
+    retry_max_attempts: int
+    retry_base_delay: float
+    retry_max_delay: float
+    circuit_failure_threshold: int
+    circuit_reset_timeout: float
+    crawl_workers: int
+    crawl_queue_size: int
+    crawl_host_concurrency: int
+    crawl_rate_per_second: float
+    crawl_burst: int
@@ -11,8 +11,14 @@ from tg_bot_float_db_updater.db_updater.source_data_getter.csm_wiki_source_gette
 from tg_bot_float_db_updater.db_updater.source_data_getter.csgo_db_source_getter import (
     CsgoDbSourceDataGetter,
 )
+from tg_bot_float_db_updater.db_updater.crawl_scheduler.crawl_scheduler import CrawlScheduler
 from tg_bot_float_db_updater.db_updater.db_updater_service import DbUpdaterService
 from tg_bot_float_db_updater.db_updater.db_update_sender import DbUpdateSender
+from tg_bot_float_db_updater.db_updater.response_cache.source_response_cache import (
+    SourceResponseCache,
+)
+from tg_bot_float_db_updater.db_updater.retry_policy.retry_policy import RetryPolicy
+from tg_bot_float_db_updater.db_updater.source_data_snapshot_store import SourceDataSnapshotStore
 from tg_bot_float_db_updater.db_updater_settings import DbUpdaterSettings
 
 
@@ -24,23 +30,56 @@ def get_db_updater_settings() -> DbUpdaterSettings:
 DB_UPDATER_SETTINGS = Annotated[DbUpdaterSettings, Depends(get_db_updater_settings)]
 
 
+@lru_cache
+def get_crawl_scheduler() -> CrawlScheduler:
+    return CrawlScheduler(get_db_updater_settings())
+
+
+CRAWL_SCHEDULER = Annotated[CrawlScheduler, Depends(get_crawl_scheduler)]
+
+
+@lru_cache
+def get_retry_policy() -> RetryPolicy:
+    return RetryPolicy(get_db_updater_settings())
+
+
+RETRY_POLICY = Annotated[RetryPolicy, Depends(get_retry_policy)]
+
+
+@lru_cache
+def get_source_response_cache() -> SourceResponseCache:
+    return SourceResponseCache(get_db_updater_settings())
+
+
+SOURCE_RESPONSE_CACHE = Annotated[SourceResponseCache, Depends(get_source_response_cache)]
+
+
 async def get_aiohttp_session() -> AsyncGenerator[ClientSession, Any]:
     async with ClientSession() as session:
         yield session
 
 
 async def get_updater_service(
-    settings: DB_UPDATER_SETTINGS, aiohttp_session: ClientSession = Depends(get_aiohttp_session)
+    settings: DB_UPDATER_SETTINGS,
+    crawl_scheduler: CRAWL_SCHEDULER,
+    response_cache: SOURCE_RESPONSE_CACHE,
+    retry_policy: RETRY_POLICY,
+    aiohttp_session: ClientSession = Depends(get_aiohttp_session),
 ) -> AsyncGenerator[DbUpdaterService, Any]:
     async with CsgoDbSourceDataGetter(
-        settings, aiohttp_session
-    ) as csgo_db, CsmWikiSourceGetter(settings, aiohttp_session) as csm_wiki, DbUpdateSender(
+        settings, aiohttp_session, response_cache
+    ) as csgo_db, CsmWikiSourceGetter(
+        settings, aiohttp_session, response_cache
+    ) as csm_wiki, DbUpdateSender(
         settings, aiohttp_session
     ) as db_sender:
         db_updater_service = DbUpdaterService(
             csgo_db,
             csm_wiki,
             db_sender,
+            SourceDataSnapshotStore(settings),
+            crawl_scheduler,
+            retry_policy,
         )
         try:
             yield db_updater_service
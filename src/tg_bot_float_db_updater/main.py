@@ -1,10 +1,15 @@
-from typing import List
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
 
 from fastapi import FastAPI
 
 from tg_bot_float_misc.router_controller.abstract_router_controller import (
     AbstractRouterController,
 )
+from tg_bot_float_db_updater.dependencies.services import (
+    get_crawl_scheduler,
+    get_source_response_cache,
+)
 from tg_bot_float_db_updater.router_controllers.db_updater_router_controller import (
     DbUpdaterRouterController,
 )
@@ -12,7 +17,14 @@ from tg_bot_float_db_updater.router_controllers.db_updater_router_controller imp
 
 router_controllers: List[AbstractRouterController] = [DbUpdaterRouterController()]
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    async with get_source_response_cache(), get_crawl_scheduler():
+        yield
+
+
+app = FastAPI(lifespan=lifespan)
 
 for controller in router_controllers:
     app.include_router(controller.router)
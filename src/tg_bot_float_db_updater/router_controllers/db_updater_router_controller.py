@@ -1,6 +1,8 @@
 from fastapi import APIRouter
 
-from tg_bot_float_db_updater.dependencies.services import DB_UPDATER_SERVICE
+from tg_bot_float_db_updater.db_updater.dtos.crawl_metrics_dto import CrawlMetricsDTO
+from tg_bot_float_db_updater.db_updater.dtos.db_update_result_dto import DbUpdateResultDTO
+from tg_bot_float_db_updater.dependencies.services import CRAWL_SCHEDULER, DB_UPDATER_SERVICE
 from tg_bot_float_misc.router_controller.abstract_router_controller import AbstractRouterController
 
 
@@ -11,6 +13,15 @@ class DbUpdaterRouterController(AbstractRouterController):
 
     def _init_routes(self) -> None:
         self._router.add_api_route("/update_db", self._update_db, methods=["GET"])
+        self._router.add_api_route(
+            "/update_db/progress",
+            self._get_update_progress,
+            methods=["GET"],
+            response_model=CrawlMetricsDTO,
+        )
 
-    async def _update_db(self, db_updater_service: DB_UPDATER_SERVICE) -> None:
-        await db_updater_service.update()
+    async def _update_db(self, db_updater_service: DB_UPDATER_SERVICE) -> DbUpdateResultDTO:
+        return await db_updater_service.update()
+
+    async def _get_update_progress(self, crawl_scheduler: CRAWL_SCHEDULER) -> CrawlMetricsDTO:
+        return crawl_scheduler.get_metrics()
@@ -0,0 +1,37 @@
+from pathlib import Path
+
+import pytest
+
+from tg_bot_float_db_updater.db_updater_settings import DbUpdaterSettings
+from tg_bot_float_db_updater.tests.fake_source_getters import (
+    FakeCsgoDbSourceDataGetter,
+    FakeCsmWikiSourceGetter,
+)
+
+
+@pytest.fixture
+def updater_settings(tmp_path: Path) -> DbUpdaterSettings:
+    return DbUpdaterSettings(  # type: ignore "Other variables from db_updater_variables.env file"
+        snapshot_path=str(tmp_path / "source_data_snapshot.json"),
+        response_cache_path=str(tmp_path / "response_cache.sqlite3"),
+        retry_max_attempts=1,
+        retry_base_delay=0,
+        retry_max_delay=0,
+        crawl_workers=4,
+        crawl_rate_per_second=1000,
+        crawl_burst=1000,
+    )
+
+
+@pytest.fixture
+def csgo_db_getter() -> FakeCsgoDbSourceDataGetter:
+    return FakeCsgoDbSourceDataGetter(
+        skins_by_weapon={"AK-47": ["Redline", "Vulcan"], "AWP": ["Asiimov"]},
+        skins_by_glove={"Driver Gloves": ["Crimson Weave"]},
+        skins_by_agent={"SAS": ["Cmdr. Mae"]},
+    )
+
+
+@pytest.fixture
+def csm_wiki_getter() -> FakeCsmWikiSourceGetter:
+    return FakeCsmWikiSourceGetter(["Field-Tested", "Minimal Wear"])
@@ -0,0 +1,102 @@
+from typing import Dict, List, Set, Tuple
+
+from tg_bot_float_common_dtos.csgo_db_source_dtos.agent_dto import AgentSkinsDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.agents_page_dto import AgentsPageDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.glove_dto import GloveSkinsDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.gloves_page_dto import GlovesPageDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.skin_dto import WeaponSkinsDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.skins_page_dto import SkinsPageDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.weapon_dto import CategoryWeaponsDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.weapons_page_dto import WeaponsPageDTO
+from tg_bot_float_common_dtos.csm_wiki_source_dtos.csm_wiki_dto import CsmWikiDTO
+from tg_bot_float_db_updater.db_updater.dtos.csgo_db_catalog_dto import CsgoDbCatalogDTO
+
+
+class FakeCsgoDbSourceDataGetter:
+    """In-memory csgo_db source, every page listed in `failing` raises on each request.
+
+    Weapons in `catalog_errors` only get an error record in the catalog, their own skins page
+    still answers.
+    """
+
+    host = "csgo_db"
+
+    def __init__(
+        self,
+        skins_by_weapon: Dict[str, List[str]],
+        skins_by_glove: Dict[str, List[str]],
+        skins_by_agent: Dict[str, List[str]],
+    ) -> None:
+        self.skins_by_weapon = skins_by_weapon
+        self.skins_by_glove = skins_by_glove
+        self.skins_by_agent = skins_by_agent
+        self.failing: Set[str] = set()
+        self.catalog_errors: Set[str] = set()
+        self.skins_page_requests: List[str] = []
+
+    async def get_catalog(self) -> CsgoDbCatalogDTO:
+        """A failing weapons, gloves or agents page fails the catalog, a weapon gets an error."""
+        for page in ("weapons", "gloves", "agents"):
+            self._check(page)
+        weapons = list(self.skins_by_weapon)
+        return CsgoDbCatalogDTO(
+            weapons=WeaponsPageDTO(
+                categories=[
+                    CategoryWeaponsDTO(category="Rifles", weapons=weapons, count=len(weapons))
+                ],
+                count=len(weapons),
+            ),
+            gloves=GlovesPageDTO(
+                gloves=[
+                    GloveSkinsDTO(glove_name=glove, skins=skins, count=len(skins))
+                    for glove, skins in self.skins_by_glove.items()
+                ],
+                count=len(self.skins_by_glove),
+            ),
+            agents=AgentsPageDTO(
+                agents=[
+                    AgentSkinsDTO(fraction_name=agent, skins=skins, count=len(skins))
+                    for agent, skins in self.skins_by_agent.items()
+                ],
+                count=len(self.skins_by_agent),
+            ),
+            skins={
+                weapon: self._get_skins_page(weapon)
+                for weapon in weapons
+                if weapon not in self.failing | self.catalog_errors
+            },
+        )
+
+    async def get_skins_page(self, weapon: str) -> SkinsPageDTO:
+        self.skins_page_requests.append(weapon)
+        self._check(weapon)
+        return self._get_skins_page(weapon)
+
+    def _get_skins_page(self, weapon: str) -> SkinsPageDTO:
+        skins = self.skins_by_weapon[weapon]
+        return SkinsPageDTO(
+            weapon_name=weapon,
+            skins=[
+                WeaponSkinsDTO(weapon_name=weapon, rarity="Covert", skins=skins, count=len(skins))
+            ],
+            count=len(skins),
+        )
+
+    def _check(self, page: str) -> None:
+        if page in self.failing:
+            raise ValueError(f"{page} page is unavailable")
+
+
+class FakeCsmWikiSourceGetter:
+    host = "csm_wiki"
+
+    def __init__(self, qualities: List[str]) -> None:
+        self.qualities = qualities
+        self.failing: Set[Tuple[str, str]] = set()
+
+    async def get_csm_wiki_skins_data(self, weapon: str, *skins: str) -> Dict[str, CsmWikiDTO]:
+        if any((weapon, skin) in self.failing for skin in skins):
+            raise ValueError(f"{weapon} batch is unavailable")
+        return {
+            skin: CsmWikiDTO(qualities=self.qualities, stattrak_existence=True) for skin in skins
+        }
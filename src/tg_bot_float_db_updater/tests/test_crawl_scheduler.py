@@ -0,0 +1,117 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from tg_bot_float_db_updater.db_updater.crawl_scheduler.crawl_priority import CrawlPriority
+from tg_bot_float_db_updater.db_updater.crawl_scheduler.crawl_scheduler import CrawlScheduler
+from tg_bot_float_db_updater.db_updater_settings import DbUpdaterSettings
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_in_priority_order(updater_settings: DbUpdaterSettings):
+    settings = updater_settings.model_copy(update={"crawl_workers": 1})
+    started = asyncio.Event()
+    release = asyncio.Event()
+    order: List[str] = []
+
+    async def block() -> None:
+        started.set()
+        await release.wait()
+
+    async def record(name: str) -> str:
+        order.append(name)
+        return name
+
+    async with CrawlScheduler(settings) as crawl_scheduler:
+        blocker = asyncio.create_task(crawl_scheduler.run(CrawlPriority.CATALOG, "host", block))
+        await started.wait()
+        jobs = [
+            asyncio.create_task(crawl_scheduler.run(priority, "host", record, name))
+            for priority, name in (
+                (CrawlPriority.QUALITIES, "qualities"),
+                (CrawlPriority.SKINS, "skins 1"),
+                (CrawlPriority.CATALOG, "catalog"),
+                (CrawlPriority.SKINS, "skins 2"),
+            )
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*jobs)
+        await blocker
+
+    assert order == ["catalog", "skins 1", "skins 2", "qualities"]
+    assert results == ["qualities", "skins 1", "catalog", "skins 2"]
+
+
+@pytest.mark.asyncio
+async def test_host_concurrency_is_capped(updater_settings: DbUpdaterSettings):
+    settings = updater_settings.model_copy(
+        update={"crawl_workers": 8, "crawl_host_concurrency": 2}
+    )
+    in_flight = {"host a": 0, "host b": 0}
+    max_in_flight = {"host a": 0, "host b": 0}
+
+    async def fetch(host: str) -> None:
+        in_flight[host] += 1
+        max_in_flight[host] = max(max_in_flight[host], in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+
+    async with CrawlScheduler(settings) as crawl_scheduler:
+        await asyncio.gather(
+            *(
+                crawl_scheduler.run(CrawlPriority.SKINS, host, fetch, host)
+                for host in ("host a", "host b")
+                for _ in range(6)
+            )
+        )
+
+    assert max_in_flight == {"host a": 2, "host b": 2}
+
+
+@pytest.mark.asyncio
+async def test_exception_is_raised_to_caller_and_counted(updater_settings: DbUpdaterSettings):
+    async def fail() -> None:
+        raise ValueError("upstream is down")
+
+    async def succeed() -> int:
+        return 1
+
+    async with CrawlScheduler(updater_settings) as crawl_scheduler:
+        with pytest.raises(ValueError, match="upstream is down"):
+            await crawl_scheduler.run(CrawlPriority.SKINS, "host", fail)
+        assert await crawl_scheduler.run(CrawlPriority.SKINS, "host", succeed) == 1
+
+        metrics = crawl_scheduler.get_metrics()
+
+    assert metrics.priorities["skins"].submitted == 2
+    assert metrics.priorities["skins"].completed == 1
+    assert metrics.priorities["skins"].failed == 1
+    assert metrics.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_full_queue_slows_producers_down(updater_settings: DbUpdaterSettings):
+    settings = updater_settings.model_copy(update={"crawl_workers": 1, "crawl_queue_size": 1})
+    release = asyncio.Event()
+
+    async def block() -> None:
+        await release.wait()
+
+    async with CrawlScheduler(settings) as crawl_scheduler:
+        jobs = [
+            asyncio.create_task(crawl_scheduler.run(CrawlPriority.SKINS, "host", block))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+
+        metrics = crawl_scheduler.get_metrics()
+        release.set()
+        await asyncio.gather(*jobs)
+
+    # One job is running, one is queued, the last producer waits for a free queue slot
+    assert metrics.in_flight == 1
+    assert metrics.queued == 1
+    assert metrics.priorities["skins"].submitted == 2
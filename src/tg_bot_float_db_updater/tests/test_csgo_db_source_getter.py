@@ -0,0 +1,112 @@
+from typing import AsyncGenerator, List
+
+import pytest
+import pytest_asyncio
+from pytest_mock import MockerFixture
+
+from tg_bot_float_common_dtos.csgo_db_source_dtos.agents_page_dto import AgentsPageDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.catalog_record_dto import CatalogRecordDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.catalog_summary_dto import CatalogSummaryDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.gloves_page_dto import GlovesPageDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.skin_dto import WeaponSkinsDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.skins_page_dto import SkinsPageDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.weapon_dto import CategoryWeaponsDTO
+from tg_bot_float_common_dtos.csgo_db_source_dtos.weapons_page_dto import WeaponsPageDTO
+from tg_bot_float_db_updater.db_updater.response_cache.source_response_cache import (
+    SourceResponseCache,
+)
+from tg_bot_float_db_updater.db_updater.source_data_getter.csgo_db_source_getter import (
+    CsgoDbSourceDataGetter,
+)
+from tg_bot_float_db_updater.db_updater_exception import DbUpdaterException
+from tg_bot_float_db_updater.db_updater_settings import DbUpdaterSettings
+
+CATALOG_RECORDS = [
+    CatalogRecordDTO(
+        weapons=WeaponsPageDTO(
+            categories=[
+                CategoryWeaponsDTO(category="rifles", weapons=["AK-47", "AWP", "M4A4"], count=3)
+            ],
+            count=3,
+        )
+    ),
+    CatalogRecordDTO(gloves=GlovesPageDTO(count=0)),
+    CatalogRecordDTO(agents=AgentsPageDTO(count=0)),
+    CatalogRecordDTO(
+        weapon="AK-47",
+        skins=SkinsPageDTO(
+            weapon_name="AK-47",
+            skins=[
+                WeaponSkinsDTO(weapon_name="AK-47", rarity="Covert", skins=["Redline"], count=1)
+            ],
+            count=1,
+        ),
+    ),
+    CatalogRecordDTO(weapon="AWP", error="Item with this name not found!"),
+    CatalogRecordDTO(weapon="M4A4", skins=SkinsPageDTO(weapon_name="M4A4", count=0)),
+    CatalogRecordDTO(summary=CatalogSummaryDTO(weapons=3, errors=1)),
+]
+
+
+@pytest_asyncio.fixture
+async def response_cache(
+    updater_settings: DbUpdaterSettings,
+) -> AsyncGenerator[SourceResponseCache, None]:
+    async with SourceResponseCache(updater_settings) as response_cache:
+        yield response_cache
+
+
+@pytest.fixture
+def session(mocker: MockerFixture):
+    """aiohttp session whose GET streams the `catalog_lines` attribute."""
+    session = mocker.MagicMock()
+    session.catalog_lines = []
+
+    async def iter_lines() -> AsyncGenerator[bytes, None]:
+        for line in session.catalog_lines:
+            yield line
+
+    def get(url: str):
+        response = mocker.MagicMock()
+        response.content = iter_lines()
+        response_context = mocker.MagicMock()
+        response_context.__aenter__ = mocker.AsyncMock(return_value=response)
+        response_context.__aexit__ = mocker.AsyncMock(return_value=None)
+        return response_context
+
+    session.get = mocker.MagicMock(side_effect=get)
+    return session
+
+
+def _to_ndjson(records: List[CatalogRecordDTO]) -> List[bytes]:
+    return [record.model_dump_json(exclude_none=True).encode() + b"\n" for record in records]
+
+
+@pytest.mark.asyncio
+async def test_catalog_stream_is_collected(
+    updater_settings: DbUpdaterSettings, session, response_cache: SourceResponseCache
+):
+    session.catalog_lines = _to_ndjson(CATALOG_RECORDS)
+    getter = CsgoDbSourceDataGetter(updater_settings, session, response_cache)
+
+    catalog_dto = await getter.get_catalog()
+
+    session.get.assert_called_once_with(
+        updater_settings.csgo_db_url + updater_settings.csgo_db_catalog_url
+    )
+    assert catalog_dto.weapons.count == 3
+    # The error record of AWP and the empty skins page of M4A4 are crawled again on their own
+    assert list(catalog_dto.skins) == ["AK-47"]
+
+
+@pytest.mark.asyncio
+async def test_cut_off_catalog_stream_raises(
+    updater_settings: DbUpdaterSettings, session, response_cache: SourceResponseCache
+):
+    session.catalog_lines = _to_ndjson(CATALOG_RECORDS[:-1])
+    getter = CsgoDbSourceDataGetter(updater_settings, session, response_cache)
+
+    with pytest.raises(DbUpdaterException) as exc_info:
+        await getter.get_catalog()
+
+    assert "before its summary" in exc_info.value.msg
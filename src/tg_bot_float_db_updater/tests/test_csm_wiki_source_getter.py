@@ -0,0 +1,95 @@
+from typing import Any, AsyncGenerator, List
+
+import pytest
+import pytest_asyncio
+from pytest_mock import MockerFixture
+
+from tg_bot_float_common_dtos.csm_wiki_source_dtos.csm_wiki_dto import CsmWikiDTO
+from tg_bot_float_db_updater.db_updater.response_cache.source_response_cache import (
+    SourceResponseCache,
+)
+from tg_bot_float_db_updater.db_updater.source_data_getter.csm_wiki_source_getter_service import (
+    CsmWikiSourceGetter,
+)
+from tg_bot_float_db_updater.db_updater_settings import DbUpdaterSettings
+
+
+@pytest_asyncio.fixture
+async def response_cache(
+    updater_settings: DbUpdaterSettings,
+) -> AsyncGenerator[SourceResponseCache, None]:
+    async with SourceResponseCache(updater_settings) as response_cache:
+        yield response_cache
+
+
+@pytest.fixture
+def session(mocker: MockerFixture):
+    """aiohttp session whose POST answers with the `batch_response` attribute."""
+    session = mocker.MagicMock()
+    session.batch_response = []
+
+    def post(url: str, json: List[Any]):
+        response = mocker.MagicMock()
+        response.json = mocker.AsyncMock(return_value=session.batch_response)
+        response_context = mocker.MagicMock()
+        response_context.__aenter__ = mocker.AsyncMock(return_value=response)
+        response_context.__aexit__ = mocker.AsyncMock(return_value=None)
+        return response_context
+
+    session.post = mocker.MagicMock(side_effect=post)
+    return session
+
+
+@pytest.mark.asyncio
+async def test_skins_are_fetched_in_one_batch_and_cached(
+    updater_settings: DbUpdaterSettings, session, response_cache: SourceResponseCache
+):
+    getter = CsmWikiSourceGetter(updater_settings, session, response_cache)
+    session.batch_response = [
+        {
+            "weapon": "AK-47",
+            "skin": "Redline",
+            "csm_wiki": {"qualities": ["Field-Tested"], "stattrak_existence": True},
+        },
+        {"weapon": "AK-47", "skin": "Fire Serpent", "error": "no info about provided skin"},
+    ]
+
+    csm_wiki_dtos = await getter.get_csm_wiki_skins_data("AK-47", "Redline", "Fire Serpent")
+
+    assert csm_wiki_dtos == {
+        "Redline": CsmWikiDTO(qualities=["Field-Tested"], stattrak_existence=True),
+        "Fire Serpent": CsmWikiDTO(),
+    }
+    session.post.assert_called_once_with(
+        updater_settings.csm_wiki_batch_url,
+        json=[
+            {"weapon": "AK-47", "skin": "Redline"},
+            {"weapon": "AK-47", "skin": "Fire Serpent"},
+        ],
+    )
+
+    # Only the skin without info is requested again
+    session.batch_response = [{"weapon": "AK-47", "skin": "Fire Serpent", "error": "no info"}]
+    csm_wiki_dtos = await getter.get_csm_wiki_skins_data("AK-47", "Redline", "Fire Serpent")
+
+    assert csm_wiki_dtos["Redline"].qualities == ["Field-Tested"]
+    assert session.post.call_args.kwargs["json"] == [{"weapon": "AK-47", "skin": "Fire Serpent"}]
+
+
+@pytest.mark.asyncio
+async def test_cached_skins_are_not_requested(
+    updater_settings: DbUpdaterSettings, session, response_cache: SourceResponseCache
+):
+    getter = CsmWikiSourceGetter(updater_settings, session, response_cache)
+    await response_cache.put(
+        updater_settings.csm_wiki_url.format(weapon="AWP", skin="Asiimov"),
+        CsmWikiDTO(qualities=["Battle-Scarred"]).model_dump_json(),
+        None,
+        None,
+        60,
+    )
+
+    csm_wiki_dtos = await getter.get_csm_wiki_skins_data("AWP", "Asiimov")
+
+    assert csm_wiki_dtos == {"Asiimov": CsmWikiDTO(qualities=["Battle-Scarred"])}
+    session.post.assert_not_called()
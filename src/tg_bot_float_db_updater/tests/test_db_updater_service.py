@@ -0,0 +1,249 @@
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from pytest_mock import MockerFixture
+
+from tg_bot_float_common_dtos.update_db_scheduler_dtos.source_data_names_dto import (
+    SourceDataNamesDTO,
+)
+from tg_bot_float_db_updater.db_updater.crawl_scheduler.crawl_scheduler import CrawlScheduler
+from tg_bot_float_db_updater.db_updater.db_updater_service import DbUpdaterService
+from tg_bot_float_db_updater.db_updater.retry_policy.retry_policy import RetryPolicy
+from tg_bot_float_db_updater.db_updater.source_data_snapshot_store import SourceDataSnapshotStore
+from tg_bot_float_db_updater.db_updater_settings import DbUpdaterSettings
+from tg_bot_float_db_updater.tests.fake_source_getters import (
+    FakeCsgoDbSourceDataGetter,
+    FakeCsmWikiSourceGetter,
+)
+
+
+@pytest_asyncio.fixture
+async def crawl_scheduler(
+    updater_settings: DbUpdaterSettings,
+) -> AsyncGenerator[CrawlScheduler, None]:
+    async with CrawlScheduler(updater_settings) as crawl_scheduler:
+        yield crawl_scheduler
+
+
+@pytest.fixture
+def db_update_sender(mocker: MockerFixture):
+    db_update_sender = mocker.Mock()
+    db_update_sender.send = mocker.AsyncMock()
+    db_update_sender.send_delta = mocker.AsyncMock(return_value=True)
+    return db_update_sender
+
+
+@pytest.fixture
+def snapshot_store(updater_settings: DbUpdaterSettings) -> SourceDataSnapshotStore:
+    return SourceDataSnapshotStore(updater_settings)
+
+
+@pytest.fixture
+def db_updater_service(
+    updater_settings: DbUpdaterSettings,
+    csgo_db_getter: FakeCsgoDbSourceDataGetter,
+    csm_wiki_getter: FakeCsmWikiSourceGetter,
+    db_update_sender,
+    snapshot_store: SourceDataSnapshotStore,
+    crawl_scheduler: CrawlScheduler,
+) -> DbUpdaterService:
+    return DbUpdaterService(
+        csgo_db_getter,  # type: ignore "Duck-typed fake getter"
+        csm_wiki_getter,  # type: ignore "Duck-typed fake getter"
+        db_update_sender,
+        snapshot_store,
+        crawl_scheduler,
+        RetryPolicy(updater_settings),
+    )
+
+
+@pytest.mark.asyncio
+async def test_first_update_sends_full_catalog(
+    db_updater_service: DbUpdaterService, db_update_sender, snapshot_store: SourceDataSnapshotStore
+):
+    result = await db_updater_service.update()
+
+    assert result.sent is True
+    assert result.dead_letters == []
+    db_update_sender.send.assert_awaited_once()
+    db_update_sender.send_delta.assert_not_awaited()
+    snapshot = await snapshot_store.load()
+    assert snapshot is not None
+    assert snapshot.names_dto.weapons == ["AK-47", "AWP"]
+    assert ("AK-47", "Redline", "Field-Tested", True) in snapshot.names_dto.relations
+
+
+@pytest.mark.asyncio
+async def test_unchanged_catalog_checks_db_app_snapshot(
+    db_updater_service: DbUpdaterService, db_update_sender
+):
+    await db_updater_service.update()
+    db_update_sender.send.reset_mock()
+
+    result = await db_updater_service.update()
+
+    assert result.sent is False
+    db_update_sender.send.assert_not_awaited()
+    delta_dto = db_update_sender.send_delta.await_args.args[0]
+    assert delta_dto.base_hash == delta_dto.target_hash
+
+
+@pytest.mark.asyncio
+async def test_unchanged_catalog_is_sent_when_db_app_is_at_another_snapshot(
+    db_updater_service: DbUpdaterService, db_update_sender
+):
+    await db_updater_service.update()
+    db_update_sender.send.reset_mock()
+    db_update_sender.send_delta.return_value = False
+
+    result = await db_updater_service.update()
+
+    assert result.sent is True
+    db_update_sender.send.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_changed_catalog_is_sent_as_delta(
+    db_updater_service: DbUpdaterService,
+    db_update_sender,
+    csgo_db_getter: FakeCsgoDbSourceDataGetter,
+):
+    await db_updater_service.update()
+    db_update_sender.send.reset_mock()
+    csgo_db_getter.skins_by_weapon["AWP"] = ["Asiimov", "Dragon Lore"]
+
+    result = await db_updater_service.update()
+
+    assert result.sent is True
+    db_update_sender.send.assert_not_awaited()
+    delta_dto = db_update_sender.send_delta.await_args.args[0]
+    assert delta_dto.added.skins == ["Dragon Lore"]
+    assert delta_dto.removed == SourceDataNamesDTO()
+
+
+@pytest.mark.asyncio
+async def test_failed_first_update_is_not_sent(
+    db_updater_service: DbUpdaterService,
+    db_update_sender,
+    csgo_db_getter: FakeCsgoDbSourceDataGetter,
+):
+    csgo_db_getter.failing.add("gloves")
+
+    result = await db_updater_service.update()
+
+    assert result.sent is False
+    assert [dead_letter.endpoint for dead_letter in result.dead_letters] == [
+        "csgo_db/get_catalog"
+    ]
+    db_update_sender.send.assert_not_awaited()
+    db_update_sender.send_delta.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failed_subtrees_are_kept_in_delta(
+    db_updater_service: DbUpdaterService,
+    db_update_sender,
+    snapshot_store: SourceDataSnapshotStore,
+    csgo_db_getter: FakeCsgoDbSourceDataGetter,
+    csm_wiki_getter: FakeCsmWikiSourceGetter,
+):
+    await db_updater_service.update()
+    previous_snapshot = await snapshot_store.load()
+    assert previous_snapshot is not None
+    csgo_db_getter.skins_by_weapon = {"AK-47": ["Redline"], "AWP": [], "M4A4": ["Howl"]}
+    csgo_db_getter.skins_by_glove = {}
+    csgo_db_getter.failing.add("AWP")
+    csm_wiki_getter.failing.add(("AK-47", "Redline"))
+
+    result = await db_updater_service.update()
+
+    assert result.sent is True
+    assert sorted(dead_letter.endpoint for dead_letter in result.dead_letters) == [
+        "csgo_db/get_skins_page",
+        "csm_wiki/get_csm_wiki_skins_data",
+    ]
+    db_update_sender.send.assert_awaited_once()  # The first update only
+    delta_dto = db_update_sender.send_delta.await_args.args[0]
+    assert delta_dto.base_hash == previous_snapshot.hash
+    # Rows of the crawled subtrees are added and removed
+    assert delta_dto.added.weapons == ["M4A4"]
+    assert delta_dto.added.skins == ["Howl"]
+    assert delta_dto.removed.gloves == ["Driver Gloves"]
+    assert delta_dto.removed.glove_relations == [("Driver Gloves", "Crimson Weave")]
+    assert delta_dto.removed.relations == [
+        ("AK-47", "Vulcan", "Field-Tested", True),
+        ("AK-47", "Vulcan", "Minimal Wear", True),
+    ]
+    assert sorted(delta_dto.removed.skins) == ["Crimson Weave", "Vulcan"]
+    # Rows under the AWP skins page and the AK-47 | Redline csm_wiki page stay
+    assert delta_dto.removed.weapons == []
+    snapshot = await snapshot_store.load()
+    assert snapshot is not None
+    assert snapshot.hash == delta_dto.target_hash
+    assert ("AWP", "Asiimov", "Field-Tested", True) in snapshot.names_dto.relations
+    assert ("AK-47", "Redline", "Minimal Wear", True) in snapshot.names_dto.relations
+    assert ("SAS", "Cmdr. Mae") in snapshot.names_dto.agent_relations
+
+
+@pytest.mark.asyncio
+async def test_failed_update_is_not_sent_when_db_app_is_at_another_snapshot(
+    db_updater_service: DbUpdaterService,
+    db_update_sender,
+    snapshot_store: SourceDataSnapshotStore,
+    csgo_db_getter: FakeCsgoDbSourceDataGetter,
+):
+    await db_updater_service.update()
+    previous_snapshot = await snapshot_store.load()
+    db_update_sender.send.reset_mock()
+    db_update_sender.send_delta.return_value = False
+    csgo_db_getter.failing.add("weapons")
+
+    result = await db_updater_service.update()
+
+    assert result.sent is False
+    db_update_sender.send.assert_not_awaited()
+    snapshot = await snapshot_store.load()
+    assert snapshot is not None and previous_snapshot is not None
+    assert snapshot.hash == previous_snapshot.hash
+
+
+@pytest.mark.asyncio
+async def test_failed_catalog_keeps_every_csgo_db_subtree(
+    db_updater_service: DbUpdaterService,
+    db_update_sender,
+    snapshot_store: SourceDataSnapshotStore,
+    csgo_db_getter: FakeCsgoDbSourceDataGetter,
+):
+    await db_updater_service.update()
+    previous_snapshot = await snapshot_store.load()
+    db_update_sender.send.reset_mock()
+    csgo_db_getter.failing.add("agents")
+
+    result = await db_updater_service.update()
+
+    assert result.sent is False
+    db_update_sender.send.assert_not_awaited()
+    delta_dto = db_update_sender.send_delta.await_args.args[0]
+    assert delta_dto.removed == SourceDataNamesDTO()
+    snapshot = await snapshot_store.load()
+    assert snapshot is not None and previous_snapshot is not None
+    assert snapshot.hash == previous_snapshot.hash
+
+
+@pytest.mark.asyncio
+async def test_catalog_error_record_falls_back_to_skins_page(
+    db_updater_service: DbUpdaterService,
+    snapshot_store: SourceDataSnapshotStore,
+    csgo_db_getter: FakeCsgoDbSourceDataGetter,
+):
+    csgo_db_getter.catalog_errors.add("AWP")
+
+    result = await db_updater_service.update()
+
+    assert result.sent is True
+    assert result.dead_letters == []
+    assert csgo_db_getter.skins_page_requests == ["AWP"]
+    snapshot = await snapshot_store.load()
+    assert snapshot is not None
+    assert ("AWP", "Asiimov", "Field-Tested", True) in snapshot.names_dto.relations
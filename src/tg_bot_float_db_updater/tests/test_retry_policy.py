@@ -0,0 +1,125 @@
+import pytest
+from aiohttp import ClientError
+from pytest_mock import MockerFixture
+
+from tg_bot_float_db_updater.db_updater.retry_policy import circuit_breaker
+from tg_bot_float_db_updater.db_updater.retry_policy.circuit_breaker import CircuitBreaker
+from tg_bot_float_db_updater.db_updater.retry_policy.retry_policy import RetryPolicy
+from tg_bot_float_db_updater.db_updater_exception import DbUpdaterException
+from tg_bot_float_db_updater.db_updater_settings import DbUpdaterSettings
+
+
+class FlakyCall:
+    """Raises `error` on the first `failures` calls, then returns the call number."""
+
+    def __init__(self, failures: int, error: Exception) -> None:
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self) -> int:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        return self.calls
+
+
+@pytest.fixture
+def retry_settings(updater_settings: DbUpdaterSettings) -> DbUpdaterSettings:
+    return updater_settings.model_copy(
+        update={
+            "retry_max_attempts": 3,
+            "circuit_failure_threshold": 5,
+            "circuit_reset_timeout": 60,
+        }
+    )
+
+
+@pytest.fixture
+def monotonic(mocker: MockerFixture):
+    # Replace the module reference only, the event loop keeps the real clock
+    time_mock = mocker.patch.object(circuit_breaker, "time")
+    time_mock.monotonic.return_value = 100.0
+    return time_mock.monotonic
+
+
+def test_circuit_opens_after_failure_threshold(monotonic):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.allows_request()
+    breaker.record_failure()
+
+    assert not breaker.allows_request()
+
+
+def test_success_resets_failures(monotonic):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.allows_request()
+
+
+def test_circuit_half_opens_after_reset_timeout(monotonic):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+    for _ in range(3):
+        breaker.record_failure()
+
+    monotonic.return_value = 109.9
+    assert not breaker.allows_request()
+    monotonic.return_value = 110.0
+    assert breaker.allows_request()
+    # One more failure opens the circuit again right away
+    breaker.record_failure()
+    assert not breaker.allows_request()
+
+
+@pytest.mark.asyncio
+async def test_retries_until_success(retry_settings: DbUpdaterSettings):
+    call = FlakyCall(failures=2, error=ClientError("connection reset"))
+
+    assert await RetryPolicy(retry_settings).run("csgo_db/get_catalog", call) == 3
+
+
+@pytest.mark.asyncio
+async def test_raises_once_attempts_are_exhausted(retry_settings: DbUpdaterSettings):
+    call = FlakyCall(failures=3, error=ValueError("bad json"))
+
+    with pytest.raises(DbUpdaterException) as exc_info:
+        await RetryPolicy(retry_settings).run("csgo_db/get_catalog", call)
+
+    assert call.calls == 3
+    assert "failed 3 times" in exc_info.value.msg
+    assert "bad json" in exc_info.value.msg
+
+
+@pytest.mark.asyncio
+async def test_not_retryable_exception_is_raised_right_away(retry_settings: DbUpdaterSettings):
+    call = FlakyCall(failures=1, error=KeyError("bug"))
+
+    with pytest.raises(KeyError):
+        await RetryPolicy(retry_settings).run("csgo_db/get_catalog", call)
+
+    assert call.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_skips_endpoint(retry_settings: DbUpdaterSettings, monotonic):
+    retry_policy = RetryPolicy(retry_settings.model_copy(update={"retry_max_attempts": 5}))
+    failing_call = FlakyCall(failures=10, error=ClientError("service unavailable"))
+    with pytest.raises(DbUpdaterException):
+        await retry_policy.run("csm_wiki/get_csm_wiki_skin_data", failing_call)
+
+    call = FlakyCall(failures=0, error=ClientError())
+    with pytest.raises(DbUpdaterException) as exc_info:
+        await retry_policy.run("csm_wiki/get_csm_wiki_skin_data", call)
+
+    assert failing_call.calls == 5
+    assert call.calls == 0
+    assert "is open" in exc_info.value.msg
+    # Other endpoints have their own circuit
+    assert await retry_policy.run("csgo_db/get_catalog", call) == 1
@@ -0,0 +1,55 @@
+import itertools
+from typing import Iterator, List, Self, Sequence
+
+from curl_cffi import CurlHttpVersion
+from curl_cffi.requests import AsyncSession
+
+SESSION_POOL_CLOSED_ERROR_MSG = "Session pool is used outside of the app lifespan!"
+
+
+class CurlSessionPool:
+    """Warm curl_cffi sessions kept for the app lifespan, requests rotate over them.
+
+    With `impersonate_targets` there is one session per impersonated browser, so consecutive
+    requests present different TLS fingerprints while reusing already established connections.
+    Otherwise `session_count` plain sessions are opened; with HTTP/2 concurrent requests are
+    multiplexed over their connections instead of opening one connection per request.
+    """
+
+    def __init__(
+        self,
+        max_clients: int,
+        impersonate_targets: Sequence[str] = (),
+        session_count: int = 1,
+        http_version: CurlHttpVersion | None = None,
+    ) -> None:
+        self._impersonate_targets: List[str | None] = (
+            list(impersonate_targets) if impersonate_targets else [None] * session_count
+        )
+        self._max_clients = max_clients
+        self._http_version = http_version
+        self._sessions: List[AsyncSession] = []
+        self._rotation: Iterator[AsyncSession] | None = None
+
+    async def __aenter__(self) -> Self:
+        self._sessions = [
+            AsyncSession(
+                impersonate=target,  # type: ignore
+                http_version=self._http_version,
+                max_clients=self._max_clients,
+            )
+            for target in self._impersonate_targets
+        ]
+        self._rotation = itertools.cycle(self._sessions)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore
+        for session in self._sessions:
+            await session.close()
+        self._sessions = []
+        self._rotation = None
+
+    def get_session(self) -> AsyncSession:
+        if self._rotation is None:
+            raise RuntimeError(SESSION_POOL_CLOSED_ERROR_MSG)
+        return next(self._rotation)
@@ -1,30 +1,25 @@
 import abc
 
-from typing import Self
+from typing import Dict
 
 from curl_cffi.requests import AsyncSession
 from curl_cffi.requests.models import Response
 
+from tg_bot_float_misc.curl_session_pool.curl_session_pool import CurlSessionPool
 
-class AbstractResponseService(abc.ABC):
-    def __init__(self) -> None:
-        self._session = None
-
-    async def __aenter__(self) -> Self:
-        self._session = AsyncSession(impersonate="chrome124")
-        return self
 
-    async def __aexit__(self, exc_type, exc_value, traceback) -> None:  # type: ignore
-        if self._session:
-            await self._session.close()
+class AbstractResponseService(abc.ABC):
+    def __init__(self, session_pool: CurlSessionPool) -> None:
+        self._session_pool = session_pool
 
     async def get_page_html(self, url: str) -> str:
-        if not self._session:
-            async with AsyncSession(impersonate="chrome124") as session:
-                response = await self._get_response(url, session)
-                return response.text
-        response = await self._get_response(url, self._session)
+        response = await self.get_page_response(url)
         return response.text
 
-    async def _get_response(self, url: str, session: AsyncSession) -> Response:
-        return await session.get(url)
+    async def get_page_response(self, url: str, headers: Dict[str, str] | None = None) -> Response:
+        return await self._get_response(url, self._session_pool.get_session(), headers)
+
+    async def _get_response(
+        self, url: str, session: AsyncSession, headers: Dict[str, str] | None = None
+    ) -> Response:
+        return await session.get(url, headers=headers)
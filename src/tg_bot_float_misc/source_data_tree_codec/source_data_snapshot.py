@@ -0,0 +1,108 @@
+import hashlib
+from typing import Any, Dict, List, Self
+
+from tg_bot_float_common_dtos.update_db_scheduler_dtos.source_data_delta_dto import (
+    SourceDataDeltaDTO,
+)
+from tg_bot_float_common_dtos.update_db_scheduler_dtos.source_data_names_dto import (
+    SourceDataNamesDTO,
+)
+from tg_bot_float_common_dtos.update_db_scheduler_dtos.source_data_tables_dto import (
+    SourceDataTablesDTO,
+)
+from tg_bot_float_common_dtos.update_db_scheduler_dtos.source_data_tree_dto import SourceDataTreeDTO
+
+
+class SourceDataSnapshot:
+    """Canonical (sorted, deduplicated) content of a source data tree and its hash.
+
+    The hash does not depend on the order in which the updater collected the data, so the
+    updater and the db_app get the same value for the same catalog.
+    """
+
+    def __init__(self, names_dto: SourceDataNamesDTO) -> None:
+        self._names_dto = SourceDataNamesDTO(
+            **{field: sorted(set(values)) for field, values in names_dto}
+        )
+        self._hash = hashlib.sha256(self._names_dto.model_dump_json().encode("utf-8")).hexdigest()
+
+    @classmethod
+    def from_tree(cls, db_dto: SourceDataTreeDTO) -> Self:
+        return cls(
+            SourceDataNamesDTO(
+                weapons=[str(weapon.name) for weapon in db_dto.weapons if weapon.name],
+                skins=[str(skin.name) for skin in db_dto.skins if skin.name],
+                qualities=[str(quality.name) for quality in db_dto.qualities if quality.name],
+                gloves=[str(glove.name) for glove in db_dto.gloves if glove.name],
+                agents=[str(agent.name) for agent in db_dto.agents if agent.name],
+                relations=[
+                    (
+                        str(relation.weapon.name),
+                        str(relation.skin.name),
+                        str(relation.quality.name),
+                        relation.stattrak_existence,
+                    )
+                    for relation in db_dto.relations
+                    if relation.weapon.name and relation.skin.name and relation.quality.name
+                ],
+                glove_relations=[
+                    (str(glove_relation.glove.name), str(skin.name))
+                    for glove_relation in db_dto.glove_relations
+                    if glove_relation.glove.name
+                    for skin in glove_relation.skins
+                    if skin.name
+                ],
+                agent_relations=[
+                    (str(agent_relation.agent.name), str(skin.name))
+                    for agent_relation in db_dto.agent_relations
+                    if agent_relation.agent.name
+                    for skin in agent_relation.skins
+                    if skin.name
+                ],
+            )
+        )
+
+    @classmethod
+    def from_tables(cls, tables_dto: SourceDataTablesDTO) -> Self:
+        weapons, skins, qualities = tables_dto.weapons, tables_dto.skins, tables_dto.qualities
+        gloves, agents = tables_dto.gloves, tables_dto.agents
+        return cls(
+            SourceDataNamesDTO(
+                weapons=weapons,
+                skins=skins,
+                qualities=qualities,
+                gloves=gloves,
+                agents=agents,
+                relations=[
+                    (weapons[weapon], skins[skin], qualities[quality], stattrak_existence)
+                    for weapon, skin, quality, stattrak_existence in tables_dto.relations
+                ],
+                glove_relations=[
+                    (gloves[glove], skins[skin]) for glove, skin in tables_dto.glove_relations
+                ],
+                agent_relations=[
+                    (agents[agent], skins[skin]) for agent, skin in tables_dto.agent_relations
+                ],
+            )
+        )
+
+    @property
+    def hash(self) -> str:
+        return self._hash
+
+    @property
+    def names_dto(self) -> SourceDataNamesDTO:
+        return self._names_dto
+
+    def get_delta(self, previous: "SourceDataSnapshot") -> SourceDataDeltaDTO:
+        added: Dict[str, List[Any]] = {}
+        removed: Dict[str, List[Any]] = {}
+        for (field, values), (_, previous_values) in zip(self._names_dto, previous.names_dto):
+            added[field] = sorted(set(values) - set(previous_values))
+            removed[field] = sorted(set(previous_values) - set(values))
+        return SourceDataDeltaDTO(
+            base_hash=previous.hash,
+            target_hash=self._hash,
+            added=SourceDataNamesDTO(**added),
+            removed=SourceDataNamesDTO(**removed),
+        )
@@ -0,0 +1,194 @@
+import json
+from typing import Any, Dict, Generator, List, Sequence, Tuple
+
+import brotli  # type: ignore
+
+from tg_bot_float_common_dtos.update_db_scheduler_dtos.source_data_tables_dto import (
+    SourceDataTablesDTO,
+)
+from tg_bot_float_common_dtos.update_db_scheduler_dtos.source_data_tree_dto import SourceDataTreeDTO
+from tg_bot_float_misc.source_data_tree_codec.source_data_tree_codec_exception import (
+    SourceDataTreeCodecException,
+)
+
+SOURCE_DATA_TREE_VERSION = 1
+SOURCE_DATA_TREE_CONTENT_TYPE = "application/x-source-data-tree"
+
+NAME_TABLES = ("weapons", "skins", "qualities", "gloves", "agents")
+
+# Wire format: brotli-compressed stream of newline-delimited JSON records.
+# The first record is {"version": N}, every next one is {"table": <name>, "rows": [...]}.
+# Name tables come first, relation rows hold indexes into them:
+#   relations        -> [weapon, skin, quality, stattrak_existence (0 or 1)]
+#   glove_relations  -> [glove, skin]
+#   agent_relations  -> [agent, skin]
+
+
+class SourceDataTreeEncoder:
+    def __init__(self, rows_per_record: int = 1000) -> None:
+        self._rows_per_record = rows_per_record
+
+    def encode(self, db_dto: SourceDataTreeDTO) -> Generator[bytes, None, None]:
+        compressor = brotli.Compressor()
+        for record in self._get_records(db_dto):
+            line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+            compressor.process(line.encode("utf-8"))
+            if compressed := compressor.flush():
+                yield compressed
+        yield compressor.finish()
+
+    def _get_records(self, db_dto: SourceDataTreeDTO) -> Generator[Dict[str, Any], None, None]:
+        yield {"version": SOURCE_DATA_TREE_VERSION}
+
+        indexes: Dict[str, Dict[str, int]] = {}
+        for table in NAME_TABLES:
+            names = [str(dto.name) for dto in getattr(db_dto, table) if dto.name]
+            indexes[table] = {name: index for index, name in enumerate(names)}
+            yield from self._get_table_records(table, names)
+
+        weapons, skins, qualities = indexes["weapons"], indexes["skins"], indexes["qualities"]
+        relation_rows = [
+            [
+                weapons[str(relation.weapon.name)],
+                skins[str(relation.skin.name)],
+                qualities[str(relation.quality.name)],
+                int(relation.stattrak_existence),
+            ]
+            for relation in db_dto.relations
+            if relation.weapon.name and relation.skin.name and relation.quality.name
+        ]
+        yield from self._get_table_records("relations", relation_rows)
+
+        gloves, agents = indexes["gloves"], indexes["agents"]
+        glove_relation_rows = [
+            [gloves[str(glove_relation.glove.name)], skins[str(skin.name)]]
+            for glove_relation in db_dto.glove_relations
+            if glove_relation.glove.name
+            for skin in glove_relation.skins
+            if skin.name
+        ]
+        yield from self._get_table_records("glove_relations", glove_relation_rows)
+
+        agent_relation_rows = [
+            [agents[str(agent_relation.agent.name)], skins[str(skin.name)]]
+            for agent_relation in db_dto.agent_relations
+            if agent_relation.agent.name
+            for skin in agent_relation.skins
+            if skin.name
+        ]
+        yield from self._get_table_records("agent_relations", agent_relation_rows)
+
+    def _get_table_records(
+        self, table: str, rows: Sequence[Any]
+    ) -> Generator[Dict[str, Any], None, None]:
+        for start in range(0, len(rows), self._rows_per_record):
+            yield {"table": table, "rows": rows[start : start + self._rows_per_record]}
+
+
+class SourceDataTreeDecoder:
+    """Incremental decoder: `feed` stream chunks as they arrive, then call `finish`."""
+
+    def __init__(self) -> None:
+        self._decompressor = brotli.Decompressor()
+        self._buffer = b""
+        self._version: int | None = None
+        self._names: Dict[str, List[str]] = {table: [] for table in NAME_TABLES}
+        self._relations: List[Tuple[int, int, int, bool]] = []
+        self._glove_relations: List[Tuple[int, int]] = []
+        self._agent_relations: List[Tuple[int, int]] = []
+
+    def feed(self, chunk: bytes) -> None:
+        try:
+            self._buffer += self._decompressor.process(chunk)
+        except brotli.error as exc:
+            raise SourceDataTreeCodecException("Payload is not a valid brotli stream!") from exc
+        *lines, self._buffer = self._buffer.split(b"\n")
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                raise SourceDataTreeCodecException("Payload record is not valid JSON!") from exc
+            self._read_record(record)
+
+    def finish(self) -> SourceDataTablesDTO:
+        if not self._decompressor.is_finished() or self._buffer:
+            raise SourceDataTreeCodecException("Payload stream is truncated!")
+        if self._version is None:
+            raise SourceDataTreeCodecException("Payload is empty!")
+        return SourceDataTablesDTO.model_construct(
+            **self._names,
+            relations=self._relations,
+            glove_relations=self._glove_relations,
+            agent_relations=self._agent_relations,
+        )
+
+    def _read_record(self, record: Any) -> None:
+        if not isinstance(record, dict):
+            raise SourceDataTreeCodecException("Payload record must be an object!")
+        if self._version is None:
+            self._read_version(record)
+            return
+        table, rows = record.get("table"), record.get("rows")
+        if not isinstance(rows, list):
+            raise SourceDataTreeCodecException(f"Rows of {table!r} table must be a list!")
+        if table in self._names:
+            self._read_names(table, rows)
+        elif table == "relations":
+            self._read_relations(rows)
+        elif table == "glove_relations":
+            self._glove_relations.extend(self._read_pairs(table, "gloves", rows))
+        elif table == "agent_relations":
+            self._agent_relations.extend(self._read_pairs(table, "agents", rows))
+        else:
+            raise SourceDataTreeCodecException(f"Unknown table {table!r} in payload!")
+
+    def _read_version(self, record: Dict[str, Any]) -> None:
+        version = record.get("version")
+        if version != SOURCE_DATA_TREE_VERSION:
+            raise SourceDataTreeCodecException(
+                f"Unsupported payload version {version!r}, expected {SOURCE_DATA_TREE_VERSION}!"
+            )
+        self._version = version
+
+    def _read_names(self, table: str, rows: List[Any]) -> None:
+        if not all(isinstance(name, str) and name for name in rows):
+            raise SourceDataTreeCodecException(
+                f"Names of {table!r} table must be non-empty strings!"
+            )
+        self._names[table].extend(rows)
+
+    def _read_relations(self, rows: List[Any]) -> None:
+        weapons_count = len(self._names["weapons"])
+        skins_count = len(self._names["skins"])
+        qualities_count = len(self._names["qualities"])
+        for row in rows:
+            try:
+                weapon, skin, quality, stattrak_existence = row
+            except (TypeError, ValueError) as exc:
+                raise SourceDataTreeCodecException(f"Malformed relation row {row!r}!") from exc
+            if not (
+                self._is_index(weapon, weapons_count)
+                and self._is_index(skin, skins_count)
+                and self._is_index(quality, qualities_count)
+                and stattrak_existence in (0, 1)
+            ):
+                raise SourceDataTreeCodecException(f"Malformed relation row {row!r}!")
+            self._relations.append((weapon, skin, quality, bool(stattrak_existence)))
+
+    def _read_pairs(
+        self, table: str, owner_table: str, rows: List[Any]
+    ) -> Generator[Tuple[int, int], None, None]:
+        owners_count = len(self._names[owner_table])
+        skins_count = len(self._names["skins"])
+        for row in rows:
+            try:
+                owner, skin = row
+            except (TypeError, ValueError) as exc:
+                raise SourceDataTreeCodecException(f"Malformed {table!r} row {row!r}!") from exc
+            if not (self._is_index(owner, owners_count) and self._is_index(skin, skins_count)):
+                raise SourceDataTreeCodecException(f"Malformed {table!r} row {row!r}!")
+            yield owner, skin
+
+    @staticmethod
+    def _is_index(value: Any, count: int) -> bool:
+        return type(value) is int and 0 <= value < count
@@ -0,0 +1,3 @@
+class SourceDataTreeCodecException(Exception):
+    def __init__(self, msg: str):
+        self.msg = msg
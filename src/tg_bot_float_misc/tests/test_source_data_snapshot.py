@@ -0,0 +1,97 @@
+from tg_bot_float_common_dtos.update_db_scheduler_dtos.source_data_names_dto import (
+    SourceDataNamesDTO,
+)
+from tg_bot_float_misc.source_data_tree_codec.source_data_snapshot import SourceDataSnapshot
+
+
+def test_hash_does_not_depend_on_order_and_duplicates():
+    snapshot = SourceDataSnapshot(
+        SourceDataNamesDTO(weapons=["AWP", "AK-47"], skins=["Redline", "Asiimov", "Redline"])
+    )
+    same_snapshot = SourceDataSnapshot(
+        SourceDataNamesDTO(weapons=["AK-47", "AWP"], skins=["Asiimov", "Redline"])
+    )
+
+    assert snapshot.hash == same_snapshot.hash
+    assert snapshot.names_dto.skins == ["Asiimov", "Redline"]
+
+
+def test_get_delta():
+    previous = SourceDataSnapshot(
+        SourceDataNamesDTO(
+            weapons=["AK-47", "M4A4"],
+            skins=["Redline", "Howl"],
+            qualities=["Field-Tested"],
+            relations=[
+                ("AK-47", "Redline", "Field-Tested", True),
+                ("M4A4", "Howl", "Field-Tested", False),
+            ],
+            glove_relations=[("Driver Gloves", "Crimson Weave")],
+        )
+    )
+    snapshot = SourceDataSnapshot(
+        SourceDataNamesDTO(
+            weapons=["AK-47", "AWP"],
+            skins=["Redline", "Asiimov"],
+            qualities=["Field-Tested"],
+            relations=[
+                ("AK-47", "Redline", "Field-Tested", False),
+                ("AWP", "Asiimov", "Field-Tested", True),
+            ],
+            glove_relations=[("Driver Gloves", "Crimson Weave")],
+        )
+    )
+
+    delta = snapshot.get_delta(previous)
+
+    assert delta.base_hash == previous.hash
+    assert delta.target_hash == snapshot.hash
+    assert delta.added.weapons == ["AWP"]
+    assert delta.removed.weapons == ["M4A4"]
+    assert delta.added.skins == ["Asiimov"]
+    assert delta.removed.skins == ["Howl"]
+    assert delta.added.qualities == delta.removed.qualities == []
+    # Changed stattrak_existence is a removed and an added row
+    assert delta.added.relations == [
+        ("AK-47", "Redline", "Field-Tested", False),
+        ("AWP", "Asiimov", "Field-Tested", True),
+    ]
+    assert delta.removed.relations == [
+        ("AK-47", "Redline", "Field-Tested", True),
+        ("M4A4", "Howl", "Field-Tested", False),
+    ]
+    assert delta.added.glove_relations == delta.removed.glove_relations == []
+
+
+def test_get_delta_of_unchanged_snapshot_is_empty():
+    names_dto = SourceDataNamesDTO(
+        weapons=["AK-47"], skins=["Redline"], agent_relations=[("SAS", "Redline")]
+    )
+    previous, snapshot = SourceDataSnapshot(names_dto), SourceDataSnapshot(names_dto)
+
+    delta = snapshot.get_delta(previous)
+
+    assert delta.base_hash == delta.target_hash
+    assert delta.added == delta.removed == SourceDataNamesDTO()
+
+
+def test_get_delta_applied_to_previous_gives_snapshot():
+    previous = SourceDataSnapshot(
+        SourceDataNamesDTO(weapons=["AK-47", "M4A4"], gloves=["Hand Wraps"], agents=["SAS"])
+    )
+    snapshot = SourceDataSnapshot(
+        SourceDataNamesDTO(weapons=["AK-47", "AWP"], gloves=["Driver Gloves"], agents=["SAS"])
+    )
+
+    delta = snapshot.get_delta(previous)
+    applied = SourceDataSnapshot(
+        SourceDataNamesDTO(
+            **{
+                field: (set(values) - set(getattr(delta.removed, field)))
+                | set(getattr(delta.added, field))
+                for field, values in previous.names_dto
+            }
+        )
+    )
+
+    assert applied.hash == snapshot.hash
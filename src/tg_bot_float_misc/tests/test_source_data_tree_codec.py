@@ -0,0 +1,213 @@
+from typing import List
+
+import brotli  # type: ignore
+import pytest
+
+from tg_bot_float_common_dtos.schema_dtos.agent_dto import AgentDTO
+from tg_bot_float_common_dtos.schema_dtos.glove_dto import GloveDTO
+from tg_bot_float_common_dtos.schema_dtos.quality_dto import QualityDTO
+from tg_bot_float_common_dtos.schema_dtos.skin_dto import SkinDTO
+from tg_bot_float_common_dtos.schema_dtos.weapon_dto import WeaponDTO
+from tg_bot_float_common_dtos.update_db_scheduler_dtos.agent_relation_dto import AgentRelationDTO
+from tg_bot_float_common_dtos.update_db_scheduler_dtos.glove_relation_dto import GloveRelationDTO
+from tg_bot_float_common_dtos.update_db_scheduler_dtos.relation_data_dto import RelationDataDTO
+from tg_bot_float_common_dtos.update_db_scheduler_dtos.source_data_tree_dto import SourceDataTreeDTO
+from tg_bot_float_misc.source_data_tree_codec.source_data_snapshot import SourceDataSnapshot
+from tg_bot_float_misc.source_data_tree_codec.source_data_tree_codec import (
+    SourceDataTreeDecoder,
+    SourceDataTreeEncoder,
+)
+from tg_bot_float_misc.source_data_tree_codec.source_data_tree_codec_exception import (
+    SourceDataTreeCodecException,
+)
+
+
+@pytest.fixture
+def source_data_tree() -> SourceDataTreeDTO:
+    ak, awp = WeaponDTO(name="AK-47"), WeaponDTO(name="AWP")
+    redline, asiimov, crimson_web = (
+        SkinDTO(name="Redline"),
+        SkinDTO(name="Asiimov"),
+        SkinDTO(name="Crimson Web"),
+    )
+    field_tested, minimal_wear = QualityDTO(name="Field-Tested"), QualityDTO(name="Minimal Wear")
+    driver_gloves = GloveDTO(name="Driver Gloves")
+    sas = AgentDTO(name="SAS")
+    return SourceDataTreeDTO(
+        weapons=[ak, awp],
+        skins=[redline, asiimov, crimson_web],
+        qualities=[field_tested, minimal_wear],
+        gloves=[driver_gloves],
+        agents=[sas],
+        relations=[
+            RelationDataDTO(weapon=ak, skin=redline, quality=field_tested, stattrak_existence=True),
+            RelationDataDTO(
+                weapon=awp, skin=asiimov, quality=minimal_wear, stattrak_existence=False
+            ),
+        ],
+        glove_relations=[GloveRelationDTO(glove=driver_gloves, skins=[crimson_web])],
+        agent_relations=[AgentRelationDTO(agent=sas, skins=[redline])],
+    )
+
+
+def decode(chunks: List[bytes]) -> SourceDataTreeDecoder:
+    decoder = SourceDataTreeDecoder()
+    for chunk in chunks:
+        decoder.feed(chunk)
+    return decoder
+
+
+def compress_lines(*lines: bytes) -> bytes:
+    return brotli.compress(b"".join(line + b"\n" for line in lines))
+
+
+@pytest.mark.parametrize("rows_per_record", [1, 1000])
+def test_round_trip(source_data_tree: SourceDataTreeDTO, rows_per_record: int):
+    chunks = list(SourceDataTreeEncoder(rows_per_record).encode(source_data_tree))
+
+    tables_dto = decode(chunks).finish()
+
+    assert tables_dto.weapons == ["AK-47", "AWP"]
+    assert tables_dto.skins == ["Redline", "Asiimov", "Crimson Web"]
+    assert tables_dto.qualities == ["Field-Tested", "Minimal Wear"]
+    assert tables_dto.gloves == ["Driver Gloves"]
+    assert tables_dto.agents == ["SAS"]
+    assert tables_dto.relations == [(0, 0, 0, True), (1, 1, 1, False)]
+    assert tables_dto.glove_relations == [(0, 2)]
+    assert tables_dto.agent_relations == [(0, 0)]
+    assert (
+        SourceDataSnapshot.from_tables(tables_dto).hash
+        == SourceDataSnapshot.from_tree(source_data_tree).hash
+    )
+
+
+def test_round_trip_byte_by_byte(source_data_tree: SourceDataTreeDTO):
+    payload = b"".join(SourceDataTreeEncoder().encode(source_data_tree))
+
+    tables_dto = decode([payload[index : index + 1] for index in range(len(payload))]).finish()
+
+    assert (
+        SourceDataSnapshot.from_tables(tables_dto).hash
+        == SourceDataSnapshot.from_tree(source_data_tree).hash
+    )
+
+
+def test_round_trip_duplicate_names(source_data_tree: SourceDataTreeDTO):
+    duplicated_tree = source_data_tree.model_copy(
+        update={
+            "weapons": source_data_tree.weapons + [WeaponDTO(name="AK-47")],
+            "skins": source_data_tree.skins + [SkinDTO(name="Redline")],
+        }
+    )
+
+    tables_dto = decode(list(SourceDataTreeEncoder().encode(duplicated_tree))).finish()
+
+    assert tables_dto.weapons == ["AK-47", "AWP", "AK-47"]
+    assert tables_dto.skins == ["Redline", "Asiimov", "Crimson Web", "Redline"]
+    for weapon, skin, _, _ in tables_dto.relations:
+        assert tables_dto.weapons[weapon] in ("AK-47", "AWP")
+        assert tables_dto.skins[skin] in ("Redline", "Asiimov")
+    assert (
+        SourceDataSnapshot.from_tables(tables_dto).hash
+        == SourceDataSnapshot.from_tree(source_data_tree).hash
+    )
+
+
+def test_round_trip_unnamed_items(source_data_tree: SourceDataTreeDTO):
+    unnamed_weapon, unnamed_skin = WeaponDTO(name=None), SkinDTO(name="")
+    unnamed_tree = source_data_tree.model_copy(
+        update={
+            "weapons": source_data_tree.weapons + [unnamed_weapon],
+            "skins": source_data_tree.skins + [unnamed_skin],
+            "relations": source_data_tree.relations
+            + [
+                RelationDataDTO(
+                    weapon=unnamed_weapon,
+                    skin=source_data_tree.skins[0],
+                    quality=source_data_tree.qualities[0],
+                    stattrak_existence=False,
+                )
+            ],
+            "agent_relations": source_data_tree.agent_relations
+            + [AgentRelationDTO(agent=source_data_tree.agents[0], skins=[unnamed_skin])],
+        }
+    )
+
+    tables_dto = decode(list(SourceDataTreeEncoder().encode(unnamed_tree))).finish()
+
+    # Unnamed items and the relations to them are left out, as the db_app skips them anyway
+    assert tables_dto.weapons == ["AK-47", "AWP"]
+    assert tables_dto.skins == ["Redline", "Asiimov", "Crimson Web"]
+    assert tables_dto.relations == [(0, 0, 0, True), (1, 1, 1, False)]
+    assert tables_dto.agent_relations == [(0, 0)]
+    assert (
+        SourceDataSnapshot.from_tables(tables_dto).hash
+        == SourceDataSnapshot.from_tree(source_data_tree).hash
+    )
+
+
+def test_round_trip_empty_tree():
+    empty_tree = SourceDataTreeDTO(
+        weapons=[],
+        skins=[],
+        qualities=[],
+        gloves=[],
+        agents=[],
+        relations=[],
+        glove_relations=[],
+        agent_relations=[],
+    )
+
+    tables_dto = decode(list(SourceDataTreeEncoder().encode(empty_tree))).finish()
+
+    assert tables_dto.weapons == []
+    assert tables_dto.relations == []
+    assert tables_dto.glove_relations == []
+    assert tables_dto.agent_relations == []
+
+
+def test_truncated_stream(source_data_tree: SourceDataTreeDTO):
+    payload = b"".join(SourceDataTreeEncoder().encode(source_data_tree))
+    decoder = SourceDataTreeDecoder()
+    decoder.feed(payload[: len(payload) // 2])
+
+    with pytest.raises(SourceDataTreeCodecException, match="truncated"):
+        decoder.finish()
+
+
+def test_truncated_record():
+    decoder = decode([brotli.compress(b'{"version":1}\n{"table":"weapons","rows":["AK')])
+
+    with pytest.raises(SourceDataTreeCodecException, match="truncated"):
+        decoder.finish()
+
+
+def test_empty_payload():
+    decoder = decode([brotli.compress(b"")])
+
+    with pytest.raises(SourceDataTreeCodecException, match="empty"):
+        decoder.finish()
+
+
+@pytest.mark.parametrize("version_line", [b'{"version":2}', b'{"version":"1"}', b"{}"])
+def test_bad_version(version_line: bytes):
+    with pytest.raises(SourceDataTreeCodecException, match="version"):
+        decode([compress_lines(version_line)])
+
+
+def test_not_brotli_payload():
+    with pytest.raises(SourceDataTreeCodecException, match="brotli"):
+        decode([b"definitely not brotli"])
+
+
+def test_relation_index_out_of_range():
+    with pytest.raises(SourceDataTreeCodecException, match="Malformed relation row"):
+        decode(
+            [
+                compress_lines(
+                    b'{"version":1}',
+                    b'{"table":"weapons","rows":["AK-47"]}',
+                    b'{"table":"relations","rows":[[1,0,0,1]]}',
+                )
+            ]
+        )
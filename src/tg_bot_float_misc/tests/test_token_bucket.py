@@ -0,0 +1,66 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from pytest_mock import MockerFixture
+
+from tg_bot_float_misc.rate_limit import token_bucket
+from tg_bot_float_misc.rate_limit.token_bucket import TokenBucket
+
+
+class FakeClock:
+    """Monotonic clock that only moves when the bucket sleeps.
+
+    Rates in the tests are powers of two, so the waits add up without rounding errors.
+    """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.now += delay
+
+
+@pytest.fixture
+def clock(mocker: MockerFixture) -> FakeClock:
+    clock = FakeClock()
+    # Replace the module references only, the event loop keeps the real clock
+    mocker.patch.object(token_bucket, "time", SimpleNamespace(monotonic=clock.monotonic))
+    mocker.patch.object(
+        token_bucket, "asyncio", SimpleNamespace(Lock=asyncio.Lock, sleep=clock.sleep)
+    )
+    return clock
+
+
+@pytest.mark.asyncio
+async def test_burst_does_not_wait(clock: FakeClock):
+    bucket = TokenBucket(rate=10, capacity=5)
+
+    for _ in range(5):
+        await bucket.acquire()
+
+    assert clock.now == 0
+
+
+@pytest.mark.asyncio
+async def test_waits_for_rate_after_burst(clock: FakeClock):
+    bucket = TokenBucket(rate=4, capacity=5)
+
+    for _ in range(5 + 8):
+        await bucket.acquire()
+
+    assert clock.now == pytest.approx(2.0)
+
+
+@pytest.mark.asyncio
+async def test_refill_is_capped_by_capacity(clock: FakeClock):
+    bucket = TokenBucket(rate=4, capacity=2)
+    clock.now = 60
+
+    for _ in range(3):
+        await bucket.acquire()
+
+    assert clock.now == pytest.approx(60.25)
@@ -1,8 +1,31 @@
 from typing import Annotated
 
 from fastapi import Depends
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 
-from tg_bot_float_steam_source.router_controllers.steam_router_params.steam_params import SteamParams
+from tg_bot_float_steam_source.router_controllers.steam_router_params.steam_params import (
+    SteamParams,
+    SteamQueryParams,
+)
 
 
-STEAM_PARAMS = Annotated[SteamParams, Depends(SteamParams)]
+def get_steam_params(query_params: Annotated[SteamQueryParams, Depends()]) -> SteamParams:
+    """SteamParams of the request, a failed check across fields is a 422 like any invalid query."""
+    try:
+        return SteamParams.model_validate(query_params.model_dump())
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [
+                {
+                    "type": error["type"],
+                    "loc": ("query", *error["loc"]),
+                    "msg": error["msg"],
+                    "input": error["input"],
+                }
+                for error in exc.errors()
+            ]
+        ) from exc
+
+
+STEAM_PARAMS = Annotated[SteamParams, Depends(get_steam_params)]
@@ -1,10 +1,11 @@
 from functools import lru_cache
-from typing import Annotated, Any, AsyncGenerator
+from typing import Annotated
 
-from aiohttp import ClientSession
 from fastapi import Depends
 
+from tg_bot_float_steam_source.services.float_cache import FloatCache
 from tg_bot_float_steam_source.services.float_source_service import FloatSourceService
+from tg_bot_float_steam_source.services.http_client_pool import HttpClientPool
 from tg_bot_float_steam_source.services.steam_market_source_service import SteamMarketSourceService
 from tg_bot_float_steam_source.services.steam_source_service import SteamSourceService
 from tg_bot_float_steam_source.steam_source_settings import SteamSourceSettings
@@ -18,24 +19,25 @@ def get_settings() -> SteamSourceSettings:
 STEAM_SOURCE_SETTINGS = Annotated[SteamSourceSettings, Depends(get_settings)]
 
 
-async def get_aiohttp_session():
-    async with ClientSession() as session:
-        yield session
-
-
-async def get_steam_source_service(
-    settings: STEAM_SOURCE_SETTINGS, aiohttp_session: ClientSession = Depends(get_aiohttp_session)
-) -> AsyncGenerator[SteamSourceService, Any]:
-    async with SteamMarketSourceService(
-        settings, aiohttp_session
-    ) as steam_market_service, FloatSourceService(settings, aiohttp_session) as float_service:
-        steam_source_service = SteamSourceService(
-            steam_market_source_service=steam_market_service, float_source_service=float_service
-        )
-        try:
-            yield steam_source_service
-        finally:
-            await aiohttp_session.close()
+@lru_cache()
+def get_http_client_pool() -> HttpClientPool:
+    return HttpClientPool(get_settings())
+
+
+@lru_cache()
+def get_float_cache() -> FloatCache:
+    return FloatCache(get_settings())
+
+
+@lru_cache()
+def get_steam_source_service() -> SteamSourceService:
+    """Services are stateless, the app keeps one instance on top of the shared client pool."""
+    settings, http_client_pool = get_settings(), get_http_client_pool()
+    return SteamSourceService(
+        settings=settings,
+        steam_market_source_service=SteamMarketSourceService(settings, http_client_pool),
+        float_source_service=FloatSourceService(settings, http_client_pool, get_float_cache()),
+    )
 
 
 STEAM_SOURCE_SERVICE = Annotated[SteamSourceService, Depends(get_steam_source_service)]
@@ -1,17 +1,27 @@
-from typing import List
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
 from fastapi import FastAPI
 
-from tg_bot_float_misc.router_controller.abstact_router_controller import AbstractRouterController
+from tg_bot_float_misc.router_controller.abstract_router_controller import AbstractRouterController
+from tg_bot_float_steam_source.dependencies.services import (
+    get_float_cache,
+    get_http_client_pool,
+)
 from tg_bot_float_steam_source.router_controllers.steam_router_controller import (
     SteamRouterController,
 )
 from tg_bot_float_steam_source.midlewares.error_handling_middleware import ErrorHandlingMiddleware
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    async with get_http_client_pool(), get_float_cache():
+        yield
+
 
 router_controllers: List[AbstractRouterController] = [SteamRouterController()]
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 app.add_middleware(ErrorHandlingMiddleware)
 
 for controller in router_controllers:
@@ -1,13 +1,17 @@
-from typing import List
+from typing import AsyncIterator, List
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
 
-from tg_bot_float_misc.router_controller.abstact_router_controller import AbstractRouterController
+from tg_bot_float_misc.router_controller.abstract_router_controller import AbstractRouterController
 from tg_bot_float_steam_source.dependencies.params import STEAM_PARAMS
 from tg_bot_float_steam_source.dependencies.services import STEAM_SOURCE_SERVICE
 from tg_bot_float_common_dtos.steam_source_dtos.steam_item_dto import SteamItemDTO
+from tg_bot_float_common_dtos.steam_source_dtos.steam_item_record_dto import SteamItemRecordDTO
 
 
 class SteamRouterController(AbstractRouterController):
+    _ndjson_media_type = "application/x-ndjson"
+
     def __init__(self) -> None:
         self._router = APIRouter()
         super().__init__()
@@ -18,8 +22,30 @@ class SteamRouterController(AbstractRouterController):
             self._get_steam_skin_data,
             methods=["GET"],
         )
+        self._router.add_api_route(
+            "/{weapon}/{skin}/{quality}/{stattrak}/stream",
+            self._stream_steam_skin_data,
+            methods=["GET"],
+            response_class=StreamingResponse,
+        )
 
     async def _get_steam_skin_data(
         self, steam_source_service: STEAM_SOURCE_SERVICE, steam_params: STEAM_PARAMS
     ) -> List[SteamItemDTO]:
         return await steam_source_service.get_steam_items(steam_params)
+
+    async def _stream_steam_skin_data(
+        self, steam_source_service: STEAM_SOURCE_SERVICE, steam_params: STEAM_PARAMS
+    ) -> StreamingResponse:
+        """NDJSON: one SteamItemRecordDTO per line, in the order their floats are resolved."""
+        steam_item_records = await steam_source_service.stream_steam_items(steam_params)
+        return StreamingResponse(
+            self._to_ndjson(steam_item_records), media_type=self._ndjson_media_type
+        )
+
+    @staticmethod
+    async def _to_ndjson(
+        steam_item_records: AsyncIterator[SteamItemRecordDTO],
+    ) -> AsyncIterator[str]:
+        async for steam_item_record in steam_item_records:
+            yield steam_item_record.model_dump_json(exclude_none=True) + "\n"
@@ -1,7 +1,13 @@
-from pydantic import BaseModel
+from typing import Self
 
+from pydantic import BaseModel, Field, model_validator
+
+from tg_bot_float_steam_source.steam_source_constants import FLOAT_RANGE_ERROR_MSG
+
+
+class SteamQueryParams(BaseModel):
+    """Request parameters as FastAPI parses them, before the checks across fields."""
 
-class SteamParams(BaseModel):
     weapon: str
     skin: str
     quality: str
@@ -9,3 +15,22 @@ class SteamParams(BaseModel):
     start: int = 0
     count: int = 10
     currency: int = 1
+    total: int | None = Field(default=None, gt=0)  # Scan this many listings from `start` on
+    min_float: float | None = Field(default=None, ge=0, le=1)
+    max_float: float | None = Field(default=None, ge=0, le=1)
+    max_price: float | None = Field(default=None, gt=0)
+    limit: int | None = Field(default=None, gt=0)  # Stop once this many listings match
+
+
+class SteamParams(SteamQueryParams):
+    @model_validator(mode="after")
+    def _check_float_range(self) -> Self:
+        if (
+            self.min_float is not None
+            and self.max_float is not None
+            and self.min_float > self.max_float
+        ):
+            raise ValueError(
+                FLOAT_RANGE_ERROR_MSG.format(min_float=self.min_float, max_float=self.max_float)
+            )
+        return self
@@ -2,6 +2,7 @@ from pydantic import BaseModel
 
 
 class SteamMarketResponseDTO(BaseModel):
+    listing_id: str
     buy_link: str
     inspect_skin_link: str
     price: float
@@ -0,0 +1,98 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Self
+
+from tg_bot_float_steam_source.services.dtos.float_item_info_dto import FloatItemInfoDTO
+from tg_bot_float_steam_source.steam_source_settings import SteamSourceSettings
+
+
+class FloatCache:
+    """Float info by asset id: an in-process LRU in front of an optional SQLite file.
+
+    The float of an asset never changes, so entries are never revalidated. Persistent rows older
+    than `float_cache_retention` are pruned on start, by then the listing is long gone.
+    """
+
+    _create_table_sql = """
+        CREATE TABLE IF NOT EXISTS float_item_info (
+            asset_id TEXT PRIMARY KEY,
+            info TEXT NOT NULL,
+            created_at REAL NOT NULL
+        )
+    """
+
+    def __init__(self, settings: SteamSourceSettings) -> None:
+        self._max_size = settings.float_cache_size
+        self._retention = settings.float_cache_retention
+        self._path = Path(settings.float_cache_path) if settings.float_cache_path else None
+        self._memory: OrderedDict[str, FloatItemInfoDTO] = OrderedDict()
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    async def __aenter__(self) -> Self:
+        if self._path is not None:
+            await asyncio.to_thread(self._connect, self._path)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore
+        await asyncio.to_thread(self._close)
+
+    async def get(self, asset_id: str) -> FloatItemInfoDTO | None:
+        if asset_id in self._memory:
+            self._memory.move_to_end(asset_id)
+            return self._memory[asset_id]
+        if self._connection is None:
+            return None
+        float_item_info_dto = await asyncio.to_thread(self._load, asset_id)
+        if float_item_info_dto is not None:
+            self._remember(asset_id, float_item_info_dto)
+        return float_item_info_dto
+
+    async def put(self, asset_id: str, float_item_info_dto: FloatItemInfoDTO) -> None:
+        self._remember(asset_id, float_item_info_dto)
+        if self._connection is not None:
+            await asyncio.to_thread(self._store, asset_id, float_item_info_dto)
+
+    def _remember(self, asset_id: str, float_item_info_dto: FloatItemInfoDTO) -> None:
+        self._memory[asset_id] = float_item_info_dto
+        self._memory.move_to_end(asset_id)
+        if len(self._memory) > self._max_size:
+            self._memory.popitem(last=False)
+
+    def _connect(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(self._create_table_sql)
+        connection.execute(
+            "DELETE FROM float_item_info WHERE created_at < ?", (time.time() - self._retention,)
+        )
+        self._connection = connection
+
+    def _close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _load(self, asset_id: str) -> FloatItemInfoDTO | None:
+        with self._lock:
+            if self._connection is None:
+                return None
+            row = self._connection.execute(
+                "SELECT info FROM float_item_info WHERE asset_id = ?", (asset_id,)
+            ).fetchone()
+        return FloatItemInfoDTO.model_validate_json(row[0]) if row is not None else None
+
+    def _store(self, asset_id: str, float_item_info_dto: FloatItemInfoDTO) -> None:
+        with self._lock:
+            if self._connection is None:
+                return
+            self._connection.execute(
+                "INSERT OR REPLACE INTO float_item_info VALUES (?, ?, ?)",
+                (asset_id, float_item_info_dto.model_dump_json(), time.time()),
+            )
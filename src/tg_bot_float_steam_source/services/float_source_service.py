@@ -1,4 +1,5 @@
 import json
+import re
 from typing import Any, Dict
 
 from tg_bot_float_steam_source.services.abstact_source_service import (
@@ -6,9 +7,23 @@ from tg_bot_float_steam_source.services.abstact_source_service import (
 )
 from tg_bot_float_steam_source.services.dtos.cs_float_response_dto import CsFloatResponseDTO
 from tg_bot_float_steam_source.services.dtos.float_item_info_dto import FloatItemInfoDTO
+from tg_bot_float_steam_source.services.float_cache import FloatCache
+from tg_bot_float_steam_source.services.http_client_pool import HttpClientPool
+from tg_bot_float_steam_source.steam_source_settings import SteamSourceSettings
 
 
 class FloatSourceService(AbstractSourceService):
+    _asset_id_pattern = re.compile(r"A(\d+)D")
+
+    def __init__(
+        self,
+        settings: SteamSourceSettings,
+        http_client_pool: HttpClientPool,
+        float_cache: FloatCache,
+    ) -> None:
+        super().__init__(settings, http_client_pool)
+        self._float_cache = float_cache
+
     @property
     def _headers(self) -> Dict[str, Any]:
         headers = super()._headers
@@ -20,6 +35,17 @@ class FloatSourceService(AbstractSourceService):
         return CsFloatResponseDTO.model_validate(response_json)
 
     async def get_float_item_info_dto(self, inspect_link: str) -> FloatItemInfoDTO:
+        asset_id = self._get_asset_id(inspect_link)
+        if asset_id is not None and (cached := await self._float_cache.get(asset_id)):
+            return cached
         link = self._settings.float_info_url.format(inspect_link=inspect_link)
         cs_float_response = await self._get_response(link)
-        return FloatItemInfoDTO.model_validate(cs_float_response.iteminfo)
+        float_item_info_dto = FloatItemInfoDTO.model_validate(cs_float_response.iteminfo)
+        if asset_id is not None and cs_float_response.iteminfo:
+            await self._float_cache.put(asset_id, float_item_info_dto)
+        return float_item_info_dto
+
+    def _get_asset_id(self, inspect_link: str) -> str | None:
+        """Asset id from `...csgo_econ_action_preview M<listing id>A<asset id>D<d param>`."""
+        match = self._asset_id_pattern.search(inspect_link)
+        return match.group(1) if match else None
@@ -0,0 +1,47 @@
+from typing import Self, Set
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from aiohttp_retry import ExponentialRetry, RetryClient
+
+from tg_bot_float_steam_source.steam_source_constants import HTTP_CLIENT_POOL_CLOSED_ERROR_MSG
+from tg_bot_float_steam_source.steam_source_settings import SteamSourceSettings
+
+
+class HttpClientPool:
+    """One keep-alive connection pool for the whole app lifespan, shared by all source services."""
+
+    def __init__(self, settings: SteamSourceSettings) -> None:
+        self._settings = settings
+        self._retry_options = ExponentialRetry(statuses=self._configure_retry_statuses())
+        self._retry_client: RetryClient | None = None
+
+    async def __aenter__(self) -> Self:
+        connector = TCPConnector(
+            limit=self._settings.http_pool_limit,
+            limit_per_host=self._settings.http_pool_limit_per_host,
+            ttl_dns_cache=self._settings.http_dns_cache_ttl,
+            keepalive_timeout=self._settings.http_keepalive_timeout,
+        )
+        session = ClientSession(
+            connector=connector, timeout=ClientTimeout(total=self._settings.http_timeout)
+        )
+        self._retry_client = RetryClient(session, retry_options=self._retry_options)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore
+        if self._retry_client is not None:
+            await self._retry_client.close()
+            self._retry_client = None
+
+    @property
+    def client(self) -> RetryClient:
+        if self._retry_client is None:
+            raise RuntimeError(HTTP_CLIENT_POOL_CLOSED_ERROR_MSG)
+        return self._retry_client
+
+    def _configure_retry_statuses(self) -> Set[int]:
+        not_retry_statuses_str = self._settings.not_retry_statuses.split(",")
+        not_retry_statuses = set(range(200, 300))
+        not_retry_statuses |= {int(x) for x in not_retry_statuses_str}
+        statuses = {x for x in range(100, 600) if x not in not_retry_statuses}
+        return statuses
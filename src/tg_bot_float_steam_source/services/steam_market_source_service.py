@@ -1,6 +1,6 @@
+import asyncio
 import json
-from typing import Any, Dict, List
-
+from typing import Any, AsyncGenerator, Dict, List, Set
 
 from tg_bot_float_steam_source.router_controllers.steam_router_params.steam_params import (
     SteamParams,
@@ -15,10 +15,23 @@ from tg_bot_float_steam_source.services.steam_source_exceptions import SteamSour
 from tg_bot_float_steam_source.services.dtos.steam_market_response_dto import SteamMarketResponseDTO
 from tg_bot_float_steam_source.services.dtos.listing_info_dto import ListingInfoDTO
 from tg_bot_float_steam_source.services.dtos.asset_info_dto import AssetInfoDTO
-from tg_bot_float_steam_source.steam_source_constants import STEAM_SOURCE_ERROR_MSG
+from tg_bot_float_steam_source.services.http_client_pool import HttpClientPool
+from tg_bot_float_steam_source.steam_source_constants import (
+    STEAM_SCAN_ERROR_MSG,
+    STEAM_SOURCE_ERROR_MSG,
+)
+from tg_bot_float_steam_source.steam_source_settings import SteamSourceSettings
+from tg_bot_float_misc.rate_limit.token_bucket import TokenBucket
 
 
 class SteamMarketSourceService(AbstractSourceService):
+    def __init__(self, settings: SteamSourceSettings, http_client_pool: HttpClientPool) -> None:
+        super().__init__(settings, http_client_pool)
+        self._scan_semaphore = asyncio.Semaphore(settings.steam_scan_concurrency)
+        self._scan_token_bucket = TokenBucket(
+            settings.steam_scan_rate_per_second, settings.steam_scan_burst
+        )
+
     @property
     def _headers(self) -> Dict[str, Any]:
         headers = super()._headers
@@ -29,7 +42,62 @@ class SteamMarketSourceService(AbstractSourceService):
         response_json = await super()._get_response(link)
         return UnprocessedSteamResponseDTO.model_validate(response_json)
 
-    async def get_steam_market_response_dtos(
+    async def iter_steam_market_pages(
+        self, steam_params: SteamParams
+    ) -> AsyncGenerator[List[SteamMarketResponseDTO], None]:
+        """Yield market pages in order; a single page unless `steam_params.total` is set.
+
+        In scan mode `total` listings from `start` on are fetched in waves of concurrent, rate
+        limited page requests, so a consumer that has found enough can stop after any wave.
+        Pages that fail are skipped, listings that moved between pages are de-duplicated.
+        """
+        if steam_params.total is None:
+            yield await self._get_page_steam_market_response_dtos(steam_params)
+            return
+
+        end = steam_params.start + steam_params.total
+        page_count = min(steam_params.count, self._settings.steam_max_page_count)
+        page_params = [
+            steam_params.model_copy(update={"start": start, "count": min(page_count, end - start)})
+            for start in range(steam_params.start, end, page_count)
+        ]
+        wave_size = self._settings.steam_scan_concurrency
+        seen_listing_ids: Set[str] = set()
+        fetched_pages = 0
+        error: BaseException | None = None
+        for wave_start in range(0, len(page_params), wave_size):
+            pages = await asyncio.gather(
+                *(
+                    self._get_scanned_page(params)
+                    for params in page_params[wave_start : wave_start + wave_size]
+                ),
+                return_exceptions=True,
+            )
+            for page in pages:
+                if isinstance(page, BaseException):
+                    error = page
+                    continue
+                fetched_pages += 1
+                yield [item for item in page if not self._is_seen(item, seen_listing_ids)]
+        if error is not None and not fetched_pages:
+            error_msg = getattr(error, "msg", error)
+            raise SteamSourceException(
+                STEAM_SCAN_ERROR_MSG.format(pages=len(page_params), error=error_msg)
+            )
+
+    @staticmethod
+    def _is_seen(item: SteamMarketResponseDTO, seen_listing_ids: Set[str]) -> bool:
+        if item.listing_id in seen_listing_ids:
+            return True
+        seen_listing_ids.add(item.listing_id)
+        return False
+
+    async def _get_scanned_page(self, steam_params: SteamParams) -> List[SteamMarketResponseDTO]:
+        async with self._scan_semaphore:
+            await self._scan_token_bucket.acquire()
+            return await self._get_page_steam_market_response_dtos(steam_params)
+
+    async def _get_page_steam_market_response_dtos(
         self, steam_params: SteamParams
     ) -> List[SteamMarketResponseDTO]:
         link = self._get_market_json_link(steam_params)
@@ -71,7 +139,10 @@ class SteamMarketSourceService(AbstractSourceService):
                 price = self._get_price(listing_info_dto)
                 items.append(
                     SteamMarketResponseDTO(
-                        buy_link=buy_link, inspect_skin_link=inspect_link, price=float(price)
+                        listing_id=listing_info_dto.listingid,
+                        buy_link=buy_link,
+                        inspect_skin_link=inspect_link,
+                        price=float(price),
                     )
                 )
         return items
@@ -1,5 +1,6 @@
 import asyncio
-from typing import List
+import logging
+from typing import Any, AsyncGenerator, AsyncIterator, List, Sequence
 
 from tg_bot_float_steam_source.router_controllers.steam_router_params.steam_params import (
     SteamParams,
@@ -7,36 +8,168 @@ from tg_bot_float_steam_source.router_controllers.steam_router_params.steam_para
 from tg_bot_float_steam_source.services.dtos.steam_market_response_dto import SteamMarketResponseDTO
 from tg_bot_float_steam_source.services.float_source_service import FloatSourceService
 from tg_bot_float_steam_source.services.steam_market_source_service import SteamMarketSourceService
+from tg_bot_float_steam_source.steam_source_settings import SteamSourceSettings
 from tg_bot_float_common_dtos.steam_source_dtos.steam_item_dto import SteamItemDTO
+from tg_bot_float_common_dtos.steam_source_dtos.steam_item_record_dto import SteamItemRecordDTO
+
+logger = logging.getLogger(__name__)
 
 
 class SteamSourceService:
     def __init__(
         self,
+        settings: SteamSourceSettings,
         steam_market_source_service: SteamMarketSourceService,
         float_source_service: FloatSourceService,
     ) -> None:
 
+        self._settings = settings
         self._steam_market_source_service = steam_market_source_service
         self._float_source_service = float_source_service
+        self._float_semaphore = asyncio.Semaphore(settings.float_concurrency)
 
     async def get_steam_items(self, steam_params: SteamParams) -> List[SteamItemDTO]:
-        tasks = []
-        steam_market_response_dtos = (
-            await self._steam_market_source_service.get_steam_market_response_dtos(steam_params)
+        """Matching listings in market order, unresolved floats are left out."""
+        steam_items: List[SteamItemDTO] = []
+        pages = self._steam_market_source_service.iter_steam_market_pages(steam_params)
+        try:
+            async for page in pages:
+                tasks = self._create_steam_item_tasks(self._filter_by_price(page, steam_params))
+                try:
+                    results = await asyncio.gather(*tasks, return_exceptions=True)
+                finally:
+                    self._cancel(tasks)
+                steam_items.extend(
+                    result
+                    for result in results
+                    if isinstance(result, SteamItemDTO)
+                    and self._matches_float(result, steam_params)
+                )
+                if self._is_enough(len(steam_items), steam_params) or self._is_over_price(
+                    page, steam_params
+                ):
+                    break
+        finally:
+            await pages.aclose()
+        return steam_items[: steam_params.limit]
+
+    async def stream_steam_items(
+        self, steam_params: SteamParams
+    ) -> AsyncIterator[SteamItemRecordDTO]:
+        """Yield matching listings as soon as their floats are resolved.
+
+        The first market page is requested before returning, so its errors are raised here and not
+        in the middle of a started stream. A listing whose float lookup failed is yielded as an
+        error record and does not count towards `limit`.
+        """
+        pages = self._steam_market_source_service.iter_steam_market_pages(steam_params)
+        try:
+            first_page = await anext(pages)
+        except BaseException:
+            await pages.aclose()
+            raise
+        return self._iter_steam_items(steam_params, first_page, pages)
+
+    async def _iter_steam_items(
+        self,
+        steam_params: SteamParams,
+        first_page: List[SteamMarketResponseDTO],
+        pages: AsyncGenerator[List[SteamMarketResponseDTO], None],
+    ) -> AsyncGenerator[SteamItemRecordDTO, None]:
+        found = 0
+        page: List[SteamMarketResponseDTO] | None = first_page
+        try:
+            while page is not None:
+                tasks = [
+                    asyncio.create_task(self._get_steam_item_record(response_dto))
+                    for response_dto in self._filter_by_price(page, steam_params)
+                ]
+                try:
+                    for next_completed in asyncio.as_completed(tasks):
+                        steam_item_record = await next_completed
+                        if steam_item_record.item is None:
+                            yield steam_item_record
+                            continue
+                        if not self._matches_float(steam_item_record.item, steam_params):
+                            continue
+                        yield steam_item_record
+                        found += 1
+                        if self._is_enough(found, steam_params):
+                            return
+                finally:
+                    self._cancel(tasks)
+                if self._is_over_price(page, steam_params):
+                    return
+                page = await anext(pages, None)
+        finally:
+            await pages.aclose()
+
+    @staticmethod
+    def _filter_by_price(
+        page: List[SteamMarketResponseDTO], steam_params: SteamParams
+    ) -> List[SteamMarketResponseDTO]:
+        """Listings above the price ceiling are dropped before their float is looked up."""
+        if steam_params.max_price is None:
+            return page
+        return [item for item in page if item.price <= steam_params.max_price]
+
+    @staticmethod
+    def _is_over_price(page: List[SteamMarketResponseDTO], steam_params: SteamParams) -> bool:
+        """Market pages are sorted by price, next pages can only be more expensive."""
+        return steam_params.max_price is not None and any(
+            item.price > steam_params.max_price for item in page
         )
-        for response_dto in steam_market_response_dtos:
-            task = asyncio.create_task(self._get_steam_item_dto(response_dto))
-            tasks.append(task)
-        return list(await asyncio.gather(*tasks))
+
+    @staticmethod
+    def _matches_float(steam_item: SteamItemDTO, steam_params: SteamParams) -> bool:
+        if steam_params.min_float is not None and steam_item.item_float < steam_params.min_float:
+            return False
+        if steam_params.max_float is not None and steam_item.item_float > steam_params.max_float:
+            return False
+        return True
+
+    @staticmethod
+    def _is_enough(found: int, steam_params: SteamParams) -> bool:
+        return steam_params.limit is not None and found >= steam_params.limit
+
+    def _create_steam_item_tasks(
+        self, steam_market_response_dtos: List[SteamMarketResponseDTO]
+    ) -> List[asyncio.Task[SteamItemDTO]]:
+        return [
+            asyncio.create_task(self._get_steam_item_dto(response_dto))
+            for response_dto in steam_market_response_dtos
+        ]
+
+    async def _get_steam_item_record(
+        self, steam_response_dto: SteamMarketResponseDTO
+    ) -> SteamItemRecordDTO:
+        try:
+            return SteamItemRecordDTO(item=await self._get_steam_item_dto(steam_response_dto))
+        except Exception as exc:
+            # One failed lookup must not end the stream, the client gets it as an error record
+            logger.warning(
+                "Float lookup of listing %s failed", steam_response_dto.listing_id, exc_info=True
+            )
+            return SteamItemRecordDTO(
+                buy_link=steam_response_dto.buy_link, error=str(exc) or type(exc).__name__
+            )
 
     async def _get_steam_item_dto(self, steam_response_dto: SteamMarketResponseDTO) -> SteamItemDTO:
-        float_item_info_dto = await self._float_source_service.get_float_item_info_dto(
-            steam_response_dto.inspect_skin_link
-        )
+        async with self._float_semaphore:
+            float_item_info_dto = await asyncio.wait_for(
+                self._float_source_service.get_float_item_info_dto(
+                    steam_response_dto.inspect_skin_link
+                ),
+                self._settings.float_timeout,
+            )
         return SteamItemDTO(
             name=float_item_info_dto.full_item_name,
             item_float=float_item_info_dto.floatvalue,
             price=steam_response_dto.price,
             buy_link=steam_response_dto.buy_link,
         )
+
+    @staticmethod
+    def _cancel(tasks: Sequence[asyncio.Task[Any]]) -> None:
+        for task in tasks:
+            task.cancel()
@@ -1,2 +1,4 @@
 STEAM_SOURCE_ERROR_MSG = "Too many requests or incorect skin parameters!"
-
+HTTP_CLIENT_POOL_CLOSED_ERROR_MSG = "HTTP client pool is used outside of the app lifespan!"
+STEAM_SCAN_ERROR_MSG = "None of {pages} market pages could be fetched: {error}"
+FLOAT_RANGE_ERROR_MSG = "min_float {min_float} is greater than max_float {max_float}!"
@@ -15,3 +15,17 @@ class SteamSourceSettings(BaseSettings):
     steam_market_source_headers: str
     steam_float_source_headers: str
     render: str
+    http_pool_limit: int
+    http_pool_limit_per_host: int
+    http_dns_cache_ttl: int
+    http_keepalive_timeout: float
+    http_timeout: float
+    steam_max_page_count: int
+    steam_scan_concurrency: int
+    steam_scan_rate_per_second: float
+    steam_scan_burst: int
+    float_concurrency: int
+    float_timeout: float
+    float_cache_size: int
+    float_cache_retention: float
+    float_cache_path: str | None = None
@@ -0,0 +1,17 @@
+import pytest
+
+from tg_bot_float_steam_source.router_controllers.steam_router_params.steam_params import (
+    SteamParams,
+)
+from tg_bot_float_steam_source.steam_source_settings import SteamSourceSettings
+
+
+@pytest.fixture
+def steam_settings() -> SteamSourceSettings:
+    settings = SteamSourceSettings()  # type: ignore "Load variables from steam_source_variables.env file"
+    return settings.model_copy(update={"float_concurrency": 4, "float_timeout": 1})
+
+
+@pytest.fixture
+def steam_params() -> SteamParams:
+    return SteamParams(weapon="AK-47", skin="Redline", quality="Field-Tested", stattrak=False)
@@ -0,0 +1,115 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, List, Set
+from urllib.parse import parse_qs, urlsplit
+
+from tg_bot_float_steam_source.router_controllers.steam_router_params.steam_params import (
+    SteamParams,
+)
+from tg_bot_float_steam_source.services.dtos.float_item_info_dto import FloatItemInfoDTO
+from tg_bot_float_steam_source.services.dtos.steam_market_response_dto import SteamMarketResponseDTO
+
+
+def get_listing(listing_id: str, price: float) -> SteamMarketResponseDTO:
+    return SteamMarketResponseDTO(
+        listing_id=listing_id,
+        buy_link=f"https://steamcommunity.com/market/buy/{listing_id}",
+        inspect_skin_link=f"steam://inspect/M{listing_id}A{listing_id}D1",
+        price=price,
+    )
+
+
+def get_market_page_json(listing_ids: List[str]) -> Dict[str, Any]:
+    """Steam market render response of the given listings, priced by listing id."""
+    return {
+        "success": True,
+        "listinginfo": {
+            listing_id: {
+                "listingid": listing_id,
+                "converted_price_per_unit": int(listing_id) * 100,
+                "converted_fee_per_unit": 15,
+                "asset": {
+                    "appid": 730,
+                    "contextid": "2",
+                    "id": f"9{listing_id}",
+                    "market_actions": [{"link": "steam://inspect/M%listingid%A%assetid%D1"}],
+                },
+            }
+            for listing_id in listing_ids
+        },
+    }
+
+
+class FakeMarketResponse:
+    def __init__(self, response_json: Dict[str, Any]) -> None:
+        self._response_json = response_json
+
+    async def json(self) -> Dict[str, Any]:
+        return self._response_json
+
+
+class FakeHttpClientPool:
+    """Serves market pages by their `start` query parameter, `requested_starts` records the calls.
+
+    A start missing from `pages` fails like a market error response.
+    """
+
+    def __init__(self, pages: Dict[int, List[str]]) -> None:
+        self.pages = pages
+        self.requested_starts: List[int] = []
+
+    @property
+    def client(self) -> "FakeHttpClientPool":
+        return self
+
+    @asynccontextmanager
+    async def get(self, link: str, headers: Dict[str, Any]) -> AsyncIterator[FakeMarketResponse]:
+        start = int(parse_qs(urlsplit(link).query)["start"][0])
+        self.requested_starts.append(start)
+        if start not in self.pages:
+            yield FakeMarketResponse({"success": False, "listinginfo": []})
+        else:
+            yield FakeMarketResponse(get_market_page_json(self.pages[start]))
+
+
+class FakeSteamMarketSourceService:
+    """Yields the given market pages, `yielded_pages` counts how many the consumer took."""
+
+    def __init__(self, pages: List[List[SteamMarketResponseDTO]]) -> None:
+        self.pages = pages
+        self.yielded_pages = 0
+
+    async def iter_steam_market_pages(
+        self, steam_params: SteamParams
+    ) -> AsyncGenerator[List[SteamMarketResponseDTO], None]:
+        for page in self.pages:
+            self.yielded_pages += 1
+            yield page
+
+
+class FakeFloatSourceService:
+    """Floats by inspect link, links in `failing` raise and links in `hanging` never return.
+
+    Lookups cancelled while hanging are recorded in `cancelled`.
+    """
+
+    def __init__(self, floats: Dict[str, float]) -> None:
+        self.floats = floats
+        self.failing: Set[str] = set()
+        self.hanging: Set[str] = set()
+        self.requested: List[str] = []
+        self.cancelled: List[str] = []
+
+    async def get_float_item_info_dto(self, inspect_link: str) -> FloatItemInfoDTO:
+        self.requested.append(inspect_link)
+        if inspect_link in self.failing:
+            raise ValueError(f"No float for {inspect_link}")
+        if inspect_link in self.hanging:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.cancelled.append(inspect_link)
+                raise
+        return FloatItemInfoDTO(
+            full_item_name="AK-47 | Redline", floatvalue=self.floats[inspect_link]
+        )
@@ -0,0 +1,107 @@
+from typing import Dict, List, Tuple
+
+import pytest
+
+from tg_bot_float_steam_source.router_controllers.steam_router_params.steam_params import (
+    SteamParams,
+)
+from tg_bot_float_steam_source.services.steam_market_source_service import SteamMarketSourceService
+from tg_bot_float_steam_source.services.steam_source_exceptions import SteamSourceException
+from tg_bot_float_steam_source.steam_source_settings import SteamSourceSettings
+from tg_bot_float_steam_source.tests.fake_services import FakeHttpClientPool
+
+
+def get_service(
+    steam_settings: SteamSourceSettings, pages: Dict[int, List[str]]
+) -> Tuple[SteamMarketSourceService, FakeHttpClientPool]:
+    # Waves of two pages, a bucket that never makes the test wait
+    settings = steam_settings.model_copy(
+        update={
+            "steam_max_page_count": 2,
+            "steam_scan_concurrency": 2,
+            "steam_scan_rate_per_second": 1024,
+            "steam_scan_burst": 1024,
+        }
+    )
+    http_client_pool = FakeHttpClientPool(pages)
+    return (
+        SteamMarketSourceService(settings, http_client_pool),  # type: ignore "Fake client pool"
+        http_client_pool,
+    )
+
+
+@pytest.fixture
+def scan_params(steam_params: SteamParams) -> SteamParams:
+    return steam_params.model_copy(update={"count": 2, "total": 8})
+
+
+@pytest.mark.asyncio
+async def test_single_page_without_total(
+    steam_settings: SteamSourceSettings, steam_params: SteamParams
+) -> None:
+    service, http_client_pool = get_service(steam_settings, {0: ["10", "11"]})
+
+    pages = [page async for page in service.iter_steam_market_pages(steam_params)]
+
+    assert [[item.listing_id for item in page] for page in pages] == [["10", "11"]]
+    assert pages[0][0].price == 10.15
+    assert pages[0][0].inspect_skin_link == "steam://inspect/M10A910D1"
+    assert http_client_pool.requested_starts == [0]
+
+
+@pytest.mark.asyncio
+async def test_scan_dedups_listings(
+    steam_settings: SteamSourceSettings, scan_params: SteamParams
+) -> None:
+    # Listing 12 moved from the second page to the third one while the scan was running
+    service, http_client_pool = get_service(
+        steam_settings, {0: ["10", "11"], 2: ["12", "13"], 4: ["12", "14"], 6: ["15", "16"]}
+    )
+
+    pages = [page async for page in service.iter_steam_market_pages(scan_params)]
+
+    assert [[item.listing_id for item in page] for page in pages] == [
+        ["10", "11"],
+        ["12", "13"],
+        ["14"],
+        ["15", "16"],
+    ]
+    assert sorted(http_client_pool.requested_starts) == [0, 2, 4, 6]
+
+
+@pytest.mark.asyncio
+async def test_scan_stops_after_wave(
+    steam_settings: SteamSourceSettings, scan_params: SteamParams
+) -> None:
+    service, http_client_pool = get_service(
+        steam_settings, {0: ["10", "11"], 2: ["12", "13"], 4: ["14", "15"], 6: ["16", "17"]}
+    )
+    pages = service.iter_steam_market_pages(scan_params)
+
+    first_page = await anext(pages)
+    await pages.aclose()
+
+    assert [item.listing_id for item in first_page] == ["10", "11"]
+    # Only the first wave of two pages was requested
+    assert sorted(http_client_pool.requested_starts) == [0, 2]
+
+
+@pytest.mark.asyncio
+async def test_scan_skips_failed_pages(
+    steam_settings: SteamSourceSettings, scan_params: SteamParams
+) -> None:
+    service, _ = get_service(steam_settings, {0: ["10", "11"], 6: ["16", "17"]})
+
+    pages = [page async for page in service.iter_steam_market_pages(scan_params)]
+
+    assert [[item.listing_id for item in page] for page in pages] == [["10", "11"], ["16", "17"]]
+
+
+@pytest.mark.asyncio
+async def test_scan_without_pages_raises(
+    steam_settings: SteamSourceSettings, scan_params: SteamParams
+) -> None:
+    service, _ = get_service(steam_settings, {})
+
+    with pytest.raises(SteamSourceException):
+        [page async for page in service.iter_steam_market_pages(scan_params)]
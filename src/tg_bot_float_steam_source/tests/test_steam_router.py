@@ -0,0 +1,107 @@
+import json
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient, ASGITransport
+
+from tg_bot_float_steam_source.dependencies.services import get_steam_source_service
+from tg_bot_float_steam_source.main import app
+from tg_bot_float_steam_source.services.steam_source_service import SteamSourceService
+from tg_bot_float_steam_source.steam_source_settings import SteamSourceSettings
+from tg_bot_float_steam_source.tests.fake_services import (
+    FakeFloatSourceService,
+    FakeSteamMarketSourceService,
+    get_listing,
+)
+
+ITEM_URL = "/AK-47/Redline/Field-Tested/false"
+STREAM_URL = ITEM_URL + "/stream"
+
+
+@pytest.fixture
+def market() -> FakeSteamMarketSourceService:
+    return FakeSteamMarketSourceService([[get_listing("1", 10), get_listing("2", 11)]])
+
+
+@pytest.fixture
+def floats() -> FakeFloatSourceService:
+    return FakeFloatSourceService(
+        {
+            get_listing("1", 10).inspect_skin_link: 0.2,
+            get_listing("2", 11).inspect_skin_link: 0.3,
+        }
+    )
+
+
+@pytest_asyncio.fixture
+async def client(
+    steam_settings: SteamSourceSettings,
+    market: FakeSteamMarketSourceService,
+    floats: FakeFloatSourceService,
+) -> AsyncGenerator[AsyncClient, None]:
+    app.dependency_overrides[get_steam_source_service] = lambda: SteamSourceService(
+        steam_settings, market, floats  # type: ignore "Fakes of the market and float services"
+    )
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://localhost") as ac:
+            yield ac
+    finally:
+        app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_float_range(client: AsyncClient) -> None:
+    response = await client.get(ITEM_URL, params={"min_float": 0.25, "max_float": 0.5})
+
+    assert response.status_code == 200
+    assert [item["item_float"] for item in response.json()] == [0.3]
+
+
+@pytest.mark.asyncio
+async def test_reversed_float_range_is_unprocessable(
+    client: AsyncClient, market: FakeSteamMarketSourceService
+) -> None:
+    response = await client.get(ITEM_URL, params={"min_float": 0.5, "max_float": 0.25})
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["query"]
+    assert market.yielded_pages == 0
+
+
+@pytest.mark.asyncio
+async def test_stream(client: AsyncClient, floats: FakeFloatSourceService) -> None:
+    floats.failing.add(get_listing("1", 10).inspect_skin_link)
+
+    response = await client.get(STREAM_URL)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert records == [
+        {
+            "buy_link": get_listing("1", 10).buy_link,
+            "error": f"No float for {get_listing('1', 10).inspect_skin_link}",
+        },
+        {
+            "item": {
+                "name": "AK-47 | Redline",
+                "item_float": 0.3,
+                "price": 11,
+                "buy_link": get_listing("2", 11).buy_link,
+            }
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_cancels_lookups_after_limit(
+    client: AsyncClient, floats: FakeFloatSourceService
+) -> None:
+    floats.hanging.add(get_listing("2", 11).inspect_skin_link)
+
+    response = await client.get(STREAM_URL, params={"limit": 1})
+
+    assert [json.loads(line)["item"]["price"] for line in response.text.splitlines()] == [10]
+    # The stream ended at the limit, the lookup still running was cancelled, not awaited
+    assert floats.cancelled == [get_listing("2", 11).inspect_skin_link]
@@ -0,0 +1,138 @@
+from typing import List, Tuple
+
+import pytest
+
+from tg_bot_float_steam_source.router_controllers.steam_router_params.steam_params import (
+    SteamParams,
+)
+from tg_bot_float_steam_source.services.steam_source_service import SteamSourceService
+from tg_bot_float_steam_source.steam_source_settings import SteamSourceSettings
+from tg_bot_float_steam_source.tests.fake_services import (
+    FakeFloatSourceService,
+    FakeSteamMarketSourceService,
+    get_listing,
+)
+
+# Three pages of two listings, sorted by price like the market returns them
+PAGES = [
+    [get_listing("1", 10), get_listing("2", 11)],
+    [get_listing("3", 12), get_listing("4", 13)],
+    [get_listing("5", 14), get_listing("6", 15)],
+]
+
+
+def get_service(
+    steam_settings: SteamSourceSettings,
+) -> Tuple[SteamSourceService, FakeSteamMarketSourceService, FakeFloatSourceService]:
+    market = FakeSteamMarketSourceService(PAGES)
+    floats = FakeFloatSourceService(
+        {listing.inspect_skin_link: 0.1 for page in PAGES for listing in page}
+    )
+    service = SteamSourceService(
+        steam_settings, market, floats  # type: ignore "Fakes of the market and float services"
+    )
+    return service, market, floats
+
+
+async def collect_stream(service: SteamSourceService, steam_params: SteamParams) -> List[float]:
+    return [
+        record.item.price
+        async for record in await service.stream_steam_items(steam_params)
+        if record.item is not None
+    ]
+
+
+@pytest.mark.asyncio
+async def test_limit_stops_scan(
+    steam_settings: SteamSourceSettings, steam_params: SteamParams
+) -> None:
+    service, market, _ = get_service(steam_settings)
+    steam_params.limit = 3
+
+    steam_items = await service.get_steam_items(steam_params)
+
+    assert [item.price for item in steam_items] == [10, 11, 12]
+    assert market.yielded_pages == 2
+
+
+@pytest.mark.asyncio
+async def test_max_price_stops_scan(
+    steam_settings: SteamSourceSettings, steam_params: SteamParams
+) -> None:
+    service, market, floats = get_service(steam_settings)
+    steam_params.max_price = 12
+
+    steam_items = await service.get_steam_items(steam_params)
+
+    assert [item.price for item in steam_items] == [10, 11, 12]
+    assert market.yielded_pages == 2
+    # The listing above the ceiling is dropped before its float is looked up
+    assert get_listing("4", 13).inspect_skin_link not in floats.requested
+
+
+@pytest.mark.asyncio
+async def test_stream_limit_stops_scan(
+    steam_settings: SteamSourceSettings, steam_params: SteamParams
+) -> None:
+    service, market, _ = get_service(steam_settings)
+    steam_params.limit = 3
+
+    prices = await collect_stream(service, steam_params)
+
+    assert sorted(prices) == [10, 11, 12]
+    assert market.yielded_pages == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_max_price_stops_scan(
+    steam_settings: SteamSourceSettings, steam_params: SteamParams
+) -> None:
+    service, market, _ = get_service(steam_settings)
+    steam_params.max_price = 12
+
+    prices = await collect_stream(service, steam_params)
+
+    assert sorted(prices) == [10, 11, 12]
+    assert market.yielded_pages == 2
+
+
+@pytest.mark.asyncio
+async def test_no_stop_scans_every_page(
+    steam_settings: SteamSourceSettings, steam_params: SteamParams
+) -> None:
+    service, market, _ = get_service(steam_settings)
+
+    steam_items = await service.get_steam_items(steam_params)
+
+    assert len(steam_items) == 6
+    assert market.yielded_pages == 3
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_failed_lookup_as_error_record(
+    steam_settings: SteamSourceSettings, steam_params: SteamParams
+) -> None:
+    service, _, floats = get_service(steam_settings)
+    floats.failing.add(get_listing("2", 11).inspect_skin_link)
+    steam_params.limit = 2
+
+    records = [record async for record in await service.stream_steam_items(steam_params)]
+
+    errors = [record for record in records if record.error is not None]
+    assert [record.buy_link for record in errors] == [get_listing("2", 11).buy_link]
+    assert errors[0].item is None
+    # The failed listing does not count towards the limit
+    assert sorted(record.item.price for record in records if record.item is not None) == [10, 12]
+
+
+@pytest.mark.asyncio
+async def test_list_leaves_failed_lookup_out(
+    steam_settings: SteamSourceSettings, steam_params: SteamParams
+) -> None:
+    service, _, floats = get_service(steam_settings)
+    floats.failing.add(get_listing("2", 11).inspect_skin_link)
+    steam_params.limit = 2
+
+    steam_items = await service.get_steam_items(steam_params)
+
+    assert [item.price for item in steam_items] == [10, 12]